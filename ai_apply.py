@@ -1,16 +1,36 @@
 #!/usr/bin/env python3
 """AI-powered job application assistant using Playwright."""
 
+import asyncio
 import json
 import re
 import time
 from pathlib import Path
-from playwright.sync_api import sync_playwright, Page
+from playwright.async_api import async_playwright, Page
+
+from common import load_filters
+from readiness import (
+    form_step_signature, wait_for_any_selector, wait_for_close, wait_for_form_step_change, wait_for_hidden,
+    wait_for_response, wait_for_url_contains,
+)
+from routing import install_resource_blocking, load_routing_policy, remove_resource_blocking
+from selector_stats import SelectorRegistry
+from session import open_linkedin_context
+from throttle import is_throttled, navigate, throttle_from_filters
 
 DATA_DIR = Path(__file__).parent
 CONFIG_FILE = DATA_DIR / "config"
 RESUME_DIR = DATA_DIR / "resumes"
 
+# Form controls that mark an Easy Apply step as rendered
+FORM_FIELD_SELECTORS = [
+    ".jobs-easy-apply-modal input",
+    ".jobs-easy-apply-modal select",
+    ".jobs-easy-apply-modal button[aria-label='Submit application']",
+    ".jobs-easy-apply-modal button[aria-label='Continue to next step']",
+    ".jobs-easy-apply-modal button[aria-label='Review your application']",
+]
+
 # Resume data - parsed from Kris_Shrestha_Resume.pdf
 RESUME_DATA = {
     "name": "Kris Shrestha",
@@ -48,8 +68,11 @@ def load_config() -> dict:
     return config
 
 
-def dismiss_cookie_modal(page: Page) -> bool:
-    """Dismiss cookie consent modal if present. Single attempt, no loops."""
+async def dismiss_cookie_modal(page: Page, registry: SelectorRegistry | None = None) -> bool:
+    """Dismiss cookie consent modal if present. Single attempt, no loops.
+
+    With a `registry`, the selector that worked last time is tried first.
+    """
     try:
         # Common cookie consent button selectors
         cookie_selectors = [
@@ -65,13 +88,19 @@ def dismiss_cookie_modal(page: Page) -> bool:
             "button[class*='accept'][class*='cookie']",
         ]
 
+        if registry:
+            cookie_selectors = registry.order("apply", "cookie", cookie_selectors)
+
         for selector in cookie_selectors:
             try:
-                btn = page.query_selector(selector)
-                if btn and btn.is_visible():
-                    btn.click()
+                btn = await page.query_selector(selector)
+                if btn and await btn.is_visible():
+                    await btn.click()
                     print(f"✓ Dismissed cookie modal via: {selector}")
-                    page.wait_for_timeout(1000)
+                    if registry:
+                        # Only hits are recorded: most pages simply have no banner
+                        registry.record("apply", "cookie", cookie_selectors, selector)
+                    await wait_for_hidden(page, selector, timeout=3000)
                     return True
             except:
                 continue
@@ -91,16 +120,16 @@ def dismiss_cookie_modal(page: Page) -> bool:
 
             for container_sel in cookie_containers:
                 try:
-                    container = page.query_selector(container_sel)
-                    if container and container.is_visible():
-                        buttons = container.query_selector_all("button")
+                    container = await page.query_selector(container_sel)
+                    if container and await container.is_visible():
+                        buttons = await container.query_selector_all("button")
                         for btn in buttons:
-                            if btn.is_visible():
-                                text = btn.inner_text().lower().strip()
+                            if await btn.is_visible():
+                                text = (await btn.inner_text()).lower().strip()
                                 if text in ['accept', 'accept all', 'accept cookies', 'agree', 'ok', 'i agree', 'got it', 'allow', 'allow all']:
-                                    btn.click()
+                                    await btn.click()
                                     print(f"✓ Dismissed cookie modal (clicked: {text})")
-                                    page.wait_for_timeout(1000)
+                                    await wait_for_hidden(page, container_sel, timeout=3000)
                                     return True
                 except:
                     continue
@@ -112,23 +141,24 @@ def dismiss_cookie_modal(page: Page) -> bool:
         return False
 
 
-def auto_login(page: Page, email: str, password: str) -> bool:
+async def auto_login(page: Page, email: str, password: str) -> bool:
     """Log in to LinkedIn."""
     try:
-        page.goto("https://www.linkedin.com/login", timeout=60000)
-        page.wait_for_timeout(3000)
+        await page.goto("https://www.linkedin.com/login", timeout=60000)
 
         # Dismiss cookie modal if present
-        dismiss_cookie_modal(page)
+        await dismiss_cookie_modal(page)
 
         if "/feed" in page.url or "/jobs" in page.url:
             return True
 
-        page.wait_for_selector('input[name="session_key"]', timeout=10000)
-        page.fill('input[name="session_key"]', email)
-        page.fill('input[name="session_password"]', password)
-        page.click('button[type="submit"]')
-        page.wait_for_timeout(5000)
+        await page.wait_for_selector('input[name="session_key"]', timeout=10000)
+        await page.fill('input[name="session_key"]', email)
+        await page.fill('input[name="session_password"]', password)
+        submitted = asyncio.ensure_future(wait_for_response(page, lambda r: "login-submit" in r.url, timeout=15000))
+        await page.click('button[type="submit"]')
+        await submitted
+        await wait_for_url_contains(page, ["/feed", "/jobs", "checkpoint", "challenge"], timeout=15000)
 
         return "/feed" in page.url or "/jobs" in page.url or "linkedin.com" in page.url
     except Exception as e:
@@ -136,50 +166,50 @@ def auto_login(page: Page, email: str, password: str) -> bool:
         return False
 
 
-def fill_field(page: Page, selectors: list, value: str) -> bool:
+async def fill_field(page: Page, selectors: list, value: str) -> bool:
     """Try to fill a field using multiple selectors."""
     for selector in selectors:
         try:
-            elements = page.query_selector_all(selector)
+            elements = await page.query_selector_all(selector)
             for el in elements:
-                if el.is_visible():
-                    el.fill(value)
+                if await el.is_visible():
+                    await el.fill(value)
                     return True
         except:
             continue
     return False
 
 
-def click_button(page: Page, selectors: list) -> bool:
+async def click_button(page: Page, selectors: list) -> bool:
     """Try to click a button using multiple selectors."""
     for selector in selectors:
         try:
-            elements = page.query_selector_all(selector)
+            elements = await page.query_selector_all(selector)
             for el in elements:
-                if el.is_visible():
-                    el.click()
+                if await el.is_visible():
+                    await el.click()
                     return True
         except:
             continue
     return False
 
 
-def select_option(page: Page, label_text: str, option_text: str) -> bool:
+async def select_option(page: Page, label_text: str, option_text: str) -> bool:
     """Try to select a dropdown option."""
     try:
         # Find select elements
-        selects = page.query_selector_all("select")
+        selects = await page.query_selector_all("select")
         for select in selects:
             # Check if label matches
-            parent = select.evaluate_handle("el => el.closest('.fb-dash-form-element, .jobs-easy-apply-form-section__grouping')")
+            parent = await select.evaluate_handle("el => el.closest('.fb-dash-form-element, .jobs-easy-apply-form-section__grouping')")
             if parent:
-                label = parent.query_selector("label, .fb-dash-form-element__label")
-                if label and label_text.lower() in label.inner_text().lower():
+                label = await parent.query_selector("label, .fb-dash-form-element__label")
+                if label and label_text.lower() in (await label.inner_text()).lower():
                     # Find matching option
-                    options = select.query_selector_all("option")
+                    options = await select.query_selector_all("option")
                     for opt in options:
-                        if option_text.lower() in opt.inner_text().lower():
-                            select.select_option(value=opt.get_attribute("value"))
+                        if option_text.lower() in (await opt.inner_text()).lower():
+                            await select.select_option(value=await opt.get_attribute("value"))
                             return True
     except:
         pass
@@ -231,27 +261,28 @@ def answer_question(page: Page, question_text: str) -> str:
     return ""
 
 
-def fill_easy_apply_form(page: Page, resume_data: dict) -> dict:
+async def fill_easy_apply_form(page: Page, resume_data: dict) -> dict:
     """Fill out LinkedIn Easy Apply form fields."""
     results = {"filled": [], "skipped": [], "errors": []}
 
-    page.wait_for_timeout(2000)
+    # Wait for the step's fields to render
+    await wait_for_any_selector(page, FORM_FIELD_SELECTORS, timeout=5000)
 
     # Fill text inputs
-    text_inputs = page.query_selector_all("input[type='text'], input[type='email'], input[type='tel']")
+    text_inputs = await page.query_selector_all("input[type='text'], input[type='email'], input[type='tel']")
     for inp in text_inputs:
         try:
-            if not inp.is_visible():
+            if not await inp.is_visible():
                 continue
 
             # Get label
             label = ""
-            label_el = inp.evaluate_handle("el => el.closest('.fb-dash-form-element, .jobs-easy-apply-form-section__grouping')?.querySelector('label')")
+            label_el = await inp.evaluate_handle("el => el.closest('.fb-dash-form-element, .jobs-easy-apply-form-section__grouping')?.querySelector('label')")
             if label_el:
-                label = label_el.inner_text().lower()
+                label = (await label_el.inner_text()).lower()
 
-            placeholder = (inp.get_attribute("placeholder") or "").lower()
-            name = (inp.get_attribute("name") or "").lower()
+            placeholder = (await inp.get_attribute("placeholder") or "").lower()
+            name = (await inp.get_attribute("name") or "").lower()
 
             value = ""
             field_name = label or placeholder or name
@@ -269,59 +300,59 @@ def fill_easy_apply_form(page: Page, resume_data: dict) -> dict:
             elif "name" in field_name and "last" in field_name:
                 value = resume_data.get("name", "").split()[-1]
 
-            if value and not inp.input_value():
-                inp.fill(value)
+            if value and not await inp.input_value():
+                await inp.fill(value)
                 results["filled"].append(field_name)
         except Exception as e:
             results["errors"].append(str(e))
 
     # Handle radio buttons and checkboxes
-    radios = page.query_selector_all("input[type='radio']")
+    radios = await page.query_selector_all("input[type='radio']")
     for radio in radios:
         try:
-            if not radio.is_visible():
+            if not await radio.is_visible():
                 continue
 
             # Get the question/label
-            parent = radio.evaluate_handle("el => el.closest('.fb-dash-form-element, .jobs-easy-apply-form-section__grouping')")
+            parent = await radio.evaluate_handle("el => el.closest('.fb-dash-form-element, .jobs-easy-apply-form-section__grouping')")
             if parent:
-                question_el = parent.query_selector("legend, .fb-dash-form-element__label, span[aria-hidden='true']")
+                question_el = await parent.query_selector("legend, .fb-dash-form-element__label, span[aria-hidden='true']")
                 if question_el:
-                    question = question_el.inner_text()
+                    question = await question_el.inner_text()
                     answer = answer_question(page, question)
 
                     if answer:
                         # Find the radio with matching value
-                        label = radio.evaluate_handle("el => el.closest('label') || el.nextElementSibling")
+                        label = await radio.evaluate_handle("el => el.closest('label') || el.nextElementSibling")
                         if label:
-                            label_text = label.inner_text().lower()
+                            label_text = (await label.inner_text()).lower()
                             if answer.lower() in label_text or label_text in answer.lower():
-                                if not radio.is_checked():
-                                    radio.click()
+                                if not await radio.is_checked():
+                                    await radio.click()
                                     results["filled"].append(f"Radio: {question}")
         except Exception as e:
             results["errors"].append(str(e))
 
     # Handle dropdowns
-    selects = page.query_selector_all("select")
+    selects = await page.query_selector_all("select")
     for select in selects:
         try:
-            if not select.is_visible():
+            if not await select.is_visible():
                 continue
 
-            parent = select.evaluate_handle("el => el.closest('.fb-dash-form-element, .jobs-easy-apply-form-section__grouping')")
+            parent = await select.evaluate_handle("el => el.closest('.fb-dash-form-element, .jobs-easy-apply-form-section__grouping')")
             if parent:
-                label_el = parent.query_selector("label, .fb-dash-form-element__label")
+                label_el = await parent.query_selector("label, .fb-dash-form-element__label")
                 if label_el:
-                    label = label_el.inner_text()
+                    label = await label_el.inner_text()
                     answer = answer_question(page, label)
 
                     if answer:
-                        options = select.query_selector_all("option")
+                        options = await select.query_selector_all("option")
                         for opt in options:
-                            opt_text = opt.inner_text().lower()
+                            opt_text = (await opt.inner_text()).lower()
                             if answer.lower() in opt_text or opt_text in answer.lower():
-                                select.select_option(value=opt.get_attribute("value"))
+                                await select.select_option(value=await opt.get_attribute("value"))
                                 results["filled"].append(f"Select: {label}")
                                 break
         except Exception as e:
@@ -331,6 +362,23 @@ def fill_easy_apply_form(page: Page, resume_data: dict) -> dict:
 
 
 def apply_to_job(job_url: str, headless: bool = False) -> dict:
+    """Apply to a job using AI-assisted form filling."""
+    return asyncio.run(apply_to_job_async(job_url, headless))
+
+
+async def hand_over(page: Page):
+    """Let the user finish in the browser, with images, fonts and media loading again.
+
+    CAPTCHAs and form UI need them; blocking only ever served the automated steps.
+    """
+    try:
+        await remove_resource_blocking(page.context)
+    except Exception:
+        pass
+    await wait_for_close(page)
+
+
+async def apply_to_job_async(job_url: str, headless: bool = False) -> dict:
     """Apply to a job using AI-assisted form filling."""
     result = {
         "success": False,
@@ -349,38 +397,30 @@ def apply_to_job(job_url: str, headless: bool = False) -> dict:
     resume_data = RESUME_DATA.copy()
     resume_data["email"] = config.get("linkedin_email", "")
 
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(headless=headless)
-        context = browser.new_context(
+    async with async_playwright() as playwright:
+        browser = await playwright.chromium.launch(headless=headless)
+
+        # Login (skipped when the scraper's saved session is still valid)
+        print("Logging in to LinkedIn...")
+        context = await open_linkedin_context(
+            browser, config["linkedin_email"], config["linkedin_password"], auto_login,
             viewport={"width": 1280, "height": 900},
             user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
         )
-        page = context.new_page()
+        if not context:
+            result["message"] = "Login failed"
+            await browser.close()
+            return result
+        filters = load_filters()
+        routing_stats = await install_resource_blocking(context, *load_routing_policy(filters))
+        throttle = throttle_from_filters(filters, 1)
+        registry = SelectorRegistry()
+        page = await context.new_page()
 
         try:
-            # Login
-            print("Logging in to LinkedIn...")
-            if not auto_login(page, config["linkedin_email"], config["linkedin_password"]):
-                result["message"] = "Login failed"
-                browser.close()
-                return result
             result["steps_completed"].append("Logged in")
             print("✓ Logged in")
 
-            # Navigate to job
-            print(f"Navigating to job: {job_url}")
-            page.goto(job_url, timeout=60000)
-            page.wait_for_timeout(3000)
-
-            # Try to dismiss cookie modal if it appears on job page
-            if dismiss_cookie_modal(page):
-                result["steps_completed"].append("Dismissed cookie modal")
-
-            result["steps_completed"].append("Opened job page")
-
-            # Check if this is an Easy Apply job or external application
-            page.wait_for_timeout(2000)
-
             # Click Easy Apply button
             easy_apply_selectors = [
                 "button.jobs-apply-button",
@@ -388,13 +428,30 @@ def apply_to_job(job_url: str, headless: bool = False) -> dict:
                 "button:has-text('Easy Apply')",
                 ".jobs-apply-button--top-card"
             ]
+            apply_selectors = ["button:has-text('Apply')", "a:has-text('Apply')"]
+
+            # Navigate to job and wait until an apply control has rendered
+            print(f"Navigating to job: {job_url}")
+            response = await navigate(page, job_url, throttle)
+            if is_throttled(response.status if response else None, page.url):
+                result["errors"].append("LinkedIn is rate-limiting or challenging this session; try again later")
+            await wait_for_any_selector(page, easy_apply_selectors + apply_selectors, timeout=10000, state="visible")
+
+            # Try to dismiss cookie modal if it appears on job page
+            if await dismiss_cookie_modal(page, registry):
+                result["steps_completed"].append("Dismissed cookie modal")
 
+            result["steps_completed"].append("Opened job page")
+
+            # Check if this is an Easy Apply job or external application
             apply_clicked = False
+            easy_apply_selectors = registry.order("linkedin", "easy_apply", easy_apply_selectors)
             for selector in easy_apply_selectors:
                 try:
-                    btn = page.query_selector(selector)
-                    if btn and btn.is_visible():
-                        btn.click()
+                    btn = await page.query_selector(selector)
+                    if btn and await btn.is_visible():
+                        await btn.click()
+                        registry.record("linkedin", "easy_apply", easy_apply_selectors, selector)
                         apply_clicked = True
                         break
                 except:
@@ -402,13 +459,15 @@ def apply_to_job(job_url: str, headless: bool = False) -> dict:
 
             if not apply_clicked:
                 # No Easy Apply - check if we're on an external site or if there's an Apply button
-                apply_btn = page.query_selector("button:has-text('Apply'), a:has-text('Apply')")
-                if apply_btn and apply_btn.is_visible():
-                    apply_btn.click()
+                apply_btn = await page.query_selector(", ".join(apply_selectors))
+                if apply_btn and await apply_btn.is_visible():
+                    # External application sites load in full; the user completes them by hand
+                    await remove_resource_blocking(context)
+                    await apply_btn.click()
                     result["steps_completed"].append("Clicked Apply button")
-                    page.wait_for_timeout(3000)
+                    await wait_for_any_selector(page, ["form", "input", "button"], timeout=5000, state="visible")
                     # Try to dismiss any cookie modals on external site
-                    dismiss_cookie_modal(page)
+                    await dismiss_cookie_modal(page, registry)
 
                 result["message"] = "No Easy Apply - browser open for manual application"
                 result["success"] = True
@@ -422,29 +481,21 @@ def apply_to_job(job_url: str, headless: bool = False) -> dict:
                 print("="*50 + "\n")
 
                 # Keep browser open for manual completion
-                try:
-                    while True:
-                        page.wait_for_timeout(2000)
-                        try:
-                            page.title()
-                        except:
-                            break
-                except:
-                    pass
+                await hand_over(page)
 
                 try:
-                    browser.close()
+                    await browser.close()
                 except:
                     pass
+                registry.save()
                 return result
 
             result["steps_completed"].append("Clicked Easy Apply")
             print("✓ Clicked Easy Apply")
-            page.wait_for_timeout(2000)
+            await wait_for_any_selector(page, [".jobs-easy-apply-modal", "[role='dialog']"], timeout=5000, state="visible")
 
             # Dismiss any cookie modal that appears on external application page
-            dismiss_cookie_modal(page)
-            page.wait_for_timeout(1000)
+            await dismiss_cookie_modal(page, registry)
 
             # Fill forms until we reach submit or hit an issue
             max_steps = 10
@@ -452,14 +503,12 @@ def apply_to_job(job_url: str, headless: bool = False) -> dict:
                 print(f"Processing step {step + 1}...")
 
                 # Fill form fields
-                fill_results = fill_easy_apply_form(page, resume_data)
+                fill_results = await fill_easy_apply_form(page, resume_data)
                 result["steps_completed"].extend([f"Filled: {f}" for f in fill_results["filled"]])
 
-                page.wait_for_timeout(1000)
-
                 # Check for submit button
-                submit_btn = page.query_selector("button[aria-label='Submit application']")
-                if submit_btn and submit_btn.is_visible():
+                submit_btn = await page.query_selector("button[aria-label='Submit application']")
+                if submit_btn and await submit_btn.is_visible():
                     print("\n" + "="*50)
                     print("🛑 STOPPING FOR HUMAN REVIEW")
                     print("="*50)
@@ -477,70 +526,56 @@ def apply_to_job(job_url: str, headless: bool = False) -> dict:
 
                     # Take screenshot for review
                     screenshot_path = DATA_DIR / "application_preview.png"
-                    page.screenshot(path=str(screenshot_path))
+                    await page.screenshot(path=str(screenshot_path))
                     result["screenshot"] = str(screenshot_path)
 
                     # NEVER auto-submit - always require human review
                     # Keep browser open for manual review and submission
                     # Wait for user to close browser or submit
                     print("Browser will stay open. Close it when done reviewing/submitting.")
-                    try:
-                        # Wait until browser is closed by user
-                        while True:
-                            page.wait_for_timeout(2000)
-                            # Check if page is still valid
-                            try:
-                                page.title()
-                            except:
-                                break
-                    except:
-                        pass
+                    await hand_over(page)
                     break
 
+                step_before = await form_step_signature(page)
+
                 # Check for Next button
-                next_btn = page.query_selector("button[aria-label='Continue to next step']")
-                if next_btn and next_btn.is_visible():
-                    next_btn.click()
+                next_btn = await page.query_selector("button[aria-label='Continue to next step']")
+                if next_btn and await next_btn.is_visible():
+                    await next_btn.click()
                     result["steps_completed"].append(f"Step {step + 1} completed")
                     print(f"✓ Step {step + 1} completed")
-                    page.wait_for_timeout(2000)
+                    await wait_for_form_step_change(page, step_before, timeout=5000)
                     continue
 
                 # Check for Review button
-                review_btn = page.query_selector("button[aria-label='Review your application']")
-                if review_btn and review_btn.is_visible():
-                    review_btn.click()
+                review_btn = await page.query_selector("button[aria-label='Review your application']")
+                if review_btn and await review_btn.is_visible():
+                    await review_btn.click()
                     result["steps_completed"].append("Reached review page")
                     print("✓ Reached review page")
-                    page.wait_for_timeout(2000)
+                    await wait_for_form_step_change(page, step_before, timeout=5000)
                     continue
 
-                # No recognized button found
-                page.wait_for_timeout(1000)
+                # No recognized button found - give a slow step a chance to render
+                await wait_for_form_step_change(page, step_before, timeout=3000)
 
             # Keep browser open for manual completion if not headless
             if not headless and not result["success"]:
                 print("\nBrowser left open for manual completion. Close browser when done.")
                 result["message"] = "Browser open for manual completion - close when done"
-                try:
-                    while True:
-                        page.wait_for_timeout(2000)
-                        try:
-                            page.title()
-                        except:
-                            break
-                except:
-                    pass
+                await hand_over(page)
 
         except Exception as e:
             result["errors"].append(str(e))
             result["message"] = f"Error: {str(e)}"
 
         try:
-            browser.close()
+            await browser.close()
         except:
             pass  # Browser may already be closed
 
+    print(routing_stats.summary())
+    registry.save()
     return result
 
 
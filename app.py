@@ -8,20 +8,13 @@ from pathlib import Path
 
 import streamlit as st
 
-DATA_DIR = Path(__file__).parent
-SEEN_JOBS_FILE = DATA_DIR / "seen_jobs.json"
-FILTERS_FILE = DATA_DIR / "filters.json"
-PYTHON_PATH = Path.home() / ".pyenv/versions/3.11.5/envs/li/bin/python"
-SCRAPER_PATH = DATA_DIR / "scraper.py"
-INDEED_SCRAPER_PATH = DATA_DIR / "indeed_scraper.py"
-
-DEFAULT_FILTERS = {
-    "location_keywords": ["remote", "work from home", "wfh", "anywhere", "atlanta", "atl", ", ga", "georgia"],
-    "exclude_keywords": ["contractor", "contract", "freelance", "consultant", "hourly", "/hr", "per hour", "$/hour", "c2c", "corp to corp", "1099", "w2 contract", "temp", "temporary"],
-    "search_queries": ["data science director", "data science VP", "VP data science", "director of data science", "head of data science", "AI director", "ML director", "director machine learning"],
-    "time_filter": "Past week"
-}
+from common import DATA_DIR, DEFAULT_FILTERS, FILTERS_FILE, SEEN_JOBS_FILE
+from matching import compile_filters
+from salary import salary_passes
+from search_urls import LINKEDIN_EXPERIENCE_LEVELS, LINKEDIN_JOB_TYPES, LINKEDIN_WORK_TYPES
 
+PYTHON_PATH = Path.home() / ".pyenv/versions/3.11.5/envs/li/bin/python"
+RUNNER_PATH = DATA_DIR / "runner.py"
 
 def load_jobs() -> dict:
     """Load jobs from seen_jobs.json."""
@@ -58,24 +51,13 @@ def save_filters(filters: dict):
     FILTERS_FILE.write_text(json.dumps(filters, indent=2))
 
 
-def run_scraper():
-    """Run the LinkedIn scraper script and return output."""
-    result = subprocess.run(
-        [str(PYTHON_PATH), str(SCRAPER_PATH)],
-        capture_output=True,
-        text=True,
-        timeout=300
-    )
-    return result.stdout + result.stderr
-
-
-def run_indeed_scraper():
-    """Run the Indeed scraper script and return output."""
+def run_scrapers():
+    """Run every enabled source in one runner process and return output."""
     result = subprocess.run(
-        [str(PYTHON_PATH), str(INDEED_SCRAPER_PATH)],
+        [str(PYTHON_PATH), str(RUNNER_PATH)],
         capture_output=True,
         text=True,
-        timeout=300
+        timeout=600
     )
     return result.stdout + result.stderr
 
@@ -96,30 +78,16 @@ filters = load_filters()
 with st.sidebar:
     st.header("🔄 Run Scrapers")
 
-    col1, col2 = st.columns(2)
-    with col1:
-        if st.button("🔗 LinkedIn", type="primary", use_container_width=True):
-            with st.spinner("Scraping LinkedIn..."):
-                try:
-                    output = run_scraper()
-                    st.success("LinkedIn done!")
-                    st.session_state["scraper_output"] = output
-                except subprocess.TimeoutExpired:
-                    st.error("Timed out after 5 min.")
-                except Exception as e:
-                    st.error(f"Error: {e}")
-
-    with col2:
-        if st.button("🔍 Indeed", type="secondary", use_container_width=True):
-            with st.spinner("Scraping Indeed..."):
-                try:
-                    output = run_indeed_scraper()
-                    st.success("Indeed done!")
-                    st.session_state["indeed_output"] = output
-                except subprocess.TimeoutExpired:
-                    st.error("Timed out after 5 min.")
-                except Exception as e:
-                    st.error(f"Error: {e}")
+    if st.button("🔄 Run All Sources", type="primary", use_container_width=True):
+        with st.spinner("Scraping LinkedIn and Indeed..."):
+            try:
+                output = run_scrapers()
+                st.success("Done!")
+                st.session_state["scraper_output"] = output
+            except subprocess.TimeoutExpired:
+                st.error("Timed out after 10 min.")
+            except Exception as e:
+                st.error(f"Error: {e}")
 
     # Show last run info
     if SEEN_JOBS_FILE.exists():
@@ -179,12 +147,71 @@ with st.sidebar:
         index=time_options.index(current_time)
     )
 
-    # Check if filters changed
+    new_concurrency = st.number_input(
+        "⚡ Parallel searches",
+        min_value=1,
+        max_value=8,
+        value=int(filters.get("max_concurrent_searches", 3)),
+        help="How many searches each source runs at once in separate tabs"
+    )
+
+    new_min_salary = st.number_input(
+        "💵 Minimum salary (yearly)",
+        min_value=0,
+        step=10000,
+        value=int(filters.get("min_salary", 0)),
+        help="Drop jobs whose stated pay tops out below this; 0 turns it off. Jobs without a stated salary are kept"
+    )
+    new_exclude_hourly = st.checkbox(
+        "Drop hourly-paid jobs",
+        value=bool(filters.get("exclude_hourly_pay", True))
+    )
+
+    # Sent to the job boards with each search; leaving one empty searches everything
+    with st.expander("🎯 Search Filters (applied by the job boards)", expanded=False):
+        new_work_types = st.multiselect(
+            "Work types",
+            list(LINKEDIN_WORK_TYPES),
+            default=[v for v in filters.get("work_types", []) if v in LINKEDIN_WORK_TYPES]
+        )
+        new_job_types = st.multiselect(
+            "Job types",
+            list(LINKEDIN_JOB_TYPES),
+            default=[v for v in filters.get("job_types", []) if v in LINKEDIN_JOB_TYPES]
+        )
+        new_experience_levels = st.multiselect(
+            "Experience levels (LinkedIn)",
+            list(LINKEDIN_EXPERIENCE_LEVELS),
+            default=[v for v in filters.get("experience_levels", []) if v in LINKEDIN_EXPERIENCE_LEVELS]
+        )
+        new_geo_id = st.text_input(
+            "LinkedIn geoId",
+            value=str(filters.get("linkedin_geo_id", "")),
+            help="Numeric region id from a LinkedIn search URL, e.g. 103644278 for the United States"
+        )
+        new_radius = st.number_input(
+            "Indeed radius (miles)",
+            min_value=0,
+            max_value=100,
+            value=int(filters.get("indeed_radius", 0)),
+            help="Distance around each Indeed location; 0 uses Indeed's default"
+        )
+
+    # Check if filters changed (keep any settings not edited here)
     new_filters = {
+        **filters,
         "location_keywords": new_location,
         "exclude_keywords": new_exclude,
         "search_queries": new_queries,
-        "time_filter": new_time_filter
+        "time_filter": new_time_filter,
+        "max_concurrent_searches": int(new_concurrency),
+        "min_salary": int(new_min_salary),
+        "exclude_hourly_pay": new_exclude_hourly,
+        "work_types": new_work_types,
+        "job_types": new_job_types,
+        "experience_levels": new_experience_levels,
+        "linkedin_geo_id": new_geo_id.strip(),
+        "indeed_radius": int(new_radius),
     }
 
     if new_filters != filters:
@@ -261,6 +288,21 @@ else:
         ignored_count = sum(1 for j in jobs.values() if j.get("ignored", False))
         st.metric("Ignored", ignored_count)
 
+    current_only = st.checkbox(
+        "Only jobs passing the current filters",
+        value=False,
+        help="Re-check saved jobs against the exclude keywords and salary settings, e.g. after tightening them. "
+             "Saved jobs keep no description, so keywords are matched against the title only"
+    )
+    passing_ids = None
+    if current_only:
+        min_salary = float(filters.get("min_salary", DEFAULT_FILTERS["min_salary"]) or 0)
+        exclude_hourly = filters.get("exclude_hourly_pay", DEFAULT_FILTERS["exclude_hourly_pay"])
+        passing_ids = {
+            job_id for job_id, job in compile_filters(filters).filter_excluded(jobs, fields=("title",)).items()
+            if salary_passes(job.get("salary"), min_salary, exclude_hourly)
+        }
+
     st.divider()
 
     # Track changes
@@ -286,6 +328,8 @@ else:
             continue
         elif show_filter == "Ignored" and not ignored:
             continue
+        if passing_ids is not None and job_id not in passing_ids:
+            continue
 
         filtered_jobs.append((job_id, job))
 
@@ -357,9 +401,14 @@ else:
                     elif ignored:
                         status = " ❌"
                     source = job.get("source", "linkedin")
-                    source_icon = "🔗" if source == "linkedin" else "🔍"
+                    sources = job.get("sources") or {source: url}
+                    source_links = " · ".join(
+                        f"{'🔗' if name == 'linkedin' else '🔍'} [{name.title()}]({link})" if link
+                        else f"{'🔗' if name == 'linkedin' else '🔍'} {name.title()}"
+                        for name, link in sources.items()
+                    )
                     st.markdown(f"**[{title}]({url})** at **{company}**{status}")
-                    st.caption(f"{source_icon} {source.title()} | 📍 {location} | 🕐 {date_str}")
+                    st.caption(f"{source_links} | 📍 {location} | 🕐 {date_str}")
                 with btn_col:
                     if st.button("🤖 Apply", key=f"ai_apply_{job_id}"):
                         st.session_state["ai_apply_job"] = {"id": job_id, "url": url, "title": title, "company": company}
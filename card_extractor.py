@@ -0,0 +1,114 @@
+"""Batched job card extraction - one page.evaluate per results page"""
+
+from collections import Counter
+from playwright.async_api import Page
+
+from selector_stats import SelectorRegistry
+
+# Runs in the browser. Selector fallback lists arrive as data, so the cost is a
+# single round trip no matter how many cards or selectors there are.
+#
+# Field spec keys:
+#   selectors   - tried in order; "" means the card element itself
+#   attribute   - read this attribute (or the first non-empty of a list) instead of the element text
+#   text_fallback - with attribute, use the text when the attribute is empty
+#   skip        - lowercase values to ignore (e.g. Indeed's "new" badge)
+#   min_length  - ignore shorter values (keeps the last one if none is long enough)
+#   max_length  - truncate the value
+#   require_any - lowercase substrings of which at least one must appear
+EXTRACT_CARDS_JS = """
+({cardSelectors, fields, limit}) => {
+    let cards = [];
+    let cardSelector = null;
+    for (const sel of cardSelectors) {
+        cards = Array.from(document.querySelectorAll(sel));
+        if (cards.length) {
+            cardSelector = sel;
+            break;
+        }
+    }
+
+    const read = (el, spec) => {
+        let value = '';
+        for (const attr of [].concat(spec.attribute || [])) {
+            value = value || el.getAttribute(attr) || '';
+        }
+        if (!value && (!spec.attribute || spec.text_fallback)) value = el.innerText || '';
+        return value.trim();
+    };
+
+    const pick = (card, spec) => {
+        let fallback = null;
+        for (const sel of spec.selectors) {
+            let el = null;
+            try {
+                el = sel === '' ? card : card.querySelector(sel);
+            } catch (e) {
+                continue;  // invalid selector for this browser
+            }
+            if (!el) continue;
+            let value = read(el, spec);
+            const lower = value.toLowerCase();
+            if (!value || (spec.skip || []).includes(lower)) continue;
+            if (spec.require_any && !spec.require_any.some(s => lower.includes(s))) continue;
+            if (spec.max_length) value = value.slice(0, spec.max_length);
+            if (spec.min_length && value.length <= spec.min_length) {
+                fallback = [value, sel];
+                continue;
+            }
+            return [value, sel];
+        }
+        return fallback || ['', null];
+    };
+
+    return {
+        cardSelector,
+        total: cards.length,
+        cards: cards.slice(0, limit).map((card, index) => {
+            const out = {index, matched: {}};
+            for (const [name, spec] of Object.entries(fields)) {
+                const [value, sel] = pick(card, spec);
+                out[name] = value;
+                out.matched[name] = sel;
+            }
+            return out;
+        }),
+    };
+}
+"""
+
+
+async def extract_cards(page: Page, card_selectors: list, fields: dict, limit: int = 10,
+                        registry: SelectorRegistry | None = None, site: str = "") -> tuple[list[dict], str | None]:
+    """Extract every card's fields in one evaluate call.
+
+    Returns (cards, card_selector). Each card dict has one key per field, its
+    position in the result list as "index", and the selector that supplied each
+    field under "matched".
+
+    With a `registry`, each selector list is reordered to try the last
+    successful selector first, and the page's outcome is recorded under `site`
+    (group "job_cards" for the card list, the field name for each field).
+    """
+    if registry:
+        card_selectors = registry.order(site, "job_cards", card_selectors)
+        fields = {name: {**spec, "selectors": registry.order(site, name, spec["selectors"])}
+                  for name, spec in fields.items()}
+
+    result = await page.evaluate(EXTRACT_CARDS_JS, {
+        "cardSelectors": card_selectors,
+        "fields": fields,
+        "limit": limit,
+    })
+    cards, card_selector = result["cards"], result["cardSelector"]
+
+    if registry:
+        registry.record(site, "job_cards", card_selectors, card_selector)
+        if cards:
+            # One lookup per field per page: the selector most cards matched, or a miss if none did
+            for name, spec in fields.items():
+                matched = Counter(card["matched"][name] for card in cards if card["matched"][name] is not None)
+                hit = matched.most_common(1)[0][0] if matched else None
+                registry.record(site, name, spec["selectors"], hit)
+
+    return cards, card_selector
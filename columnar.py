@@ -0,0 +1,72 @@
+"""Columnar job batches - keyword filters over a whole batch at once, as boolean masks
+
+Uses pyarrow when it is installed (see requirements.txt); without it, callers
+stay on the per-job token filters in matching.py, which give the same results.
+"""
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+except ImportError:
+    pa = pc = None
+
+# Batches at least this large are filtered column-wise; for smaller ones, building
+# the arrays costs more than tokenizing each job
+COLUMNAR_THRESHOLD = 500
+
+
+def use_columnar(count: int) -> bool:
+    """Whether a batch of `count` jobs should go through JobColumns."""
+    return pa is not None and count >= COLUMNAR_THRESHOLD
+
+
+def all_of(*masks):
+    """Element-wise AND of boolean masks."""
+    result = masks[0]
+    for mask in masks[1:]:
+        result = pc.and_(result, mask)
+    return result
+
+
+def any_of(*masks):
+    """Element-wise OR of boolean masks."""
+    result = masks[0]
+    for mask in masks[1:]:
+        result = pc.or_(result, mask)
+    return result
+
+
+class JobColumns:
+    """A {job_id: job} batch as lowercased Arrow string columns, each built on first use.
+
+    matches() runs a KeywordMatcher.regex over whole columns in Arrow's native
+    regex engine (RE2) and returns a boolean mask in job order; select() turns
+    masks back into a {job_id: job} dict.
+    """
+
+    def __init__(self, jobs: dict):
+        self.jobs = jobs
+        self.ids = list(jobs)
+        self._columns = {}
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def column(self, field: str):
+        if field not in self._columns:
+            values = [self.jobs[job_id].get(field) or "" for job_id in self.ids]
+            self._columns[field] = pc.utf8_lower(pa.array(values, pa.string()))
+        return self._columns[field]
+
+    def matches(self, pattern: str, *fields: str):
+        """Mask of jobs where the pattern matches any of the fields; all False for an empty pattern."""
+        if not pattern:
+            return pa.array([False] * len(self), pa.bool_())
+        return any_of(*(pc.match_substring_regex(self.column(field), pattern) for field in fields))
+
+    def select(self, include=None, exclude=None) -> dict:
+        """The jobs where `include` is true (default: all) and `exclude` is not."""
+        keep = include if include is not None else pa.array([True] * len(self), pa.bool_())
+        if exclude is not None:
+            keep = pc.and_(keep, pc.invert(exclude))
+        return {job_id: self.jobs[job_id] for job_id, kept in zip(self.ids, keep.to_pylist()) if kept}
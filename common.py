@@ -0,0 +1,198 @@
+"""Shared settings, storage and filters for every job source"""
+
+import json
+import smtplib
+from datetime import datetime
+from pathlib import Path
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+
+# Directories
+DATA_DIR = Path(__file__).parent
+SEEN_JOBS_FILE = DATA_DIR / "seen_jobs.json"
+CONFIG_FILE = DATA_DIR / "config"
+FILTERS_FILE = DATA_DIR / "filters.json"
+
+# Default filters (used if filters.json doesn't exist)
+DEFAULT_FILTERS = {
+    "location_keywords": ["remote", "remotely", "work from home", "wfh", "anywhere", "atlanta", "atl", ", ga", "georgia"],
+    "exclude_keywords": ["contractor", "contract", "freelance", "consultant", "hourly", "/hr", "per hour", "$/hour", "c2c", "corp to corp", "1099", "w2 contract", "temp", "temporary"],
+    "search_queries": ["data science director", "data science VP", "VP data science", "director of data science", "head of data science", "AI director", "ML director", "director machine learning"],
+    "time_filter": "Past week",
+    "incremental_search": True,
+    "incremental_margin_minutes": 60,
+    "sources": ["linkedin", "indeed"],
+    "min_salary": 0,
+    "exclude_hourly_pay": True,
+    "work_types": [],
+    "job_types": [],
+    "experience_levels": [],
+    "linkedin_geo_id": "",
+    "max_concurrent_searches": 3,
+    "max_pages": 3,
+    "min_request_interval_seconds": 1.0,
+    "max_requests_per_second": 4.0,
+    "linkedin_source": "browser",
+    "linkedin_capture": "network",
+    "guest_concurrency": 4,
+    "indeed_locations": ["Remote", "Atlanta, GA"],
+    "indeed_radius": 0,
+    "indeed_fetch_details": False,
+    "indeed_detail_concurrency": 4,
+    "indeed_detail_timeout_seconds": 20
+}
+
+
+def load_filters() -> dict:
+    """Load filters from filters.json."""
+    if FILTERS_FILE.exists():
+        try:
+            return json.loads(FILTERS_FILE.read_text())
+        except json.JSONDecodeError:
+            pass
+    return DEFAULT_FILTERS
+
+
+def load_config() -> dict:
+    """Load configuration from config file."""
+    config = {}
+    if CONFIG_FILE.exists():
+        lines = CONFIG_FILE.read_text().strip().split("\n")
+        if len(lines) >= 4:
+            config["linkedin_email"] = lines[0].strip()
+            config["linkedin_password"] = lines[1].strip()
+            config["gmail_address"] = lines[2].strip()
+            config["gmail_app_password"] = lines[3].strip()
+    return config
+
+
+def load_seen_jobs() -> tuple[set, dict]:
+    """Load set of previously seen job IDs and their details."""
+    if SEEN_JOBS_FILE.exists():
+        data = json.loads(SEEN_JOBS_FILE.read_text())
+        # Support both old format (just IDs) and new format (with details)
+        if "jobs" in data:
+            return set(data["jobs"].keys()), data["jobs"]
+        else:
+            # Migrate from old format
+            return set(data.get("job_ids", [])), {}
+    return set(), {}
+
+
+def save_seen_jobs(jobs_dict: dict):
+    """Save seen jobs with their details to file."""
+    SEEN_JOBS_FILE.write_text(json.dumps({
+        "jobs": jobs_dict,
+        "last_updated": datetime.now().isoformat()
+    }, indent=2))
+
+
+def send_email(config: dict, new_jobs: list[dict]):
+    """Send email notification about new jobs."""
+    if not new_jobs:
+        return
+
+    gmail = config.get("gmail_address")
+    app_password = config.get("gmail_app_password")
+
+    if not gmail or not app_password:
+        print("Email not configured. Skipping notification.")
+        return
+
+    # Build email content
+    subject = f"🎯 {len(new_jobs)} New Data Science Leadership Jobs Found"
+
+    # Create local HTML file that opens all jobs in tabs
+    job_urls = [job.get('url', '') for job in new_jobs if job.get('url')]
+    job_items = []
+    for job in new_jobs:
+        url = job.get('url', '')
+        title = job.get('title', 'Unknown')
+        company = job.get('company', 'Unknown')
+        if url:
+            job_items.append(f'<li style="margin: 10px 0;"><a href="{url}" target="_blank" style="font-size: 16px;">{title}</a> - {company}</li>')
+
+    open_all_html = f"""<!DOCTYPE html>
+<html>
+<head>
+    <title>Open All Jobs</title>
+    <style>
+        body {{ font-family: Arial, sans-serif; max-width: 800px; margin: 40px auto; padding: 20px; }}
+        .open-all {{ background: #0066cc; color: white; padding: 15px 30px; font-size: 18px; border: none; border-radius: 5px; cursor: pointer; margin: 20px 0; }}
+        .open-all:hover {{ background: #0052a3; }}
+        ul {{ list-style: none; padding: 0; }}
+    </style>
+</head>
+<body>
+<h1>{len(job_urls)} New Jobs Found</h1>
+<button class="open-all" onclick="openAll()">Click Here to Open All {len(job_urls)} Jobs in New Tabs</button>
+<p style="color: #666;">If pop-ups are blocked, allow pop-ups for this page and click again, or click each link below:</p>
+<ul>
+{"".join(job_items)}
+</ul>
+<script>
+var urls = {json.dumps(job_urls)};
+function openAll() {{
+    urls.forEach(function(u) {{ window.open(u, '_blank'); }});
+}}
+</script>
+</body>
+</html>"""
+
+    open_all_file = DATA_DIR / "open_all_jobs.html"
+    open_all_file.write_text(open_all_html)
+
+    html_content = f"""
+    <html>
+    <body style="font-family: Arial, sans-serif; max-width: 600px;">
+    <h2>New Job Postings Found</h2>
+    <p>The following jobs were posted in the last 24 hours:</p>
+    <p style="margin: 15px 0; padding: 10px; background: #f0f0f0; border-radius: 5px;">
+        <strong>Open all jobs at once:</strong> Run <code>open ~/Code/linkedin_scrape/open_all_jobs.html</code> in Terminal
+    </p>
+    """
+
+    for job in new_jobs:
+        html_content += f"""
+        <div style="border: 1px solid #ddd; padding: 15px; margin: 10px 0; border-radius: 8px;">
+            <h3 style="margin: 0 0 5px 0;">
+                <a href="{job.get('url', '#')}" style="color: #0066cc;">{job.get('title', 'Unknown')}</a>
+            </h3>
+            <p style="margin: 5px 0; color: #666;">
+                <strong>{job.get('company', 'Unknown')}</strong> • {job.get('location', 'Unknown')}
+            </p>
+            <p style="margin: 10px 0; font-size: 14px; color: #444;">
+                {job.get('description', '')[:300]}...
+            </p>
+        </div>
+        """
+
+    html_content += """
+    <p style="color: #888; font-size: 12px; margin-top: 20px;">
+        Sent by LinkedIn Job Scraper
+    </p>
+    </body>
+    </html>
+    """
+
+    # Plain text version
+    text_content = f"Found {len(new_jobs)} new jobs:\n\n"
+    for job in new_jobs:
+        text_content += f"• {job.get('title')} at {job.get('company')}\n  {job.get('url')}\n\n"
+
+    # Create message
+    msg = MIMEMultipart("alternative")
+    msg["Subject"] = subject
+    msg["From"] = gmail
+    msg["To"] = gmail
+    msg.attach(MIMEText(text_content, "plain"))
+    msg.attach(MIMEText(html_content, "html"))
+
+    # Send email
+    try:
+        with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
+            server.login(gmail, app_password)
+            server.send_message(msg)
+        print(f"✓ Email sent with {len(new_jobs)} jobs")
+    except Exception as e:
+        print(f"✗ Failed to send email: {e}")
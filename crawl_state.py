@@ -0,0 +1,95 @@
+"""Crawl state - job keys each source has already processed, for incremental crawls"""
+
+import hashlib
+import json
+from datetime import datetime, timedelta
+from pathlib import Path
+
+DATA_DIR = Path(__file__).parent
+CRAWL_STATE_FILE = DATA_DIR / "crawl_state.json"
+
+# Forget processed keys after this long; postings older than the search window never come back anyway
+PROCESSED_RETENTION_DAYS = 30
+
+# filters.json keys that decide which jobs a search returns or the filters keep. When any of
+# them changes, earlier rejections and search windows no longer hold.
+FILTER_SIGNATURE_KEYS = (
+    "location_keywords", "exclude_keywords", "min_salary", "exclude_hourly_pay",
+    "work_types", "job_types", "experience_levels", "linkedin_geo_id", "indeed_radius",
+)
+
+
+def load_crawl_state() -> dict:
+    """Load crawl state from crawl_state.json."""
+    if CRAWL_STATE_FILE.exists():
+        try:
+            return json.loads(CRAWL_STATE_FILE.read_text())
+        except json.JSONDecodeError:
+            pass
+    return {}
+
+
+def save_crawl_state(state: dict):
+    """Save crawl state to crawl_state.json."""
+    CRAWL_STATE_FILE.write_text(json.dumps(state, indent=2))
+
+
+def filter_signature(filters: dict) -> str:
+    """Short hash of the FILTER_SIGNATURE_KEYS settings."""
+    settings = json.dumps({key: filters.get(key) for key in FILTER_SIGNATURE_KEYS}, sort_keys=True)
+    return hashlib.sha256(settings.encode()).hexdigest()[:16]
+
+
+def reset_if_filters_changed(state: dict, filters: dict) -> bool:
+    """Forget every source's processed keys and search times if the filters changed since they were recorded.
+
+    Jobs rejected under the old settings are then extracted again, and the next
+    searches cover the full time_filter window. Returns whether anything was reset.
+    """
+    signature = filter_signature(filters)
+    previous = state.get("filters_signature")
+    state["filters_signature"] = signature
+    if previous is None or previous == signature:
+        return False
+    for source_state in state.values():
+        if isinstance(source_state, dict):
+            source_state.pop("processed", None)
+            source_state.pop("last_success", None)
+    return True
+
+
+def processed_keys(state: dict, source: str) -> set:
+    """Keys (LinkedIn view ids, Indeed job keys) already extracted for a source, kept or filtered out."""
+    return set(state.get(source, {}).get("processed", {}))
+
+
+def mark_processed(state: dict, source: str, keys):
+    """Record extracted keys with today's date and drop entries past the retention window."""
+    processed = state.setdefault(source, {}).setdefault("processed", {})
+    today = datetime.now().date().isoformat()
+    for key in keys:
+        if key:
+            processed[key] = today
+    cutoff = (datetime.now() - timedelta(days=PROCESSED_RETENTION_DAYS)).date().isoformat()
+    state[source]["processed"] = {k: d for k, d in processed.items() if d >= cutoff}
+
+
+def last_successes(state: dict, source: str) -> dict:
+    """{search key: ISO time} of each search's last run that completed without errors."""
+    return dict(state.get(source, {}).get("last_success", {}))
+
+
+def mark_success(state: dict, source: str, search_keys, started: datetime):
+    """Record searches that completed, as of when they started (later postings are picked up next run)."""
+    last_success = state.setdefault(source, {}).setdefault("last_success", {})
+    for key in search_keys:
+        last_success[key] = started.isoformat()
+
+
+def record_successes(source: str, search_keys, started: datetime):
+    """mark_success and save, re-reading the file first so concurrent sources and runs don't clobber each other."""
+    if not search_keys:
+        return
+    state = load_crawl_state()
+    mark_success(state, source, search_keys, started)
+    save_crawl_state(state)
@@ -0,0 +1,104 @@
+"""Daemon mode - keep one browser warm and run scrape cycles on a schedule"""
+
+import asyncio
+import os
+import signal
+import subprocess
+import time
+from datetime import datetime
+from playwright.async_api import async_playwright
+
+DEFAULT_INTERVAL_MINUTES = 180
+DEFAULT_RECYCLE_CYCLES = 8
+DEFAULT_MAX_MEMORY_MB = 1500
+
+
+def process_tree_rss_mb(root_pid: int | None = None) -> float:
+    """Resident memory of a process and all its descendants (Playwright driver + Chromium), in MB."""
+    root_pid = os.getpid() if root_pid is None else root_pid
+    try:
+        output = subprocess.run(["ps", "-A", "-o", "pid=,ppid=,rss="], capture_output=True, text=True,
+                                timeout=10).stdout
+    except (OSError, subprocess.SubprocessError):
+        return 0.0
+
+    children, rss = {}, {}
+    for line in output.splitlines():
+        parts = line.split()
+        if len(parts) != 3:
+            continue
+        pid, ppid, kb = (int(p) for p in parts)
+        children.setdefault(ppid, []).append(pid)
+        rss[pid] = kb
+
+    total, stack = 0, [root_pid]
+    while stack:
+        pid = stack.pop()
+        total += rss.get(pid, 0)
+        stack.extend(children.get(pid, []))
+    return total / 1024
+
+
+async def run_daemon(name: str, start, interval_minutes: float = DEFAULT_INTERVAL_MINUTES,
+                     recycle_cycles: int = DEFAULT_RECYCLE_CYCLES, max_memory_mb: float = DEFAULT_MAX_MEMORY_MB):
+    """Run scrape cycles until SIGINT/SIGTERM; a cycle in progress finishes before shutdown.
+
+    `start` is an async (playwright) -> (browser, cycle) function, or returns
+    None if the browser could not be made ready (e.g. login failed). Anything
+    with an async close() can stand in for the browser. `cycle` is
+    an async no-argument function that runs one scrape. The browser is reused
+    across cycles and relaunched after `recycle_cycles` cycles or once the
+    process tree uses more than `max_memory_mb`.
+    """
+    stop = asyncio.Event()
+    loop = asyncio.get_running_loop()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        loop.add_signal_handler(sig, stop.set)
+
+    print(f"{name} daemon started: every {interval_minutes:g} min, "
+          f"recycle after {recycle_cycles} cycles or {max_memory_mb:g} MB")
+
+    async with async_playwright() as playwright:
+        browser, cycle, cycles = None, None, 0
+
+        while not stop.is_set():
+            started = time.monotonic()
+
+            if browser is None:
+                ready = await start(playwright)
+                if ready:
+                    browser, cycle = ready
+                    cycles = 0
+
+            if browser is not None:
+                failed = False
+                try:
+                    await cycle()
+                except Exception as e:
+                    # A crashed page or dropped session is cheaper to fix with a fresh browser
+                    print(f"{name} cycle failed: {e}")
+                    failed = True
+                cycles += 1
+
+                memory_mb = process_tree_rss_mb()
+                if failed or cycles >= recycle_cycles or memory_mb > max_memory_mb:
+                    print(f"Recycling browser after {cycles} cycles ({memory_mb:.0f} MB)")
+                    try:
+                        await browser.close()
+                    except Exception:
+                        pass
+                    browser, cycle = None, None
+
+            # Sleep until the next cycle, waking early on shutdown
+            remaining = interval_minutes * 60 - (time.monotonic() - started)
+            if remaining > 0 and not stop.is_set():
+                next_run = datetime.fromtimestamp(time.time() + remaining).strftime("%H:%M")
+                print(f"Next {name} cycle at {next_run}")
+                try:
+                    await asyncio.wait_for(stop.wait(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    pass
+
+        print(f"Shutting down {name} daemon...")
+        if browser is not None:
+            await browser.close()
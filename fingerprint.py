@@ -0,0 +1,119 @@
+"""Cross-source job fingerprints - spot the same role posted on LinkedIn and Indeed"""
+
+import hashlib
+import re
+
+# Spelled-out forms, so "Sr. Dir, Data Science" and "Senior Director - Data Science" agree
+TITLE_WORDS = {
+    "sr": "senior",
+    "jr": "junior",
+    "dir": "director",
+    "mgr": "manager",
+    "vp": "vice president",
+    "svp": "senior vice president",
+    "evp": "executive vice president",
+    "avp": "assistant vice president",
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "eng": "engineering",
+    "&": "and",
+}
+
+# Legal suffixes and filler dropped from company names
+COMPANY_STOPWORDS = {"the", "inc", "incorporated", "llc", "ltd", "limited", "corp", "corporation", "co",
+                     "company", "plc", "lp", "llp", "gmbh", "group", "holdings"}
+
+REMOTE_MARKERS = ("remote", "work from home", "anywhere")
+
+# Indeed's "Remote in Denver, CO" / "Hybrid remote in Atlanta, GA": the city follows the prefix
+REMOTE_IN_RE = re.compile(r"^\s*(?:hybrid\s+)?remote\s+in\s+")
+# Workplace words around a city ("Remote - Atlanta", "Hybrid, Atlanta")
+WORKPLACE_RE = re.compile(r"\b(?:remote|work from home|anywhere|hybrid|on-?site)\b")
+# Locations that name no city; LinkedIn's fully remote postings say "United States (Remote)"
+COUNTRY_NAMES = {"us", "u s", "usa", "united states", "united states of america"}
+
+# Parenthesized notes and trailing " - Remote" style suffixes boards add to titles
+TITLE_NOISE_RE = re.compile(r"\([^)]*\)|\[[^\]]*\]|\s[-–|]\s*(?:remote|hybrid|on-?site)\b.*$", re.IGNORECASE)
+TOKEN_RE = re.compile(r"[a-z0-9]+|&")
+
+
+def normalize_title(title: str) -> str:
+    tokens = TOKEN_RE.findall(TITLE_NOISE_RE.sub(" ", title or "").lower())
+    return " ".join(TITLE_WORDS.get(token, token) for token in tokens)
+
+
+def normalize_company(company: str) -> str:
+    tokens = TOKEN_RE.findall((company or "").lower())
+    return " ".join(token for token in tokens if token not in COMPANY_STOPWORDS and token != "&")
+
+
+def normalize_location(location: str) -> str | None:
+    """The city, "remote" for fully remote postings with no city, or None if there's no location.
+
+    LinkedIn writes "Atlanta, Georgia, United States" or "Atlanta, GA (Hybrid)"
+    where Indeed writes "Atlanta, GA 30301" or "Hybrid remote in Atlanta, GA",
+    so only the city is comparable.
+    """
+    location = (location or "").lower()
+    remote = any(marker in location for marker in REMOTE_MARKERS)
+    location = REMOTE_IN_RE.sub("", re.sub(r"\([^)]*\)", " ", location))
+    city = " ".join(TOKEN_RE.findall(WORKPLACE_RE.sub(" ", location.split(",")[0])))
+    if city and city not in COUNTRY_NAMES:
+        return city
+    return "remote" if remote else None
+
+
+def job_fingerprint(job: dict) -> str | None:
+    """Source-independent key from normalized title, company and location; None without a location."""
+    location = normalize_location(job.get("location", ""))
+    if location is None:
+        return None
+    key = "|".join((
+        normalize_title(job.get("title", "")),
+        normalize_company(job.get("company", "")),
+        location,
+    ))
+    return hashlib.sha1(key.encode()).hexdigest()[:16]
+
+
+def build_fingerprint_index(jobs: dict) -> dict:
+    """Map fingerprint -> job id for stored jobs, so each lookup is a dict hit.
+
+    Fingerprints are recomputed rather than read from the records, so keys
+    stored under older normalization rules don't match new jobs.
+    """
+    index = {}
+    for job_id, job in jobs.items():
+        fingerprint = job_fingerprint(job)
+        if fingerprint:
+            index.setdefault(fingerprint, job_id)
+    return index
+
+
+def merge_job(jobs: dict, index: dict, job_id: str, record: dict, source: str) -> bool:
+    """Add a job record, or fold it into the stored record for the same job from any source.
+
+    The stored record keeps its fields (including applied/ignored flags) and
+    gains this source's link under "sources". Returns True if the job is new.
+    A record without a location is only matched by its own id.
+    """
+    fingerprint = record["fingerprint"] = job_fingerprint(record)
+    existing_id = job_id if job_id in jobs else index.get(fingerprint) if fingerprint else None
+
+    if existing_id is None:
+        record["sources"] = {source: record.get("url")}
+        jobs[job_id] = record
+        if fingerprint:
+            index[fingerprint] = job_id
+        return True
+
+    existing = jobs[existing_id]
+    existing.setdefault("sources", {existing.get("source", "linkedin"): existing.get("url")})
+    existing["sources"][source] = record.get("url")
+    if not existing.get("fingerprint"):
+        existing["fingerprint"] = fingerprint
+    for key, value in record.items():
+        # Fill gaps (e.g. a salary only one board shows) without overwriting
+        if value and not existing.get(key):
+            existing[key] = value
+    return False
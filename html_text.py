@@ -0,0 +1,42 @@
+"""HTML to text - plain text of one container element in a fetched page or fragment"""
+
+from html.parser import HTMLParser
+from typing import Callable
+
+VOID_TAGS = {"area", "br", "col", "embed", "hr", "img", "input", "link", "meta", "source", "wbr"}
+BLOCK_TAGS = {"br", "p", "li", "ul", "ol", "div", "h1", "h2", "h3", "h4"}
+
+
+class _ContainerTextParser(HTMLParser):
+    """Collect the text inside the first element `is_container(tag, attrs)` accepts."""
+
+    def __init__(self, is_container: Callable[[str, dict], bool]):
+        super().__init__()
+        self.is_container = is_container
+        self.parts = []
+        self._depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        if self._depth:
+            if tag in BLOCK_TAGS:
+                self.parts.append("\n")
+            if tag not in VOID_TAGS:
+                self._depth += 1
+        elif self.is_container(tag, dict(attrs)):
+            self._depth = 1
+
+    def handle_endtag(self, tag):
+        if self._depth and tag not in VOID_TAGS:
+            self._depth -= 1
+
+    def handle_data(self, data):
+        if self._depth:
+            self.parts.append(data)
+
+
+def container_text(html: str, is_container: Callable[[str, dict], bool]) -> str:
+    """Text of the matching container(s), one line per block element with whitespace collapsed; "" if none."""
+    parser = _ContainerTextParser(is_container)
+    parser.feed(html)
+    lines = (" ".join(line.split()) for line in "".join(parser.parts).splitlines())
+    return "\n".join(line for line in lines if line)
@@ -0,0 +1,120 @@
+"""Indeed job details - full descriptions for jobs that survive the cheap filters"""
+
+import asyncio
+import json
+from contextlib import nullcontext
+from datetime import datetime, timedelta
+from pathlib import Path
+from playwright.async_api import BrowserContext
+
+from html_text import container_text
+from throttle import DomainThrottle, is_throttled
+
+DATA_DIR = Path(__file__).parent
+DETAIL_CACHE_FILE = DATA_DIR / "indeed_details_cache.json"
+
+VIEWJOB_URL = "https://www.indeed.com/viewjob?jk={job_key}"
+
+DEFAULT_CONCURRENCY = 4
+DEFAULT_TIMEOUT_SECONDS = 20
+
+# Postings this old have left the search window; their cached text is never read again
+CACHE_RETENTION_DAYS = 30
+
+DESCRIPTION_ID = "jobDescriptionText"
+
+
+class DetailsBlocked(RuntimeError):
+    """Indeed answered a detail fetch with a block (e.g. Cloudflare's 403) or a challenge page."""
+
+
+def parse_description(html: str) -> str:
+    """Plain description text from a viewjob page (#jobDescriptionText), or "" if it has none."""
+    return container_text(html, lambda tag, attrs: attrs.get("id") == DESCRIPTION_ID)
+
+
+def load_detail_cache() -> dict:
+    """Load {job_key: {"description", "fetched_at"}} from the cache file."""
+    if DETAIL_CACHE_FILE.exists():
+        try:
+            return json.loads(DETAIL_CACHE_FILE.read_text())
+        except json.JSONDecodeError:
+            pass
+    return {}
+
+
+def save_detail_cache(cache: dict):
+    """Save the cache, dropping entries older than the retention window."""
+    cutoff = (datetime.now() - timedelta(days=CACHE_RETENTION_DAYS)).isoformat()
+    kept = {key: entry for key, entry in cache.items() if entry.get("fetched_at", "") >= cutoff}
+    DETAIL_CACHE_FILE.write_text(json.dumps(kept, indent=2))
+
+
+async def fetch_description(context: BrowserContext, job_key: str, timeout: float = DEFAULT_TIMEOUT_SECONDS,
+                            throttle: DomainThrottle | None = None) -> str | None:
+    """Fetch one viewjob page with the context's cookies, without rendering it.
+
+    None on failure; raises DetailsBlocked if Indeed is blocking the session.
+    """
+    url = VIEWJOB_URL.format(job_key=job_key)
+    try:
+        async with throttle.slot(url, "fetch") if throttle else nullcontext() as outcome:
+            response = await context.request.get(url, timeout=timeout * 1000)
+            if outcome:
+                outcome.record(response.status, response.url)
+    except Exception:
+        return None
+    if is_throttled(response.status, response.url):
+        raise DetailsBlocked(f"HTTP {response.status} from {response.url}")
+    if not response.ok:
+        return None
+    try:
+        return parse_description(await response.text()) or None
+    except Exception:
+        return None
+
+
+async def fetch_descriptions(context: BrowserContext, job_keys: list, concurrency: int = DEFAULT_CONCURRENCY,
+                             timeout: float = DEFAULT_TIMEOUT_SECONDS,
+                             throttle: DomainThrottle | None = None) -> dict:
+    """Full descriptions for the given job keys, from the cache or at most `concurrency` fetches at a time.
+
+    Returns {job_key: description}; keys whose fetch failed are left out. The
+    first blocked response ends the stage: fetches still queued or waiting out
+    the throttle's backoff are cancelled, and those jobs keep their card snippets.
+    """
+    cache = load_detail_cache()
+    missing = [key for key in dict.fromkeys(job_keys) if key and key not in cache]
+    slots = asyncio.Semaphore(max(1, concurrency))
+    tasks = []
+    blocked = []
+
+    async def fetch(job_key: str):
+        async with slots:
+            try:
+                return job_key, await fetch_description(context, job_key, timeout, throttle)
+            except DetailsBlocked as e:
+                if not blocked:
+                    blocked.append(e)
+                    for task in tasks:
+                        if task is not asyncio.current_task():
+                            task.cancel()
+                return job_key, None
+
+    if missing:
+        tasks.extend(asyncio.create_task(fetch(key)) for key in missing)
+        fetched = 0
+        for result in await asyncio.gather(*tasks, return_exceptions=True):
+            if isinstance(result, BaseException):
+                continue  # Cancelled after a block
+            job_key, description = result
+            if description:
+                cache[job_key] = {"description": description, "fetched_at": datetime.now().isoformat()}
+                fetched += 1
+        save_detail_cache(cache)
+        print(f"Fetched {fetched} of {len(missing)} Indeed job details "
+              f"({len(job_keys) - len(missing)} from cache)")
+        if blocked:
+            print(f"Indeed blocked detail fetches ({blocked[0]}); skipped the rest, they keep their card snippets")
+
+    return {key: cache[key]["description"] for key in job_keys if key in cache}
@@ -0,0 +1,124 @@
+"""Read Indeed job cards from the JSON the search page embeds (mosaic job-cards provider)"""
+
+import html
+import re
+from datetime import datetime
+from playwright.async_api import Page
+
+from salary import parse_salary
+
+PROVIDER = "mosaic-provider-jobcards"
+
+# Runs in the browser. The provider data normally sits on window.mosaic; if a
+# script already consumed it, re-parse the inline assignment from the page
+# source. Only the fields we map are returned, to keep the transfer small.
+MOSAIC_JOBCARDS_JS = """
+(provider) => {
+    let data = window.mosaic && window.mosaic.providerData && window.mosaic.providerData[provider];
+    if (!data) {
+        const marker = `window.mosaic.providerData["${provider}"]=`;
+        for (const script of document.querySelectorAll('script')) {
+            const text = script.textContent || '';
+            const start = text.indexOf(marker);
+            if (start === -1) continue;
+            const body = text.slice(start + marker.length);
+            const end = body.indexOf(';\\n');
+            try {
+                data = JSON.parse(end === -1 ? body.replace(/;\\s*$/, '') : body.slice(0, end));
+            } catch (e) {
+                data = null;
+            }
+            break;
+        }
+    }
+    const results = data && data.metaData && data.metaData.mosaicProviderJobCardsModel
+        && data.metaData.mosaicProviderJobCardsModel.results;
+    if (!Array.isArray(results)) return null;
+    return results.map(r => ({
+        jobkey: r.jobkey,
+        title: r.displayTitle || r.title,
+        company: r.company || r.truncatedCompany,
+        location: r.formattedLocation,
+        remote: !!r.remoteLocation,
+        snippet: r.snippet,
+        salary: r.extractedSalary || null,
+        salaryText: (r.salarySnippet && r.salarySnippet.text) || '',
+        currency: (r.salarySnippet && r.salarySnippet.currency) || '',
+        pubDate: r.pubDate || r.createDate || null,
+        relativeTime: r.formattedRelativeTime || '',
+    }));
+}
+"""
+
+# extractedSalary.type -> salary period
+SALARY_PERIODS = {
+    "yearly": "year",
+    "monthly": "month",
+    "weekly": "week",
+    "daily": "day",
+    "hourly": "hour",
+}
+
+TAG_RE = re.compile(r"<[^>]+>")
+
+
+def _plain_text(snippet: str) -> str:
+    """Strip the list markup Indeed wraps around card snippets."""
+    text = TAG_RE.sub(" ", snippet or "")
+    return " ".join(html.unescape(text).split())
+
+
+def parse_card_salary(result: dict) -> dict | None:
+    """Structured salary from a card: min, max, period, currency and the display text."""
+    extracted = result.get("salary") or {}
+    text = result.get("salaryText", "")
+    if not extracted:
+        # Some cards only carry the display text
+        if not text:
+            return None
+        return parse_salary(text, pay_field=True) or {"min": None, "max": None, "period": None, "currency": "", "text": text}
+    return {
+        "min": extracted.get("min"),
+        "max": extracted.get("max"),
+        "period": SALARY_PERIODS.get(extracted.get("type", ""), extracted.get("type")),
+        "currency": result.get("currency") or ("USD" if "$" in text else ""),
+        "text": text,
+    }
+
+
+def parse_job_card(result: dict) -> dict | None:
+    """Map one provider result to the job dict extract_indeed_job produces, plus salary and posted_at."""
+    title = (result.get("title") or "").strip()
+    if not title:
+        return None
+
+    salary = parse_card_salary(result)
+    description = _plain_text(result.get("snippet", ""))[:500]
+    if salary and salary["text"]:
+        description += f" | {salary['text']}"
+
+    posted_at = None
+    if result.get("pubDate"):
+        posted_at = datetime.fromtimestamp(result["pubDate"] / 1000).isoformat()
+
+    jobkey = result.get("jobkey", "")
+    return {
+        "title": title,
+        "company": (result.get("company") or "").strip(),
+        "location": (result.get("location") or "").strip() or ("Remote" if result.get("remote") else ""),
+        "description": description,
+        "url": f"https://www.indeed.com/viewjob?jk={jobkey}" if jobkey else "",
+        "source": "indeed",
+        "salary": salary,
+        "posted_at": posted_at,
+        "scraped_at": datetime.now().isoformat(),
+    }
+
+
+async def read_job_cards(page: Page) -> list[dict] | None:
+    """All job cards on a search page in one evaluate call. None when the page has no provider blob."""
+    results = await page.evaluate(MOSAIC_JOBCARDS_JS, PROVIDER)
+    if results is None:
+        return None
+    jobs = (parse_job_card(result) for result in results)
+    return [job for job in jobs if job]
@@ -1,62 +1,198 @@
 """Indeed Job Scraper - Automated job search"""
 
-import json
+import asyncio
 import hashlib
+import sys
 from datetime import datetime
-from pathlib import Path
-from playwright.sync_api import sync_playwright, Page
-
-# Directories
-DATA_DIR = Path(__file__).parent
-SEEN_JOBS_FILE = DATA_DIR / "seen_jobs.json"
-FILTERS_FILE = DATA_DIR / "filters.json"
-
-# Default filters
-DEFAULT_FILTERS = {
-    "location_keywords": ["remote", "work from home", "wfh", "anywhere", "atlanta", "atl", ", ga", "georgia"],
-    "exclude_keywords": ["contractor", "contract", "freelance", "consultant", "hourly", "/hr", "per hour", "$/hour", "c2c", "corp to corp", "1099", "w2 contract", "temp", "temporary"],
-    "search_queries": ["data science director", "data science VP", "VP data science", "director of data science", "head of data science", "AI director", "ML director", "director machine learning"],
-    "time_filter": "Past week"
+from playwright.async_api import Browser, BrowserContext, Page
+
+from card_extractor import extract_cards
+from columnar import JobColumns, all_of, any_of, use_columnar
+from common import DEFAULT_FILTERS
+from crawl_state import record_successes
+from indeed_details import fetch_descriptions
+from indeed_payloads import read_job_cards
+from matching import KeywordMatcher
+from readiness import wait_for_any_selector, wait_for_hidden, wait_for_network_idle
+from routing import RoutingStats, install_resource_blocking, load_routing_policy
+from salary import parse_salary
+from selector_stats import SelectorRegistry
+from search_urls import (
+    TIME_FILTER_SECONDS, build_indeed_search_url, format_window, indeed_fromage, indeed_filter_params, search_windows,
+)
+from sources import Source
+from throttle import DomainThrottle, is_throttled, navigate, throttle_from_filters
+
+# Find job cards - Indeed 2024 structure
+JOB_CARD_SELECTORS = [
+    ".jobsearch-ResultsList .job_seen_beacon",
+    ".mosaic-provider-jobcards .job_seen_beacon",
+    "[data-jk]",
+    ".result",
+    ".jobCard_mainContent",
+]
+
+# Title relevance terms, matched on whole words against the lowercased title
+# Hard exclusions - these roles are never relevant
+TITLE_HARD_EXCLUDE = KeywordMatcher([
+    "clinical",
+    "quality assurance",
+    "qa ",
+    "advisory",
+    "consulting",
+    "sales",
+    "marketing",
+    "hr ",
+    "human resources",
+    "finance",
+    "financial",
+    "accounting",
+    "legal",
+    "compliance",
+    "supply chain",
+    "operations manager",
+    "customer",
+])
+
+# Must-have keywords for leadership roles (director-level or above)
+TITLE_LEADERSHIP = KeywordMatcher([
+    "director",
+    "vp",
+    "svp",
+    "evp",
+    "avp",
+    "vice president",
+    "head of",
+    "head,",
+    "chief",
+    "lead",
+    "leader",
+    "principal",
+    "senior director",
+    "executive",
+])
+
+# Domain terms that indicate data science / AI / ML
+TITLE_DOMAIN = KeywordMatcher([
+    "data science",
+    "data scientist",
+    "machine learning",
+    "artificial intelligence",
+    " ai ",
+    " ai,",
+    "ai/ml",
+    "ml/ai",
+    "analytics",
+    "data & analytics",
+    "data and analytics",
+    " ml ",
+    " ml,",
+    "deep learning",
+    "nlp",
+    "natural language",
+    "computer vision",
+])
+
+# Direct matches to common patterns
+TITLE_DIRECT = KeywordMatcher([
+    "director of data science",
+    "director, data science",
+    "data science director",
+    "vp of data science",
+    "vp, data science",
+    "vp data science",
+    "head of data science",
+    "head of machine learning",
+    "head of ai",
+    "head of analytics",
+    "director of machine learning",
+    "director of ai",
+    "director of analytics",
+    "ml director",
+    "ai director",
+    "chief data",
+    "chief analytics",
+    "data science lead",
+    "machine learning lead",
+    "ai lead",
+])
+
+# Indeed's start= offsets step by 10; a page can hold a few more sponsored cards
+RESULTS_PER_PAGE = 10
+CARD_LIMIT = 20
+
+# Per-card selector fallbacks, evaluated in the browser in one batch
+JOB_CARD_FIELDS = {
+    "title": {
+        "selectors": [
+            "h2.jobTitle span",
+            "h2.jobTitle a span",
+            "h2.jobTitle a",
+            ".jobTitle span",
+            ".jobTitle a",
+            ".jobTitle",
+            "[data-testid='jobTitle']",
+            "a[id^='job_']",
+            "a[id^='sj_']",
+        ],
+        "attribute": "title",
+        "text_fallback": True,
+        "skip": ["new"],  # Skip "new" labels
+    },
+    "company": {
+        "selectors": [
+            "[data-testid='company-name']",
+            ".companyName a",
+            ".companyName",
+            ".company_location .companyName",
+            "span[data-testid='company-name']",
+            ".css-92r8pb",  # Indeed's company class
+        ],
+    },
+    "location": {
+        "selectors": [
+            "[data-testid='text-location']",
+            ".companyLocation",
+            ".company_location .companyLocation",
+            ".location",
+            ".css-1p0sjhy",  # Indeed's location class
+        ],
+    },
+    "salary": {
+        "selectors": [
+            ".salary-snippet-container",
+            "[data-testid='attribute_snippet_testid']",
+            ".salaryText",
+            ".metadata .attribute_snippet",
+            ".css-1cvvo1b",  # Indeed's salary class
+        ],
+        "require_any": ["$", "year", "hour"],
+    },
+    "job_key": {"selectors": ["", "[data-jk]"], "attribute": "data-jk"},
+    "jk_link": {"selectors": ["a[href*='jk=']"], "attribute": "href"},
+    "link": {"selectors": ["a[href*='/viewjob']", "a[href*='/rc/clk']"], "attribute": "href"},
+    "description": {
+        "selectors": [
+            ".job-snippet",
+            "[data-testid='job-snippet']",
+            ".jobCardShelfContainer",
+            ".underShelfFooter",
+            "ul li",
+        ],
+        "max_length": 500,
+        "min_length": 20,
+    },
 }
 
 
-def load_filters() -> dict:
-    """Load filters from filters.json."""
-    if FILTERS_FILE.exists():
-        try:
-            return json.loads(FILTERS_FILE.read_text())
-        except json.JSONDecodeError:
-            pass
-    return DEFAULT_FILTERS
-
-
-def load_seen_jobs() -> tuple[set, dict]:
-    """Load set of previously seen job IDs and their details."""
-    if SEEN_JOBS_FILE.exists():
-        data = json.loads(SEEN_JOBS_FILE.read_text())
-        if "jobs" in data:
-            return set(data["jobs"].keys()), data["jobs"]
-        else:
-            return set(data.get("job_ids", [])), {}
-    return set(), {}
-
-
-def save_seen_jobs(jobs_dict: dict):
-    """Save seen jobs with their details to file."""
-    SEEN_JOBS_FILE.write_text(json.dumps({
-        "jobs": jobs_dict,
-        "last_updated": datetime.now().isoformat()
-    }, indent=2))
-
-
 def generate_job_id(job: dict) -> str:
     """Generate a unique ID for a job."""
     unique_str = f"indeed-{job.get('title', '')}-{job.get('company', '')}-{job.get('url', '')}"
     return hashlib.md5(unique_str.encode()).hexdigest()[:12]
 
 
-def dismiss_cookie_modal(page: Page) -> bool:
-    """Dismiss cookie consent modal if present."""
+async def dismiss_cookie_modal(page: Page, registry: SelectorRegistry | None = None) -> bool:
+    """Dismiss cookie consent modal if present, trying the last selector that worked first."""
     try:
         cookie_selectors = [
             "#onetrust-accept-btn-handler",
@@ -66,12 +202,17 @@ def dismiss_cookie_modal(page: Page) -> bool:
             "button:has-text('I Accept')",
             "[data-testid='cookie-accept']",
         ]
+        if registry:
+            cookie_selectors = registry.order("indeed", "cookie", cookie_selectors)
         for selector in cookie_selectors:
             try:
-                btn = page.query_selector(selector)
-                if btn and btn.is_visible():
-                    btn.click()
-                    page.wait_for_timeout(1000)
+                btn = await page.query_selector(selector)
+                if btn and await btn.is_visible():
+                    await btn.click()
+                    if registry:
+                        # Only hits are recorded: the banner is gone once cookies are set
+                        registry.record("indeed", "cookie", cookie_selectors, selector)
+                    await wait_for_hidden(page, selector, timeout=3000)
                     return True
             except:
                 continue
@@ -80,214 +221,150 @@ def dismiss_cookie_modal(page: Page) -> bool:
         return False
 
 
-def search_indeed(page: Page, query: str, location: str = "", time_filter: str = "Past week") -> list[dict]:
-    """Search Indeed for jobs."""
+async def search_indeed(page: Page, query: str, location: str = "",
+                        window_seconds: int | None = TIME_FILTER_SECONDS["Past week"],
+                        throttle: DomainThrottle | None = None, seen_keys: set | None = None,
+                        max_pages: int = 1, registry: SelectorRegistry | None = None,
+                        filter_params: dict | None = None, finished: set | None = None) -> list[dict]:
+    """Search Indeed for jobs, paging through results.
+
+    Asks for jobs posted within the smallest fromage bucket covering
+    `window_seconds` (None for any time). The search's key (see
+    indeed_search_key) is added to `finished` if every page loaded cleanly.
+
+    `filter_params` (from search_urls.indeed_filter_params for this location)
+    narrow the search on Indeed's side; the title and shared filters still apply.
+
+    Navigation waits for a `throttle` slot when one is given. Jobs whose key is
+    in `seen_keys` are dropped, and paging stops at the first page with no
+    unseen keys. New keys are added to `seen_keys` so concurrent searches share them.
+    """
     jobs = []
+    seen_keys = set() if seen_keys is None else seen_keys
 
-    # Time filter mapping to Indeed's fromage parameter
-    # 1 = last 24 hours, 3 = last 3 days, 7 = last 7 days, 14 = last 14 days
-    fromage = ""
-    if time_filter == "Past 24 hours":
-        fromage = "&fromage=1"
-    elif time_filter == "Past week":
-        fromage = "&fromage=7"
-    elif time_filter == "Past month":
-        fromage = "&fromage=14"
-
-    # Build search URL
-    query_encoded = query.replace(" ", "+")
-
-    # For Indeed, "remote" is a special location filter
-    if not location or location.lower() in ["remote", "work from home", "wfh", "anywhere"]:
-        search_url = f"https://www.indeed.com/jobs?q={query_encoded}&l=&sc=0kf%3Aattr%28DSQF7%29%3B"  # Remote filter
-    else:
-        location_encoded = location.replace(" ", "+").replace(",", "%2C")
-        search_url = f"https://www.indeed.com/jobs?q={query_encoded}&l={location_encoded}"
-
-    search_url += fromage
-    print(f"  URL: {search_url}")
+    # "Remote" is a remote-jobs search rather than a place (see indeed_filter_params)
+    fromage = indeed_fromage(window_seconds)
+    print(f"  URL: {build_indeed_search_url(query, location, fromage, filter_params)}")
 
     try:
-        page.goto(search_url, timeout=60000)
-        page.wait_for_timeout(2000)
-
-        # Dismiss cookie modal
-        dismiss_cookie_modal(page)
-
-        # Scroll to load more jobs
-        for _ in range(2):
-            page.evaluate("window.scrollBy(0, 1000)")
-            page.wait_for_timeout(500)
-
-        # Find job cards - Indeed 2024 structure
-        job_card_selectors = [
-            ".jobsearch-ResultsList .job_seen_beacon",
-            ".mosaic-provider-jobcards .job_seen_beacon",
-            "[data-jk]",
-            ".result",
-            ".jobCard_mainContent",
-        ]
+        for page_num in range(max_pages):
+            # Indeed pages results with start= offsets
+            page_url = build_indeed_search_url(query, location, fromage, filter_params, page_num * RESULTS_PER_PAGE)
+            page_jobs = await load_result_page(page, page_url, throttle, registry)
+            if not page_jobs:
+                break
 
-        job_cards = []
-        for selector in job_card_selectors:
-            job_cards = page.query_selector_all(selector)
-            if job_cards:
-                print(f"  Found {len(job_cards)} cards with selector: {selector}")
+            new_jobs = []
+            for job in page_jobs:
+                job_key = extract_job_key(job["url"])
+                if job_key and job_key in seen_keys:
+                    continue
+                if job_key:
+                    seen_keys.add(job_key)
+                new_jobs.append(job)
+            if not new_jobs:
+                print(f"  {query}: page {page_num + 1} has only seen jobs, stopping")
                 break
 
-        if not job_cards:
-            # Try a broader approach - get all elements with data-jk attribute
-            job_cards = page.query_selector_all("[data-jk]")
-            print(f"  Found {len(job_cards)} cards with data-jk")
+            for job in new_jobs:
+                print(f"    ✓ {job['title']} at {job['company']}")
+            jobs.extend(new_jobs)
 
-        for card in job_cards[:10]:  # Limit per query for speed
-            try:
-                job = extract_indeed_job(page, card)
-                if job and job.get("title"):
-                    jobs.append(job)
-                    print(f"    ✓ {job['title']} at {job['company']}")
-            except Exception as e:
-                print(f"    Error extracting job: {e}")
-                continue
+            if len(page_jobs) < RESULTS_PER_PAGE:
+                break  # Last page of results
 
+        if finished is not None:
+            finished.add(indeed_search_key(query, location))
     except Exception as e:
         print(f"Indeed search error for '{query}': {e}")
 
     return jobs
 
 
-def extract_indeed_job(page: Page, card) -> dict | None:
-    """Extract job details from an Indeed job card."""
+def indeed_search_key(query: str, location: str) -> str:
+    """crawl_state key for one (query, location) search."""
+    return f"{query} @ {location or 'Remote'}"
+
+
+async def load_result_page(page: Page, url: str, throttle: DomainThrottle | None = None,
+                           registry: SelectorRegistry | None = None) -> list[dict]:
+    """Open one results page and return its jobs, from the embedded JSON or the card DOM."""
+    response = await navigate(page, url, throttle)
+    if is_throttled(response.status if response else None, page.url):
+        # Not an empty result: the search has to count as failed so its window isn't skipped next run
+        raise RuntimeError(f"Indeed is throttling or challenging this session ({page.url})")
+
+    # Wait for results (or the no-results message) instead of a fixed sleep
+    await wait_for_any_selector(page, JOB_CARD_SELECTORS + [".jobsearch-NoResult-messageContainer"], timeout=15000)
+
+    # Dismiss cookie modal
+    await dismiss_cookie_modal(page, registry)
+
+    # The page embeds every card as JSON; use it when present
+    embedded = await read_job_cards(page)
+    if embedded is not None:
+        print(f"  Found {len(embedded)} cards in embedded job data")
+        return embedded
+
+    # Scroll to load more jobs, then let lazy-loaded content settle
+    for _ in range(2):
+        await page.evaluate("window.scrollBy(0, 1000)")
+    await wait_for_network_idle(page, timeout=2000)
+
+    # All card fields in one round trip
+    cards, card_selector = await extract_cards(page, JOB_CARD_SELECTORS, JOB_CARD_FIELDS, limit=CARD_LIMIT,
+                                               registry=registry, site="indeed")
+    print(f"  Found {len(cards)} cards with selector: {card_selector}")
+
+    jobs = (extract_indeed_job(card) for card in cards)
+    return [job for job in jobs if job and job.get("title")]
+
+
+def extract_job_key(url: str) -> str:
+    """Indeed's job key (jk) from a viewjob URL, or "" if the URL has none."""
+    if "jk=" in url:
+        return url.split("jk=")[1].split("&")[0]
+    return ""
+
+
+def extract_indeed_job(card: dict) -> dict | None:
+    """Build a job dict from batched Indeed card fields."""
     try:
-        # Title - try multiple approaches
-        title = ""
-        title_selectors = [
-            "h2.jobTitle span",
-            "h2.jobTitle a span",
-            "h2.jobTitle a",
-            ".jobTitle span",
-            ".jobTitle a",
-            ".jobTitle",
-            "[data-testid='jobTitle']",
-            "a[id^='job_']",
-            "a[id^='sj_']",
-        ]
-        for sel in title_selectors:
-            el = card.query_selector(sel)
-            if el:
-                title = el.get_attribute("title") or el.inner_text()
-                title = title.strip()
-                # Skip "new" labels
-                if title and title.lower() != "new":
-                    break
-
-        # Company
-        company = ""
-        company_selectors = [
-            "[data-testid='company-name']",
-            ".companyName a",
-            ".companyName",
-            ".company_location .companyName",
-            "span[data-testid='company-name']",
-            ".css-92r8pb",  # Indeed's company class
-        ]
-        for sel in company_selectors:
-            el = card.query_selector(sel)
-            if el:
-                company = el.inner_text().strip()
-                if company:
-                    break
-
-        # Location
-        location = ""
-        location_selectors = [
-            "[data-testid='text-location']",
-            ".companyLocation",
-            ".company_location .companyLocation",
-            ".location",
-            ".css-1p0sjhy",  # Indeed's location class
-        ]
-        for sel in location_selectors:
-            el = card.query_selector(sel)
-            if el:
-                location = el.inner_text().strip()
-                if location:
-                    break
-
-        # Salary (if available)
-        salary = ""
-        salary_selectors = [
-            ".salary-snippet-container",
-            "[data-testid='attribute_snippet_testid']",
-            ".salaryText",
-            ".metadata .attribute_snippet",
-            ".css-1cvvo1b",  # Indeed's salary class
-        ]
-        for sel in salary_selectors:
-            el = card.query_selector(sel)
-            if el:
-                text = el.inner_text().strip()
-                if "$" in text or "year" in text.lower() or "hour" in text.lower():
-                    salary = text
-                    break
-
-        # URL - try to get job key first
+        title = card.get("title", "")
+
+        # URL - try to get job key first (card or nested data-jk, then link href)
         job_url = ""
-        job_key = card.get_attribute("data-jk")
-
-        if not job_key:
-            # Try to find job key in nested elements
-            jk_el = card.query_selector("[data-jk]")
-            if jk_el:
-                job_key = jk_el.get_attribute("data-jk")
-
-        if not job_key:
-            # Try from link href
-            link_el = card.query_selector("a[href*='jk=']")
-            if link_el:
-                href = link_el.get_attribute("href")
-                if "jk=" in href:
-                    job_key = href.split("jk=")[1].split("&")[0]
+        job_key = card.get("job_key", "")
+        href = card.get("jk_link", "")
+        if not job_key and "jk=" in href:
+            job_key = href.split("jk=")[1].split("&")[0]
 
         if job_key:
             job_url = f"https://www.indeed.com/viewjob?jk={job_key}"
         else:
             # Fallback to any job link
-            link_el = card.query_selector("a[href*='/viewjob'], a[href*='/rc/clk']")
-            if link_el:
-                href = link_el.get_attribute("href")
-                if href:
-                    if href.startswith("/"):
-                        job_url = f"https://www.indeed.com{href}"
-                    else:
-                        job_url = href
-
-        # Description snippet
-        description = ""
-        desc_selectors = [
-            ".job-snippet",
-            "[data-testid='job-snippet']",
-            ".jobCardShelfContainer",
-            ".underShelfFooter",
-            "ul li",
-        ]
-        for sel in desc_selectors:
-            el = card.query_selector(sel)
-            if el:
-                description = el.inner_text().strip()[:500]
-                if description and len(description) > 20:
-                    break
+            href = card.get("link", "")
+            if href:
+                if href.startswith("/"):
+                    job_url = f"https://www.indeed.com{href}"
+                else:
+                    job_url = href
+
+        description = card.get("description", "")
+        salary = card.get("salary", "")
 
         if not title:
             return None
 
         return {
             "title": title,
-            "company": company,
-            "location": location,
+            "company": card.get("company", ""),
+            "location": card.get("location", ""),
             "description": description + (f" | {salary}" if salary else ""),
             "url": job_url,
             "source": "indeed",
+            "salary": parse_salary(salary, pay_field=True) or {"min": None, "max": None, "period": None, "currency": "", "text": salary}
+            if salary else None,
             "scraped_at": datetime.now().isoformat(),
         }
     except Exception as e:
@@ -297,202 +374,179 @@ def extract_indeed_job(page: Page, card) -> dict | None:
 
 def is_relevant_title(title: str, search_queries: list) -> bool:
     """Check if job title is relevant based on search queries."""
-    title_lower = title.lower()
+    title = (title or "").lower()
 
     # Hard exclusions - these roles are never relevant
-    hard_exclude = ["clinical", "quality assurance", "qa ", "advisory", "consulting", "sales", "marketing", "hr ", "human resources", "finance", "accounting", "legal", "compliance", "supply chain", "operations manager", "customer"]
-    if any(term in title_lower for term in hard_exclude):
+    if TITLE_HARD_EXCLUDE.find(title):
         return False
 
-    # Must-have keywords for leadership roles (director-level or above)
-    leadership_terms = ["director", "vp", "vice president", "head of", "head,", "chief", "lead", "principal", "senior director", "executive"]
-
-    # Domain terms that indicate data science / AI / ML
-    domain_phrases = [
-        "data science",
-        "data scientist",
-        "machine learning",
-        "artificial intelligence",
-        " ai ",
-        " ai,",
-        "ai/ml",
-        "ml/ai",
-        "analytics",
-        "data & analytics",
-        "data and analytics",
-        " ml ",
-        " ml,",
-        "deep learning",
-        "nlp",
-        "natural language",
-        "computer vision",
-    ]
-
-    # Check if title has a leadership term
-    has_leadership = any(term in title_lower for term in leadership_terms)
-
-    # Check if title has a domain phrase
-    has_domain = any(phrase in title_lower for phrase in domain_phrases)
-
-    # Must have both leadership AND domain relevance
-    if has_leadership and has_domain:
+    # Must have both leadership AND domain relevance, or match a common title pattern directly
+    if TITLE_LEADERSHIP.find(title) and TITLE_DOMAIN.find(title):
+        return True
+    return TITLE_DIRECT.find(title) is not None
+
+
+def filter_relevant_titles(jobs: dict, search_queries: list) -> dict:
+    """The {job_id: job} entries passing is_relevant_title; large batches are matched column-wise."""
+    if not use_columnar(len(jobs)):
+        return {
+            job_id: job for job_id, job in jobs.items()
+            if is_relevant_title(job.get("title", ""), search_queries)
+        }
+    columns = JobColumns(jobs)
+    relevant = any_of(
+        all_of(columns.matches(TITLE_LEADERSHIP.regex, "title"), columns.matches(TITLE_DOMAIN.regex, "title")),
+        columns.matches(TITLE_DIRECT.regex, "title"),
+    )
+    return columns.select(relevant, columns.matches(TITLE_HARD_EXCLUDE.regex, "title"))
+
+
+async def open_indeed_context(browser, filters: dict) -> tuple[BrowserContext, RoutingStats]:
+    """Create a browsing context with request blocking installed."""
+    context = await browser.new_context(
+        viewport={"width": 1280, "height": 900},
+        user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+    )
+    routing_stats = await install_resource_blocking(context, *load_routing_policy(filters))
+    return context, routing_stats
+
+
+async def scrape_indeed(context: BrowserContext, filters: dict, seen_keys: set | None = None,
+                        throttle: DomainThrottle | None = None) -> list[dict]:
+    """Search every (query, location) pair on a pool of pages, deduplicating as results arrive.
+
+    `seen_keys` holds Indeed job keys to skip; keys found during the run are added to it.
+
+    The pool size is `max_concurrent_searches`; all pages share one adaptive
+    DomainThrottle for indeed.com (a new one from filters unless `throttle` is given).
+    """
+    # Get search queries, locations and time filter
+    search_queries = filters.get("search_queries", DEFAULT_FILTERS["search_queries"])
+    locations = filters.get("indeed_locations", DEFAULT_FILTERS["indeed_locations"]) or ["Remote"]
+    time_filter = filters.get("time_filter", "Past week")
+    max_pages = int(filters.get("max_pages", DEFAULT_FILTERS["max_pages"]))
+    seen_keys = set() if seen_keys is None else seen_keys
+    concurrency = int(filters.get("max_concurrent_searches", DEFAULT_FILTERS["max_concurrent_searches"]))
+    throttle = throttle or throttle_from_filters(filters, concurrency)
+
+    pairs = [(query, location) for query in search_queries for location in locations]
+    windows = search_windows(filters, "indeed", [indeed_search_key(query, location) for query, location in pairs])
+    print(f"Time filter: {time_filter}")
+    print(f"Searching {len(pairs)} query/location pairs, {concurrency} at a time, up to {max_pages} pages each\n")
+
+    registry = SelectorRegistry()
+    queue = asyncio.Queue()
+    for pair in pairs:
+        queue.put_nowait(pair)
+    unique_jobs = {}
+    finished = set()
+    started = datetime.now()
+
+    async def worker():
+        page = await context.new_page()
+        try:
+            while not queue.empty():
+                query, location = queue.get_nowait()
+                window = windows[indeed_search_key(query, location)]
+                jobs = await search_indeed(page, query, location, window, throttle, seen_keys, max_pages,
+                                           registry, indeed_filter_params(filters, location), finished)
+                # Merge as each search finishes; the same job often shows up for several locations
+                added = 0
+                for job in jobs:
+                    job_id = generate_job_id(job)
+                    if job_id not in unique_jobs:
+                        unique_jobs[job_id] = job
+                        added += 1
+                print(f"  {query} ({location or 'Remote'}, {format_window(window)}): "
+                      f"{len(jobs)} jobs, {added} new to this run")
+        finally:
+            await page.close()
+
+    workers = max(1, min(concurrency, len(pairs)))
+    await asyncio.gather(*(worker() for _ in range(workers)))
+    registry.save()
+    record_successes("indeed", finished, started)
+
+    return list(unique_jobs.values())
+
+
+async def add_full_descriptions(context: BrowserContext, jobs: dict, filters: dict,
+                                throttle: DomainThrottle | None = None):
+    """Replace card snippets with full viewjob descriptions, fetched in parallel and cached by job key."""
+    job_keys = {job_id: extract_job_key(job.get("url") or "") for job_id, job in jobs.items()}
+    concurrency = int(filters.get("indeed_detail_concurrency", DEFAULT_FILTERS["indeed_detail_concurrency"]))
+    throttle = throttle or throttle_from_filters(filters, concurrency)
+    descriptions = await fetch_descriptions(
+        context, [key for key in job_keys.values() if key],
+        concurrency=concurrency,
+        timeout=float(filters.get("indeed_detail_timeout_seconds", DEFAULT_FILTERS["indeed_detail_timeout_seconds"])),
+        throttle=throttle,
+    )
+
+    for job_id, job in jobs.items():
+        description = descriptions.get(job_keys[job_id])
+        if description:
+            # Keep the salary text the snippet carried so the exclusion filter still sees it
+            salary = (job.get("salary") or {}).get("text")
+            job["description"] = description + (f" | {salary}" if salary else "")
+
+
+class IndeedSource(Source):
+    """Indeed through a browser context with request blocking."""
+
+    name = "indeed"
+
+    def __init__(self):
+        self.context = None
+        self.routing_stats = None
+        self.throttle = None
+
+    async def open(self, browser: Browser | None, config: dict, filters: dict) -> bool:
+        self.context, self.routing_stats = await open_indeed_context(browser, filters)
+        # Searches and detail fetches share one budget for indeed.com, kept across daemon cycles
+        self.throttle = throttle_from_filters(filters, max(
+            int(filters.get("max_concurrent_searches", DEFAULT_FILTERS["max_concurrent_searches"])),
+            int(filters.get("indeed_detail_concurrency", DEFAULT_FILTERS["indeed_detail_concurrency"])),
+        ))
         return True
 
-    # Direct matches to common patterns
-    direct_patterns = [
-        "director of data science",
-        "director, data science",
-        "data science director",
-        "vp of data science",
-        "vp, data science",
-        "vp data science",
-        "head of data science",
-        "head of machine learning",
-        "head of ai",
-        "head of analytics",
-        "director of machine learning",
-        "director of ai",
-        "director of analytics",
-        "ml director",
-        "ai director",
-        "chief data",
-        "chief analytics",
-        "data science lead",
-        "machine learning lead",
-        "ai lead",
-    ]
-
-    for pattern in direct_patterns:
-        if pattern in title_lower:
-            return True
-
-    return False
-
-
-def is_location_match(location: str, description: str, location_keywords: list) -> bool:
-    """Check if job matches any location keywords."""
-    location_lower = location.lower()
-    description_lower = description.lower()
-    for keyword in location_keywords:
-        if keyword.lower() in location_lower or keyword.lower() in description_lower:
-            return True
-    return False
-
-
-def is_full_time_employee(title: str, description: str, exclude_keywords: list) -> bool:
-    """Check if job is a full-time employee position."""
-    title_lower = title.lower()
-    description_lower = description.lower()
-    for keyword in exclude_keywords:
-        if keyword.lower() in title_lower or keyword.lower() in description_lower:
-            return False
-    return True
-
-
-def run_indeed_scraper():
-    """Main function to run the Indeed job scraper."""
-    print(f"\n{'='*50}")
-    print(f"Indeed Job Scraper - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"{'='*50}\n")
-
-    # Load previously seen jobs
-    seen_job_ids, seen_jobs_dict = load_seen_jobs()
-    print(f"Loaded {len(seen_job_ids)} previously seen job IDs")
-
-    # Load filters
-    filters = load_filters()
-
-    all_jobs = []
-
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(headless=True)
-        context = browser.new_context(
-            viewport={"width": 1280, "height": 900},
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
-        )
-        page = context.new_page()
-
-        # Get search queries and time filter
+    def known_keys(self, seen_jobs: dict) -> set:
+        return {
+            extract_job_key(job.get("url") or "") for job in seen_jobs.values()
+            if job.get("source") == "indeed" and "jk=" in (job.get("url") or "")
+        }
+
+    async def search(self, filters: dict, seen_keys: set) -> list[dict]:
+        jobs = await scrape_indeed(self.context, filters, seen_keys, self.throttle)
+        print(f"Rate limits: {self.throttle.summary()}")
+        print(self.routing_stats.summary())
+        self.routing_stats.reset()
+        return jobs
+
+    async def extract(self, jobs: dict, filters: dict) -> dict:
+        """Keep jobs with a relevant title, then fetch their full descriptions if enabled."""
         search_queries = filters.get("search_queries", DEFAULT_FILTERS["search_queries"])
-        time_filter = filters.get("time_filter", "Past week")
-        print(f"Time filter: {time_filter}\n")
+        title_filtered = filter_relevant_titles(jobs, search_queries)
+        print(f"Indeed jobs with relevant titles: {len(title_filtered)}")
 
-        # Only search remote - Indeed already shows remote jobs well
-        # Searching multiple locations makes it too slow
-        for query in search_queries:
-            print(f"Searching Indeed: {query} (Remote)")
-            jobs = search_indeed(page, query, "", time_filter)
-            print(f"  Found {len(jobs)} jobs")
-            all_jobs.extend(jobs)
+        # Cards only carry a snippet; fetch full descriptions for the survivors
+        if filters.get("indeed_fetch_details", DEFAULT_FILTERS["indeed_fetch_details"]):
+            await add_full_descriptions(self.context, title_filtered, filters, self.throttle)
+        return title_filtered
 
-        browser.close()
+    def job_id(self, job: dict) -> str:
+        return generate_job_id(job)
 
-    # Deduplicate
-    unique_jobs = {}
-    for job in all_jobs:
-        job_id = generate_job_id(job)
-        if job_id not in unique_jobs:
-            job["id"] = job_id
-            unique_jobs[job_id] = job
+    async def close(self):
+        if self.context:
+            await self.context.close()
 
-    print(f"\nTotal unique Indeed jobs found: {len(unique_jobs)}")
 
-    # Get filter keywords
-    search_queries = filters.get("search_queries", DEFAULT_FILTERS["search_queries"])
-    location_keywords = filters.get("location_keywords", DEFAULT_FILTERS["location_keywords"])
-    exclude_keywords = filters.get("exclude_keywords", DEFAULT_FILTERS["exclude_keywords"])
-
-    # Filter by title relevance first
-    title_filtered = {
-        job_id: job for job_id, job in unique_jobs.items()
-        if is_relevant_title(job.get("title", ""), search_queries)
-    }
-    print(f"Jobs with relevant titles: {len(title_filtered)}")
-
-    # Filter by location
-    location_filtered = {
-        job_id: job for job_id, job in title_filtered.items()
-        if is_location_match(job.get("location", ""), job.get("description", ""), location_keywords)
-    }
-    print(f"Jobs matching location filter: {len(location_filtered)}")
-
-    # Filter out excluded keywords
-    fte_filtered = {
-        job_id: job for job_id, job in location_filtered.items()
-        if is_full_time_employee(job.get("title", ""), job.get("description", ""), exclude_keywords)
-    }
-    print(f"Jobs after exclusion filter: {len(fte_filtered)}")
-
-    # Filter to new jobs only
-    new_jobs = [job for job_id, job in fte_filtered.items() if job_id not in seen_job_ids]
-    print(f"New jobs (not seen before): {len(new_jobs)}")
-
-    if new_jobs:
-        # Update seen jobs
-        for job_id, job in fte_filtered.items():
-            seen_jobs_dict[job_id] = {
-                "title": job.get("title"),
-                "company": job.get("company"),
-                "location": job.get("location"),
-                "url": job.get("url"),
-                "source": "indeed",
-                "scraped_at": job.get("scraped_at"),
-            }
-        save_seen_jobs(seen_jobs_dict)
-
-        print("\n📋 New Indeed Jobs Found:")
-        for job in new_jobs:
-            print(f"  • {job['title']} at {job['company']}")
-            print(f"    {job['url']}\n")
-    else:
-        print("\nNo new Indeed jobs found.")
-
-    print(f"\n{'='*50}")
-    print("Indeed scraper finished")
-    print(f"{'='*50}\n")
-
-    return new_jobs
+def run_indeed_scraper(daemon: bool = False):
+    """Run the Indeed source on its own, once or as a daemon."""
+    from runner import run  # runner imports this module
+    run(["indeed"], daemon=daemon)
 
 
 if __name__ == "__main__":
-    run_indeed_scraper()
+    run_indeed_scraper(daemon="--daemon" in sys.argv[1:])
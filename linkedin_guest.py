@@ -0,0 +1,180 @@
+"""LinkedIn guest jobs source - public HTML fragments over pooled keep-alive HTTP, no browser"""
+
+import asyncio
+import gzip
+import http.client
+import queue
+from html.parser import HTMLParser
+from urllib.parse import urlencode, urlsplit
+
+from html_text import VOID_TAGS, container_text
+from throttle import DomainThrottle
+
+GUEST_BASE_URL = "https://www.linkedin.com"
+SEARCH_PATH = "/jobs-guest/jobs/api/seeMoreJobPostings/search"
+POSTING_PATH = "/jobs-guest/jobs/api/jobPosting/{job_id}"
+
+HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36",
+    "Accept": "text/html",
+    "Accept-Encoding": "gzip",
+    "Connection": "keep-alive",
+}
+
+# Class names on the search card fragment -> job dict field
+CARD_FIELD_CLASSES = {
+    "base-search-card__title": "title",
+    "base-search-card__subtitle": "company",
+    "job-search-card__location": "location",
+}
+
+# Containers holding the description on the posting fragment
+DESCRIPTION_CLASSES = {"show-more-less-html__markup", "description__text"}
+
+
+class GuestClient:
+    """Pool of keep-alive HTTP(S) connections with bounded concurrency.
+
+    `base_url` can point at a local stand-in server serving recorded fragments.
+    Requests wait for a `throttle` slot when one is given and report their status to it.
+    """
+
+    def __init__(self, base_url: str = GUEST_BASE_URL, pool_size: int = 4, timeout: float = 15,
+                 throttle: DomainThrottle | None = None):
+        self.base_url = base_url.rstrip("/")
+        self.throttle = throttle
+        parts = urlsplit(base_url)
+        self.https = parts.scheme == "https"
+        self.host = parts.hostname
+        self.port = parts.port
+        self.timeout = timeout
+        self._idle = queue.LifoQueue()  # Most recently used first: likeliest to still be open
+        self._slots = asyncio.Semaphore(pool_size)
+
+    def _connect(self) -> http.client.HTTPConnection:
+        if self.https:
+            return http.client.HTTPSConnection(self.host, self.port, timeout=self.timeout)
+        return http.client.HTTPConnection(self.host, self.port, timeout=self.timeout)
+
+    def _request(self, path: str) -> tuple[int, str]:
+        for attempt in range(2):
+            try:
+                conn, reused = self._idle.get_nowait(), True
+            except queue.Empty:
+                conn, reused = self._connect(), False
+            try:
+                conn.request("GET", path, headers=HEADERS)
+                response = conn.getresponse()
+                body = response.read()
+            except (OSError, http.client.HTTPException):
+                conn.close()
+                if reused and attempt == 0:
+                    continue  # Server dropped an idle keep-alive connection; retry on a fresh one
+                raise
+            if response.will_close:
+                conn.close()
+            else:
+                self._idle.put(conn)
+            if response.getheader("Content-Encoding") == "gzip":
+                body = gzip.decompress(body)
+            return response.status, body.decode("utf-8", "replace")
+        raise http.client.HTTPException("no usable connection")
+
+    async def get(self, path: str) -> tuple[int, str]:
+        """GET a path, returning (status, text). Blocks while all pool slots are busy."""
+        if self.throttle is None:
+            async with self._slots:
+                return await asyncio.to_thread(self._request, path)
+        async with self.throttle.slot(self.base_url + path) as outcome:
+            async with self._slots:
+                status, text = await asyncio.to_thread(self._request, path)
+            outcome.record(status)
+            return status, text
+
+    async def close(self):
+        while not self._idle.empty():
+            self._idle.get_nowait().close()
+
+
+def build_guest_search_path(query: str, time_param: str = "", start: int = 0, location: str = "",
+                            filter_params: dict | None = None) -> str:
+    """Path for one page of guest search results.
+
+    `time_param` is an f_TPR value like "r604800"; `filter_params` are the
+    f_WT/f_JT/f_E/geoId facets from search_urls.linkedin_filter_params.
+    """
+    params = {"keywords": query}
+    if location:
+        params["location"] = location
+    if time_param:
+        params["f_TPR"] = time_param
+    params.update(filter_params or {})
+    if start:
+        params["start"] = start
+    return f"{SEARCH_PATH}?{urlencode(params)}"
+
+
+class _CardParser(HTMLParser):
+    """Collect title/company/location/url per job card from a search fragment."""
+
+    def __init__(self):
+        super().__init__()
+        self.cards = []
+        self._field = None
+        self._depth = 0
+
+    def handle_starttag(self, tag, attrs):
+        attrs = dict(attrs)
+        urn = attrs.get("data-entity-urn") or ""
+        if "jobPosting:" in urn:
+            self.cards.append({"job_id": urn.rsplit(":", 1)[1], "title": "", "company": "", "location": "", "url": ""})
+        if not self.cards:
+            return
+
+        card = self.cards[-1]
+        classes = (attrs.get("class") or "").split()
+        if tag == "a" and "base-card__full-link" in classes and not card["url"]:
+            card["url"] = attrs.get("href") or ""
+
+        if self._field:
+            if tag not in VOID_TAGS:
+                self._depth += 1
+            return
+        for cls, field in CARD_FIELD_CLASSES.items():
+            if cls in classes and tag not in VOID_TAGS:
+                self._field, self._depth = field, 1
+                break
+
+    def handle_endtag(self, tag):
+        if self._field and tag not in VOID_TAGS:
+            self._depth -= 1
+            if self._depth == 0:
+                self._field = None
+
+    def handle_data(self, data):
+        if self._field:
+            self.cards[-1][self._field] += data
+
+
+def parse_job_cards(html: str) -> list[dict]:
+    """Parse a seeMoreJobPostings fragment into card dicts (job_id, title, company, location, url)."""
+    parser = _CardParser()
+    parser.feed(html)
+    for card in parser.cards:
+        for key in ("title", "company", "location"):
+            card[key] = " ".join(card[key].split())
+    return parser.cards
+
+
+def parse_job_description(html: str) -> str:
+    """Parse a jobPosting fragment into plain description text."""
+    return container_text(html, lambda tag, attrs: bool(DESCRIPTION_CLASSES & set((attrs.get("class") or "").split())))
+
+
+async def fetch_job_description(client: GuestClient, job_id: str) -> str:
+    """Fetch one posting's full description, or "" if the request fails."""
+    try:
+        status, html = await client.get(POSTING_PATH.format(job_id=job_id))
+    except (OSError, http.client.HTTPException):
+        return ""
+    return parse_job_description(html) if status == 200 else ""
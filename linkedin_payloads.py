@@ -0,0 +1,152 @@
+"""Collect LinkedIn job data from the JSON payloads the jobs UI fetches"""
+
+import asyncio
+import re
+from contextlib import nullcontext
+from playwright.async_api import BrowserContext, Page, Response
+
+from throttle import DomainThrottle
+
+VOYAGER_PATH = "/voyager/api/"
+JOB_POSTING_URL = "https://www.linkedin.com/voyager/api/jobs/jobPostings/{job_id}"
+
+# Matches urn:li:fsd_jobPosting:123, urn:li:fs_normalized_jobPosting:123,
+# urn:li:jobPosting:123 and urn:li:fsd_jobPostingCard:(123,JOBS_SEARCH)
+JOB_URN_RE = re.compile(r"urn:li:(?:fsd_|fs_normalized_|fs_)?jobPosting(?:Card)?:\(?(\d+)")
+
+
+def _text(value) -> str:
+    """Return the text of a voyager TextViewModel ({"text": ...}) or a plain string."""
+    if isinstance(value, dict):
+        value = value.get("text")
+    return value.strip() if isinstance(value, str) else ""
+
+
+def _job_id(entity: dict) -> str | None:
+    """Find the job posting id an entity describes."""
+    if entity.get("jobPostingId"):
+        return str(entity["jobPostingId"])
+    for key in ("entityUrn", "jobPostingUrn", "*jobPosting", "dashEntityUrn", "jobPosting", "trackingUrn"):
+        value = entity.get(key)
+        if isinstance(value, str):
+            match = JOB_URN_RE.search(value)
+            if match:
+                return match.group(1)
+    return None
+
+
+def _company(entity: dict) -> str:
+    """Pull the company name from the shapes voyager uses for it."""
+    if entity.get("companyName"):
+        return _text(entity["companyName"])
+    details = entity.get("companyDetails") or {}
+    for value in details.values():
+        if isinstance(value, dict):
+            name = value.get("name") or (value.get("companyResolutionResult") or {}).get("name")
+            if name:
+                return name.strip()
+    return _text(entity.get("primaryDescription"))
+
+
+def parse_job_entity(entity: dict) -> dict:
+    """Map one voyager entity to whichever job fields it carries."""
+    fields = {
+        "title": _text(entity.get("jobPostingTitle")) or _text(entity.get("title")),
+        "company": _company(entity),
+        "location": _text(entity.get("formattedLocation")) or _text(entity.get("secondaryDescription")),
+        "description": _text(entity.get("description")) or _text(entity.get("descriptionText")),
+    }
+    return {key: value for key, value in fields.items() if value}
+
+
+class JobPayloadCollector:
+    """Listen for voyager JSON responses on a page and index job fields by job id."""
+
+    def __init__(self):
+        self.jobs = {}
+        self._pending = set()
+
+    def attach(self, page: Page):
+        page.on("response", self._on_response)
+
+    def detach(self, page: Page):
+        page.remove_listener("response", self._on_response)
+
+    def _on_response(self, response: Response):
+        if VOYAGER_PATH not in response.url:
+            return
+        if "json" not in response.headers.get("content-type", ""):
+            return
+        task = asyncio.ensure_future(self._read(response))
+        self._pending.add(task)
+        task.add_done_callback(self._pending.discard)
+
+    async def _read(self, response: Response):
+        try:
+            self.ingest(await response.json())
+        except Exception:
+            pass
+
+    async def settle(self):
+        """Wait for responses that are still being parsed."""
+        if self._pending:
+            await asyncio.gather(*list(self._pending), return_exceptions=True)
+
+    def ingest(self, payload):
+        """Walk a voyager payload and merge every job entity found into the index."""
+        stack = [payload]
+        while stack:
+            node = stack.pop()
+            if isinstance(node, list):
+                stack.extend(node)
+                continue
+            if not isinstance(node, dict):
+                continue
+            job_id = _job_id(node)
+            if job_id:
+                self._merge(job_id, parse_job_entity(node))
+            stack.extend(v for v in node.values() if isinstance(v, (dict, list)))
+
+    def _merge(self, job_id: str, fields: dict):
+        record = self.jobs.setdefault(job_id, {})
+        for key, value in fields.items():
+            # Keep the longest text seen, so a card snippet never replaces a full description
+            if len(value) > len(record.get(key, "")):
+                record[key] = value
+
+    async def fetch_missing(self, context: BrowserContext, job_ids: list, concurrency: int = 4,
+                            throttle: DomainThrottle | None = None):
+        """Fetch job postings the UI has not loaded yet, using the same endpoint the detail panel calls.
+
+        Each request waits for a `throttle` slot when one is given and reports its status to it.
+        """
+        missing = [job_id for job_id in job_ids if not self.jobs.get(job_id, {}).get("description")]
+        if not missing:
+            return
+
+        cookies = await context.cookies("https://www.linkedin.com")
+        csrf = next((c["value"].strip('"') for c in cookies if c["name"] == "JSESSIONID"), "")
+        headers = {
+            "csrf-token": csrf,
+            "accept": "application/vnd.linkedin.normalized+json+2.1",
+            "x-restli-protocol-version": "2.0.0",
+        }
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(job_id):
+            url = JOB_POSTING_URL.format(job_id=job_id)
+            async with semaphore:
+                try:
+                    async with throttle.slot(url, "api") if throttle else nullcontext() as outcome:
+                        response = await context.request.get(url, headers=headers, timeout=15000)
+                        if outcome:
+                            outcome.record(response.status, response.url)
+                    if response.ok:
+                        payload = await response.json()
+                        self.ingest(payload)
+                        # The posting endpoint answers for a single job, so attribute untagged fields to it
+                        self._merge(job_id, parse_job_entity(payload.get("data") or {}))
+                except Exception:
+                    pass
+
+        await asyncio.gather(*(fetch(job_id) for job_id in missing))
@@ -0,0 +1,208 @@
+"""Compiled keyword filters - whole-word keyword and phrase lookups, behind a plain substring pre-check"""
+
+import re
+from functools import lru_cache
+
+from columnar import JobColumns, use_columnar
+from common import DEFAULT_FILTERS
+
+# Tokens are runs of [a-z0-9], plus these symbols on their own; they carry meaning in keywords
+# like "$/hour", ", ga" or "c++"
+TOKEN_RE = re.compile(r"[a-z0-9]+|[$/&,+#]")
+WORD_CHARS = frozenset("abcdefghijklmnopqrstuvwxyz0123456789")
+
+# Text between two tokens, and the word edges around a keyword, for phrase_regex
+SEPARATOR = "[^a-z0-9$/&,+#]"
+WORD_START = "(?:^|[^a-z0-9])"
+WORD_END = "(?:[^a-z0-9]|$)"
+
+
+def tokenize(text: str) -> list[str]:
+    """Lowercased tokens; "W2-Contract, $/hr" -> ["w2", "contract", ",", "$", "/", "hr"]."""
+    return TOKEN_RE.findall((text or "").lower())
+
+
+def _phrase_body(tokens: list[str]) -> str:
+    """The tokens in order: words need a separator between them, a symbol token can touch its neighbour."""
+    parts = []
+    for i, token in enumerate(tokens):
+        if i:
+            parts.append(SEPARATOR + ("+" if token.isalnum() and tokens[i - 1].isalnum() else "*"))
+        parts.append(re.escape(token))
+    return "".join(parts)
+
+
+def phrase_regex(tokens: list[str]) -> str:
+    """Regex matching the token sequence in lowercased raw text, on whole words.
+
+    Uses no lookarounds, so it also runs on RE2 (Arrow's regex engine).
+    """
+    return ((WORD_START if tokens[0].isalnum() else "") + _phrase_body(tokens)
+            + (WORD_END if tokens[-1].isalnum() else ""))
+
+
+class _Keyword:
+    """One keyword's pre-check substring and confirming regex.
+
+    The regex starts with the keyword's first token as a literal, which lets
+    re skip straight to candidate positions; the word boundary in front of it
+    is checked by hand, since a leading boundary group or lookbehind would make
+    re try every position of a long description.
+    """
+
+    __slots__ = ("keyword", "needle", "pattern", "bounded")
+
+    def __init__(self, keyword: str, tokens: list[str]):
+        self.keyword = keyword
+        # Any match contains every token, so the longest is the most selective plain substring test
+        self.needle = max(tokens, key=len)
+        self.pattern = re.compile(_phrase_body(tokens) + ("(?![a-z0-9])" if tokens[-1].isalnum() else ""))
+        self.bounded = tokens[0].isalnum()
+
+    def found_in(self, text: str, needle_checked: bool = False) -> bool:
+        if not needle_checked and self.needle not in text:
+            return False
+        match = self.pattern.search(text)
+        while match:
+            start = match.start()
+            if not self.bounded or start == 0 or text[start - 1] not in WORD_CHARS:
+                return True
+            match = self.pattern.search(text, start + 1)
+        return False
+
+
+class KeywordMatcher:
+    """Any-of matching on whole words: "temp" doesn't match "template", "atl" doesn't match "battle".
+
+    Keywords are tokenized, so "$/hour" or "W2 contract" match as phrases
+    ("w2-contract" too) and stray spaces or case in a keyword don't matter.
+
+    Matching is a plain `in` scan per keyword's longest token on the lowercased
+    text; only a hit runs the keyword's regex to confirm the match is on whole
+    words. Keywords are grouped under the shortest of those substrings they
+    contain ("remotely" under "remote", "w2 contract" and "contractor" under
+    "contract"), so a text is scanned once per group rather than once per keyword.
+    """
+
+    def __init__(self, keywords):
+        compiled = []
+        patterns = {}
+        for keyword in keywords or []:
+            tokens = tokenize(keyword)
+            phrase = " ".join(tokens)
+            if tokens and phrase not in patterns:
+                patterns[phrase] = phrase_regex(tokens)
+                compiled.append(_Keyword(keyword, tokens))
+        self.keywords = tuple(compiled)
+
+        # Substring -> keywords whose longest token contains it, in configured order
+        needles = {keyword.needle for keyword in compiled}
+        roots = [needle for needle in needles if not any(other != needle and other in needle for other in needles)]
+        self.groups = {}
+        for keyword in compiled:
+            root = max((root for root in roots if root in keyword.needle), key=len)
+            self.groups.setdefault(root, []).append(keyword)
+
+        # The same test as one regex over lowercased text, for columnar batches ("" = no keywords)
+        self.regex = "|".join(f"(?:{pattern})" for pattern in patterns.values())
+
+    def __bool__(self) -> bool:
+        return bool(self.keywords)
+
+    def find(self, *lowered: str) -> str | None:
+        """The configured keyword found in the first of the already-lowercased texts that has one, or None."""
+        for text in lowered:
+            for root, keywords in self.groups.items():
+                if root in text:
+                    for keyword in keywords:
+                        if keyword.found_in(text, needle_checked=keyword.needle == root):
+                            return keyword.keyword
+        return None
+
+    def search(self, *texts: str) -> str | None:
+        """find() on raw texts; each is lowercased only if the earlier ones had no match."""
+        return self.find(*((text or "").lower() for text in texts))
+
+
+# Job fields the keyword filters look at
+FILTERED_FIELDS = ("title", "location", "description")
+
+
+class JobFilters:
+    """The location and exclusion filters from filters.json, compiled once.
+
+    lower_jobs lowercases each job's title, location and description once for
+    both filters. The filter_* methods take a whole {job_id: job} dict (and
+    optionally those texts) and return the jobs that pass. Without them,
+    batches of COLUMNAR_THRESHOLD jobs or more are matched column-wise instead
+    (columnar.py, when pyarrow is installed).
+    """
+
+    def __init__(self, location_keywords, exclude_keywords):
+        self.location = KeywordMatcher(location_keywords)
+        self.exclude = KeywordMatcher(exclude_keywords)
+
+    def location_match(self, location: str, description: str = "") -> bool:
+        """Any location keyword in the location or description."""
+        return self.location.search(location, description) is not None
+
+    def is_full_time(self, title: str, description: str = "") -> bool:
+        """No excluded (contract/hourly) keyword in the title or description."""
+        return self.exclude.search(title, description) is None
+
+    @staticmethod
+    def lower_job(job: dict, fields: tuple = FILTERED_FIELDS) -> dict:
+        return {field: (job.get(field) or "").lower() for field in fields}
+
+    def lower_jobs(self, jobs: dict, fields: tuple = FILTERED_FIELDS) -> dict:
+        """{job_id: {field: lowercased text}}, to share between filter calls."""
+        return {job_id: self.lower_job(job, fields) for job_id, job in jobs.items()}
+
+    def filter_location(self, jobs: dict, lowered: dict | None = None) -> dict:
+        if lowered is None and use_columnar(len(jobs)):
+            columns = JobColumns(jobs)
+            return columns.select(columns.matches(self.location.regex, "location", "description"))
+        lowered = self.lower_jobs(jobs) if lowered is None else lowered
+        return {
+            job_id: job for job_id, job in jobs.items()
+            if self.location.find(lowered[job_id]["location"], lowered[job_id]["description"])
+        }
+
+    def filter_excluded(self, jobs: dict, lowered: dict | None = None,
+                        fields: tuple = ("title", "description")) -> dict:
+        """Jobs with no excluded keyword in `fields` (stored records only keep the title, for one)."""
+        if lowered is None and use_columnar(len(jobs)):
+            columns = JobColumns(jobs)
+            return columns.select(exclude=columns.matches(self.exclude.regex, *fields))
+        lowered = self.lower_jobs(jobs, fields) if lowered is None else lowered
+        return {
+            job_id: job for job_id, job in jobs.items()
+            if not self.exclude.find(*(lowered[job_id][field] for field in fields))
+        }
+
+    def apply(self, jobs: dict) -> tuple[dict, dict]:
+        """(jobs passing the location filter, those of them also passing the exclusion filter).
+
+        Each job's text is lowercased once for both filters.
+        """
+        if use_columnar(len(jobs)):
+            columns = JobColumns(jobs)
+            located = columns.matches(self.location.regex, "location", "description")
+            excluded = columns.matches(self.exclude.regex, "title", "description")
+            return columns.select(located), columns.select(located, excluded)
+        lowered = self.lower_jobs(jobs)
+        located = self.filter_location(jobs, lowered)
+        return located, self.filter_excluded(located, lowered)
+
+
+@lru_cache(maxsize=8)
+def _compile(location_keywords: tuple, exclude_keywords: tuple) -> JobFilters:
+    return JobFilters(location_keywords, exclude_keywords)
+
+
+def compile_filters(filters: dict) -> JobFilters:
+    """JobFilters for a loaded filters dict; unchanged keyword lists reuse the compiled matchers."""
+    return _compile(
+        tuple(filters.get("location_keywords", DEFAULT_FILTERS["location_keywords"]) or ()),
+        tuple(filters.get("exclude_keywords", DEFAULT_FILTERS["exclude_keywords"]) or ()),
+    )
@@ -0,0 +1,133 @@
+"""Page readiness helpers - wait for page events instead of fixed sleeps"""
+
+import asyncio
+from playwright.async_api import Page, Response, TimeoutError as PlaywrightTimeoutError
+
+# Default upper bound for a readiness wait (ms). Waits return as soon as the
+# condition holds, so this only matters when the page is slow or broken.
+DEFAULT_TIMEOUT = 10000
+
+# Signature of the current Easy Apply step: progress value plus step heading
+FORM_STEP_SIGNATURE_JS = """
+() => {
+    const modal = document.querySelector('.jobs-easy-apply-modal, .jobs-easy-apply-content, [role="dialog"]');
+    if (!modal) return '';
+    const progress = modal.querySelector('[role="progressbar"], progress');
+    const heading = modal.querySelector('h3, h2');
+    const value = progress ? (progress.getAttribute('aria-valuenow') || progress.value || '') : '';
+    return value + '|' + (heading ? heading.innerText.trim() : '');
+}
+"""
+
+
+async def wait_for_any_selector(page: Page, selectors: list, timeout: int = DEFAULT_TIMEOUT,
+                                state: str = "attached") -> str | None:
+    """Wait until any of the selectors matches. Returns the selector that matched, or None."""
+    try:
+        await page.wait_for_selector(", ".join(selectors), state=state, timeout=timeout)
+    except PlaywrightTimeoutError:
+        return None
+    for selector in selectors:
+        try:
+            if await page.query_selector(selector):
+                return selector
+        except Exception:
+            continue
+    return None
+
+
+async def wait_for_count(page: Page, selector: str, count: int = 1, timeout: int = DEFAULT_TIMEOUT) -> int:
+    """Wait until the results list has at least `count` elements. Returns the count reached."""
+    try:
+        await page.wait_for_function(
+            "([sel, n]) => document.querySelectorAll(sel).length >= n",
+            arg=[selector, count],
+            timeout=timeout,
+        )
+    except PlaywrightTimeoutError:
+        pass
+    return await page.evaluate("(sel) => document.querySelectorAll(sel).length", selector)
+
+
+async def wait_for_detail_job(page: Page, job_id: str, timeout: int = DEFAULT_TIMEOUT) -> bool:
+    """Wait until the LinkedIn detail panel shows the given job id with its description rendered."""
+    try:
+        await page.wait_for_function(
+            """(jobId) => {
+                const shown = location.href.includes('currentJobId=' + jobId)
+                    || document.querySelector(`.jobs-details a[href*="/jobs/view/${jobId}"], .job-view-layout a[href*="/jobs/view/${jobId}"]`);
+                const desc = document.querySelector('.jobs-description-content__text, .jobs-description__content, #job-details');
+                return Boolean(shown && desc && desc.innerText.trim().length > 0);
+            }""",
+            arg=job_id,
+            timeout=timeout,
+        )
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+async def wait_for_url_contains(page: Page, fragments: list, timeout: int = DEFAULT_TIMEOUT) -> bool:
+    """Wait until the page URL contains any of the fragments."""
+    try:
+        await page.wait_for_url(lambda url: any(f in url for f in fragments), timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+async def wait_for_network_idle(page: Page, timeout: int = DEFAULT_TIMEOUT) -> bool:
+    """Wait until there are no network connections for at least 500 ms."""
+    try:
+        await page.wait_for_load_state("networkidle", timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+async def wait_for_response(page: Page, predicate, timeout: int = DEFAULT_TIMEOUT) -> Response | None:
+    """Wait for a response matching the predicate. Start it before the action that triggers the request."""
+    try:
+        return await page.wait_for_event("response", predicate=predicate, timeout=timeout)
+    except PlaywrightTimeoutError:
+        return None
+
+
+async def wait_for_hidden(page: Page, selector: str, timeout: int = DEFAULT_TIMEOUT) -> bool:
+    """Wait until an element (e.g. a dismissed modal) is hidden or detached."""
+    try:
+        await page.wait_for_selector(selector, state="hidden", timeout=timeout)
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+async def form_step_signature(page: Page) -> str:
+    """Return a string identifying the current Easy Apply form step."""
+    try:
+        return await page.evaluate(FORM_STEP_SIGNATURE_JS)
+    except Exception:
+        return ""
+
+
+async def wait_for_form_step_change(page: Page, previous: str, timeout: int = DEFAULT_TIMEOUT) -> bool:
+    """Wait until the Easy Apply form moves past the step with the given signature."""
+    try:
+        await page.wait_for_function(
+            f"(prev) => ({FORM_STEP_SIGNATURE_JS})() !== prev",
+            arg=previous,
+            timeout=timeout,
+        )
+        return True
+    except PlaywrightTimeoutError:
+        return False
+
+
+async def wait_for_close(page: Page):
+    """Block until the user closes the page or the browser."""
+    closed = asyncio.Event()
+    page.on("close", lambda _: closed.set())
+    page.context.on("close", lambda _: closed.set())
+    if page.is_closed():
+        return
+    await closed.wait()
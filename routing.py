@@ -0,0 +1,95 @@
+"""Request routing - abort heavy resources that text extraction doesn't need"""
+
+from playwright.async_api import BrowserContext, Route
+
+# Playwright resource types to abort
+DEFAULT_BLOCKED_RESOURCE_TYPES = ["image", "media", "font"]
+
+# Tracking beacons and ad scripts, matched as substrings of the request URL
+DEFAULT_BLOCKED_URL_PATTERNS = [
+    "doubleclick.net",
+    "googlesyndication.com",
+    "googletagmanager.com",
+    "google-analytics.com",
+    "connect.facebook.net",
+    "bat.bing.com",
+    "ads.linkedin.com",
+    "/li/track",
+    "snap.licdn.com",
+    "scorecardresearch.com",
+    "hotjar.com",
+    "quantserve.com",
+]
+
+# Typical transfer size of one blocked request (bytes). Aborted requests never
+# report a size, so savings are estimated from these.
+TYPICAL_BYTES = {
+    "image": 30_000,
+    "media": 500_000,
+    "font": 40_000,
+    "script": 60_000,
+    "stylesheet": 20_000,
+}
+DEFAULT_TYPICAL_BYTES = 5_000
+
+
+class RoutingStats:
+    """Counts of requests allowed and blocked by a routing policy."""
+
+    def __init__(self):
+        self.allowed = 0
+        self.blocked = {}
+
+    def reset(self):
+        """Start counting a new run (daemon mode reuses one context across runs)."""
+        self.allowed = 0
+        self.blocked = {}
+
+    def record_blocked(self, resource_type: str):
+        self.blocked[resource_type] = self.blocked.get(resource_type, 0) + 1
+
+    @property
+    def blocked_total(self) -> int:
+        return sum(self.blocked.values())
+
+    @property
+    def bytes_saved(self) -> int:
+        return sum(TYPICAL_BYTES.get(t, DEFAULT_TYPICAL_BYTES) * n for t, n in self.blocked.items())
+
+    def summary(self) -> str:
+        by_type = ", ".join(f"{t} {n}" for t, n in sorted(self.blocked.items(), key=lambda x: -x[1]))
+        return (f"Blocked {self.blocked_total} of {self.blocked_total + self.allowed} requests"
+                f"{f' ({by_type})' if by_type else ''}, ~{self.bytes_saved / 1_000_000:.1f} MB saved")
+
+
+def load_routing_policy(filters: dict) -> tuple[list, list]:
+    """Read the resource types and URL patterns to block from filters.json settings."""
+    return (
+        filters.get("blocked_resource_types", DEFAULT_BLOCKED_RESOURCE_TYPES),
+        filters.get("blocked_url_patterns", DEFAULT_BLOCKED_URL_PATTERNS),
+    )
+
+
+async def install_resource_blocking(context: BrowserContext, resource_types: list = None,
+                                    url_patterns: list = None) -> RoutingStats:
+    """Abort matching requests on every page of the context. Returns live stats for the run."""
+    resource_types = set(DEFAULT_BLOCKED_RESOURCE_TYPES if resource_types is None else resource_types)
+    url_patterns = DEFAULT_BLOCKED_URL_PATTERNS if url_patterns is None else url_patterns
+    stats = RoutingStats()
+
+    async def handle(route: Route):
+        request = route.request
+        if request.resource_type in resource_types or any(p in request.url for p in url_patterns):
+            stats.record_blocked(request.resource_type)
+            await route.abort()
+        else:
+            stats.allowed += 1
+            await route.continue_()
+
+    await context.route("**/*", handle)
+    return stats
+
+
+async def remove_resource_blocking(context: BrowserContext):
+    """Undo install_resource_blocking, e.g. before handing a headed browser over to the user."""
+    await context.unroute("**/*")
@@ -0,0 +1,232 @@
+"""Job scraper runner - search every enabled source in one browser, then filter, save and notify once"""
+
+import asyncio
+import subprocess
+import sys
+from datetime import datetime
+from playwright.async_api import async_playwright, Browser
+
+from common import DATA_DIR, DEFAULT_FILTERS, load_config, load_filters, load_seen_jobs, save_seen_jobs, send_email
+from crawl_state import load_crawl_state, mark_processed, processed_keys, reset_if_filters_changed, save_crawl_state
+from daemon import DEFAULT_INTERVAL_MINUTES, DEFAULT_MAX_MEMORY_MB, DEFAULT_RECYCLE_CYCLES, run_daemon
+from fingerprint import build_fingerprint_index, merge_job
+from indeed_scraper import IndeedSource
+from matching import compile_filters
+from salary import parse_salary, salary_passes
+from scraper import LinkedInSource
+from sources import Source
+
+# Source plugins by name, as used in filters.json "sources"
+SOURCES = {
+    LinkedInSource.name: LinkedInSource,
+    IndeedSource.name: IndeedSource,
+}
+
+
+class OpenSources:
+    """The shared browser plus the sources opened on it; closes both (run_daemon's "browser")."""
+
+    def __init__(self, browser: Browser | None, sources: list[Source]):
+        self.browser = browser
+        self.sources = sources
+
+    async def close(self):
+        for source in self.sources:
+            try:
+                await source.close()
+            except Exception:
+                pass
+        if self.browser:
+            await self.browser.close()
+
+
+async def search_source(source: Source, filters: dict, seen_keys: set) -> list[dict]:
+    """One source's searches; a failing source doesn't take the others down."""
+    try:
+        return await source.search(filters, seen_keys)
+    except Exception as e:
+        print(f"{source.name} search failed: {e}")
+        return []
+
+
+async def run_cycle(sources: list[Source], config: dict) -> list[dict]:
+    """One scrape cycle: search all sources concurrently, filter, merge, notify and save. Returns the new jobs."""
+    names = ", ".join(source.name for source in sources)
+    print(f"\n{'='*50}")
+    print(f"Job Scraper ({names}) - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    print(f"{'='*50}\n")
+
+    # Load previously seen jobs
+    seen_job_ids, seen_jobs_dict = load_seen_jobs()
+    print(f"Loaded {len(seen_job_ids)} previously seen job IDs")
+
+    # Load filters (re-read every cycle so edits apply to a running daemon)
+    filters = load_filters()
+
+    # Per source: jobs kept earlier (seen_jobs.json) or extracted and filtered out (crawl_state.json)
+    crawl_state = load_crawl_state()
+    if reset_if_filters_changed(crawl_state, filters):
+        print("Filters changed since the last run: re-checking previously rejected jobs over the full time window")
+    save_crawl_state(crawl_state)
+    known_keys = {
+        source.name: processed_keys(crawl_state, source.name) | source.known_keys(seen_jobs_dict)
+        for source in sources
+    }
+    seen_keys = {name: set(keys) for name, keys in known_keys.items()}
+
+    results = await asyncio.gather(*(search_source(source, filters, seen_keys[source.name]) for source in sources))
+
+    crawl_state = load_crawl_state()
+    for source in sources:
+        mark_processed(crawl_state, source.name, seen_keys[source.name] - known_keys[source.name])
+    save_crawl_state(crawl_state)
+
+    # Deduplicate within each source, then let it narrow or enrich its own jobs
+    candidates = {}
+    for source, jobs in zip(sources, results):
+        unique_jobs = {}
+        for job in jobs:
+            job_id = source.job_id(job)
+            if job_id not in unique_jobs:
+                job["id"] = job_id
+                job["source"] = source.name
+                unique_jobs[job_id] = job
+        print(f"\nTotal unique {source.name} jobs found: {len(unique_jobs)}")
+        candidates.update(await source.extract(unique_jobs, filters))
+
+    # Get filter settings
+    job_filters = compile_filters(filters)
+    min_salary = float(filters.get("min_salary", DEFAULT_FILTERS["min_salary"]) or 0)
+    exclude_hourly = filters.get("exclude_hourly_pay", DEFAULT_FILTERS["exclude_hourly_pay"])
+
+    # Numeric salary check before the keyword scans; descriptions may state pay the card didn't
+    for job in candidates.values():
+        if not (job.get("salary") or {}).get("period"):
+            job["salary"] = parse_salary(job.get("description", "")) or job.get("salary")
+    salary_filtered = {
+        job_id: job for job_id, job in candidates.items()
+        if salary_passes(job.get("salary"), min_salary, exclude_hourly)
+    }
+    print(f"\nJobs passing salary filter: {len(salary_filtered)}")
+
+    # Filter by location keywords, then drop excluded keywords (contractor/hourly);
+    # large batches are matched column-wise
+    location_filtered, fte_filtered = job_filters.apply(salary_filtered)
+    print(f"Jobs matching location filter: {len(location_filtered)}")
+    print(f"Jobs after exclusion filter: {len(fte_filtered)}")
+
+    # Merge into seen jobs (only filtered jobs). Re-read first: another run may have saved
+    # meanwhile. A job already stored from any board isn't new; it gains this board's link.
+    _, seen_jobs_dict = load_seen_jobs()
+    fingerprints = build_fingerprint_index(seen_jobs_dict)
+    new_jobs = []
+    for job_id, job in fte_filtered.items():
+        record = {
+            "title": job.get("title"),
+            "company": job.get("company"),
+            "location": job.get("location"),
+            "url": job.get("url"),
+            "source": job["source"],
+            "salary": job.get("salary"),
+            "posted_at": job.get("posted_at"),
+            "scraped_at": job.get("scraped_at"),
+        }
+        if merge_job(seen_jobs_dict, fingerprints, job_id, record, job["source"]):
+            new_jobs.append(job)
+    print(f"New jobs (not seen before): {len(new_jobs)}")
+    if fte_filtered:
+        save_seen_jobs(seen_jobs_dict)
+
+    if new_jobs:
+        # Send email notification
+        send_email(config, new_jobs)
+
+        # Print new jobs
+        print("\n📋 New Jobs Found:")
+        for job in new_jobs:
+            print(f"  • {job['title']} at {job['company']} ({job['source']})")
+            print(f"    {job['url']}\n")
+
+        # Open all jobs in browser if running interactively (not cron)
+        if sys.stdout.isatty():
+            open_all_file = DATA_DIR / "open_all_jobs.html"
+            if open_all_file.exists():
+                print("Opening all jobs in browser...")
+                subprocess.run(["open", str(open_all_file)])
+    else:
+        print("\nNo new jobs found.")
+
+    print(f"\n{'='*50}")
+    print("Scraper finished")
+    print(f"{'='*50}\n")
+
+    return new_jobs
+
+
+async def open_sources(playwright, config: dict, names: list):
+    """Launch one browser (if any source needs it) and open the named sources on it.
+
+    Returns (OpenSources, cycle) for run_daemon, or None if no source could be opened.
+    """
+    filters = load_filters()
+    unknown = [name for name in names if name not in SOURCES]
+    if unknown:
+        print(f"Unknown sources ignored: {', '.join(unknown)}")
+    sources = [SOURCES[name]() for name in names if name in SOURCES]
+
+    browser = None
+    if any(source.needs_browser(filters) for source in sources):
+        browser = await playwright.chromium.launch(
+            headless=True,  # Run headless for cron
+        )
+
+    opened = []
+    for source in sources:
+        if await source.open(browser, config, filters):
+            opened.append(source)
+        else:
+            print(f"Skipping {source.name}: could not open it")
+
+    if not opened:
+        if browser:
+            await browser.close()
+        return None
+    return OpenSources(browser, opened), lambda: run_cycle(opened, config)
+
+
+async def run_once(config: dict, names: list) -> list[dict]:
+    """Open the sources, run a single cycle and close everything."""
+    async with async_playwright() as playwright:
+        ready = await open_sources(playwright, config, names)
+        if not ready:
+            return []
+        session, cycle = ready
+        try:
+            return await cycle()
+        finally:
+            await session.close()
+
+
+def run(names: list | None = None, daemon: bool = False):
+    """Run the given sources (default: filters.json "sources"), once or as a daemon."""
+    config = load_config()
+    filters = load_filters()
+    names = names or filters.get("sources", DEFAULT_FILTERS["sources"])
+
+    if not daemon:
+        asyncio.run(run_once(config, names))
+        return
+
+    asyncio.run(run_daemon(
+        "Job scraper",
+        lambda playwright: open_sources(playwright, config, names),
+        interval_minutes=float(filters.get("daemon_interval_minutes", DEFAULT_INTERVAL_MINUTES)),
+        recycle_cycles=int(filters.get("daemon_recycle_cycles", DEFAULT_RECYCLE_CYCLES)),
+        max_memory_mb=float(filters.get("daemon_max_memory_mb", DEFAULT_MAX_MEMORY_MB)),
+    ))
+
+
+if __name__ == "__main__":
+    # python runner.py [--daemon] [linkedin] [indeed]
+    args = sys.argv[1:]
+    run([arg for arg in args if not arg.startswith("--")], daemon="--daemon" in args)
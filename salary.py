@@ -0,0 +1,126 @@
+"""Salary parsing - turn pay text into numbers the filters can compare"""
+
+import re
+
+# Currency markers -> ISO code
+CURRENCIES = {"$": "USD", "usd": "USD", "£": "GBP", "gbp": "GBP", "€": "EUR", "eur": "EUR"}
+
+# One amount, optionally with a currency marker before it and a k/m/b multiplier after it
+AMOUNT = r"(?P<{c}>[$£€]|usd|gbp|eur)?\s*(?P<{n}>\d{{1,3}}(?:,\d{{3}})+(?:\.\d+)?|\d+(?:\.\d+)?)\s*(?P<{k}>[kmb]\b)?"
+SALARY_RE = re.compile(
+    AMOUNT.format(c="cur1", n="num1", k="k1")
+    + r"(?:\s*(?:/\s*(?:yr|year|hr|hour))?\s*(?:-|–|—|to)\s*"
+    + AMOUNT.format(c="cur2", n="num2", k="k2") + r")?"
+    + r"(?P<period>\s*(?:/\s*|(?:an?|per)\s+)?(?:year|yr|annum|annually|annual|hour|hr|hourly|month|mo|week|wk|day|daily)\b)?",
+    re.IGNORECASE,
+)
+
+# "$50 million" and the like
+BIG_NUMBER_RE = re.compile(r"\s*(?:million|billion|mm|bn)\b", re.IGNORECASE)
+
+# Words that mark a lone amount as pay rather than a stipend, bonus or budget
+PAY_WORDS_RE = re.compile(r"\b(?:salary|salaries|pay|compensation|base|wages?|ote)\b", re.IGNORECASE)
+PAY_CONTEXT_CHARS = 60
+
+PERIODS = {
+    "year": "year", "yr": "year", "annum": "year", "annually": "year", "annual": "year",
+    "hour": "hour", "hr": "hour", "hourly": "hour",
+    "month": "month", "mo": "month",
+    "week": "week", "wk": "week",
+    "day": "day", "daily": "day",
+}
+
+# Multipliers to a yearly figure (full-time: 40 h/week, 52 weeks)
+ANNUAL_FACTORS = {"year": 1, "month": 12, "week": 52, "day": 260, "hour": 2080}
+
+
+def _amount(number: str, multiplier: str | None) -> float:
+    value = float(number.replace(",", ""))
+    return value * 1000 if multiplier else value
+
+
+def parse_salary(text: str, pay_field: bool = False) -> dict | None:
+    """Parse the salary in `text` into {min, max, currency, period, text}.
+
+    Only amounts with a currency marker count, so years of experience and
+    other numbers in a description are not mistaken for pay. In free text, an
+    amount also needs an explicit period, a range, or a pay word ("salary",
+    "compensation", "base pay"...) shortly before it, which skips stipends and
+    relocation budgets; `pay_field` drops that requirement for a card's salary
+    line. Of several candidates, the one with the largest yearly figure wins.
+    Without an explicit period, amounts of 1,000 or more are taken as yearly;
+    smaller ones get no period rather than a guess.
+    """
+    best, best_annual = None, None
+    for salary in _candidates(text or "", pay_field):
+        annual = annual_amount(salary)
+        if best is None or (annual is not None and (best_annual is None or annual > best_annual)):
+            best, best_annual = salary, annual
+    return best
+
+
+def _candidates(text: str, pay_field: bool):
+    for match in SALARY_RE.finditer(text):
+        marker = match.group("cur1") or match.group("cur2")
+        if not marker:
+            continue
+        multipliers = {(match.group("k1") or "").lower(), (match.group("k2") or "").lower()}
+        if multipliers & {"m", "b"} or BIG_NUMBER_RE.match(text, match.end()):
+            continue  # Funding or revenue figures, not pay
+
+        low = _amount(match.group("num1"), match.group("k1"))
+        high = _amount(match.group("num2"), match.group("k2")) if match.group("num2") else low
+        # "$150-200K": the multiplier written once applies to both ends
+        if match.group("k2") and not match.group("k1") and low < 1000 <= high:
+            low *= 1000
+        if low <= 0:
+            continue
+
+        period_text = (match.group("period") or "").strip().lower()
+        # "/ yr", "a year", "per hour" -> the period word; "annually" keeps its "an"
+        period_word = re.sub(r"^(?:/\s*|(?:an?|per)\s+)", "", period_text)
+        period = PERIODS.get(period_word)
+        if not (pay_field or period or match.group("num2")
+                or PAY_WORDS_RE.search(text, max(0, match.start() - PAY_CONTEXT_CHARS), match.start())):
+            continue  # A lone amount with nothing saying it's pay
+        if period is None and high >= 1000:
+            period = "year"
+
+        # "From $120,000" / "Up to $60" keep the single bound on the right side
+        prefix = text[max(0, match.start() - 8):match.start()].lower()
+        low_bound, high_bound = min(low, high), max(low, high)
+        if not match.group("num2"):
+            if "up to" in prefix:
+                low_bound = None
+            elif "from" in prefix:
+                high_bound = None
+
+        yield {
+            "min": low_bound,
+            "max": high_bound,
+            "currency": CURRENCIES[marker.lower()],
+            "period": period,
+            "text": match.group(0).strip(),
+        }
+
+
+def annual_amount(salary: dict) -> float | None:
+    """The top of the range (or its only bound) converted to a yearly figure."""
+    value = salary.get("max") or salary.get("min")
+    factor = ANNUAL_FACTORS.get(salary.get("period"))
+    if value is None or factor is None:
+        return None
+    return value * factor
+
+
+def salary_passes(salary: dict | None, min_salary: float = 0, exclude_hourly: bool = False) -> bool:
+    """Numeric salary check. Jobs without a parsed salary pass; the keyword filters still see them."""
+    if not salary:
+        return True
+    if exclude_hourly and salary.get("period") == "hour":
+        return False
+    if min_salary:
+        annual = annual_amount(salary)
+        if annual is not None and annual < min_salary:
+            return False
+    return True
@@ -1,73 +1,60 @@
 """LinkedIn Job Scraper - Automated job search and email notifications"""
 
-import json
-import smtplib
+import asyncio
 import hashlib
-import subprocess
 import sys
 from datetime import datetime
-from pathlib import Path
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
-from playwright.sync_api import sync_playwright, Page
-
-# Directories
-DATA_DIR = Path(__file__).parent
-SEEN_JOBS_FILE = DATA_DIR / "seen_jobs.json"
-CONFIG_FILE = DATA_DIR / "config"
-FILTERS_FILE = DATA_DIR / "filters.json"
-
-# Default filters (used if filters.json doesn't exist)
-DEFAULT_FILTERS = {
-    "location_keywords": ["remote", "work from home", "wfh", "anywhere", "atlanta", "atl", ", ga", "georgia"],
-    "exclude_keywords": ["contractor", "contract", "freelance", "consultant", "hourly", "/hr", "per hour", "$/hour", "c2c", "corp to corp", "1099", "w2 contract", "temp", "temporary"],
-    "search_queries": ["data science director", "data science VP", "VP data science", "director of data science", "head of data science", "AI director", "ML director", "director machine learning"],
-    "time_filter": "Past week"
+from playwright.async_api import Browser, BrowserContext, Page
+
+from card_extractor import extract_cards
+from common import DEFAULT_FILTERS
+from crawl_state import record_successes
+from linkedin_guest import (
+    GUEST_BASE_URL, GuestClient, build_guest_search_path, fetch_job_description, parse_job_cards,
+)
+from linkedin_payloads import JobPayloadCollector
+from matching import JobFilters, KeywordMatcher, compile_filters
+from readiness import (
+    wait_for_count, wait_for_detail_job, wait_for_network_idle, wait_for_response, wait_for_url_contains,
+)
+from routing import RoutingStats, install_resource_blocking, load_routing_policy
+from salary import parse_salary
+from selector_stats import SelectorRegistry
+from session import open_linkedin_context, save_session
+from search_urls import (
+    TIME_FILTER_SECONDS, build_linkedin_search_url, format_window, linkedin_filter_params, linkedin_time_param,
+    search_windows,
+)
+from sources import Source
+from throttle import DomainThrottle, is_throttled, navigate, throttle_from_filters
+
+# Result list cards, and the per-card selector fallbacks for batched extraction
+JOB_CARD_SELECTORS = [
+    ".job-card-container",
+    ".jobs-search-results__list-item",
+    "[data-job-id]",
+]
+JOB_CARD_FIELDS = {
+    "title": {"selectors": [".job-card-list__title", ".artdeco-entity-lockup__title", "strong"]},
+    "company": {"selectors": [".job-card-container__primary-description", ".artdeco-entity-lockup__subtitle"]},
+    "location": {"selectors": [".job-card-container__metadata-item", ".artdeco-entity-lockup__caption"]},
+    "url": {"selectors": ["a[href*='/jobs/view/']"], "attribute": "href"},
+    "job_id": {"selectors": ["", "[data-job-id]"], "attribute": ["data-job-id", "data-occludable-job-id"]},
 }
 
+# Card locations that name a workplace type ("Atlanta, GA (Hybrid)")
+WORKPLACE_MARKERS = KeywordMatcher(["on-site", "onsite", "hybrid"])
 
-def load_filters() -> dict:
-    """Load filters from filters.json."""
-    if FILTERS_FILE.exists():
-        try:
-            return json.loads(FILTERS_FILE.read_text())
-        except json.JSONDecodeError:
-            pass
-    return DEFAULT_FILTERS
-
-
-def load_config() -> dict:
-    """Load configuration from config file."""
-    config = {}
-    if CONFIG_FILE.exists():
-        lines = CONFIG_FILE.read_text().strip().split("\n")
-        if len(lines) >= 4:
-            config["linkedin_email"] = lines[0].strip()
-            config["linkedin_password"] = lines[1].strip()
-            config["gmail_address"] = lines[2].strip()
-            config["gmail_app_password"] = lines[3].strip()
-    return config
-
-
-def load_seen_jobs() -> tuple[set, dict]:
-    """Load set of previously seen job IDs and their details."""
-    if SEEN_JOBS_FILE.exists():
-        data = json.loads(SEEN_JOBS_FILE.read_text())
-        # Support both old format (just IDs) and new format (with details)
-        if "jobs" in data:
-            return set(data["jobs"].keys()), data["jobs"]
-        else:
-            # Migrate from old format
-            return set(data.get("job_ids", [])), {}
-    return set(), {}
+# LinkedIn shows 25 results per search page
+RESULTS_PER_PAGE = 25
 
-
-def save_seen_jobs(jobs_dict: dict):
-    """Save seen jobs with their details to file."""
-    SEEN_JOBS_FILE.write_text(json.dumps({
-        "jobs": jobs_dict,
-        "last_updated": datetime.now().isoformat()
-    }, indent=2))
+# The results list scrolls inside its own pane; fall back to the window
+SCROLL_RESULTS_JS = """
+() => {
+    const pane = document.querySelector('.jobs-search-results-list, .scaffold-layout__list > div');
+    (pane || window).scrollBy(0, 800);
+}
+"""
 
 
 def extract_job_view_id(url: str) -> str:
@@ -89,22 +76,23 @@ def generate_job_id(job: dict) -> str:
     return hashlib.md5(unique_str.encode()).hexdigest()[:12]
 
 
-def auto_login(page: Page, email: str, password: str) -> bool:
+async def auto_login(page: Page, email: str, password: str) -> bool:
     """Automatically log in to LinkedIn."""
     try:
-        page.goto("https://www.linkedin.com/login", timeout=60000)
-        page.wait_for_timeout(3000)
+        await page.goto("https://www.linkedin.com/login", timeout=60000)
 
         # Check if already logged in
         if "/feed" in page.url or "/jobs" in page.url:
             return True
 
         # Wait for and fill login form
-        page.wait_for_selector('input[name="session_key"]', timeout=10000)
-        page.fill('input[name="session_key"]', email)
-        page.fill('input[name="session_password"]', password)
-        page.click('button[type="submit"]')
-        page.wait_for_timeout(5000)
+        await page.wait_for_selector('input[name="session_key"]', timeout=10000)
+        await page.fill('input[name="session_key"]', email)
+        await page.fill('input[name="session_password"]', password)
+        submitted = asyncio.ensure_future(wait_for_response(page, lambda r: "login-submit" in r.url, timeout=15000))
+        await page.click('button[type="submit"]')
+        await submitted
+        await wait_for_url_contains(page, ["/feed", "/jobs", "checkpoint", "challenge"], timeout=15000)
 
         # Check for verification challenge
         if "checkpoint" in page.url or "challenge" in page.url:
@@ -117,384 +105,531 @@ def auto_login(page: Page, email: str, password: str) -> bool:
         return False
 
 
-def search_jobs(page: Page, query: str, time_filter: str = "Past week") -> list[dict]:
-    """Search for jobs with the given query."""
+async def search_jobs(page: Page, query: str, window_seconds: int | None = TIME_FILTER_SECONDS["Past week"],
+                      capture: str = "network", seen_ids: set | None = None, max_pages: int = 1,
+                      job_filters: JobFilters | None = None, stats: dict | None = None,
+                      registry: SelectorRegistry | None = None, throttle: DomainThrottle | None = None,
+                      filter_params: dict | None = None, finished: set | None = None) -> list[dict]:
+    """Search for jobs with the given query, paging through results.
+
+    Only jobs posted within the last `window_seconds` are requested (None for
+    any time). The query is added to `finished` if every page loaded cleanly
+    and every new card's job was built; otherwise the next run searches the
+    same window again, so the failed cards are retried.
+
+    `filter_params` (from search_urls.linkedin_filter_params) narrow the search
+    on LinkedIn's side; the card prefilter and the shared filters still apply.
+
+    capture="network" builds jobs from the voyager JSON the page loads and only
+    touches the DOM for missing fields; capture="dom" clicks every card.
+
+    Cards whose view id is in `seen_ids` are skipped before any extraction, and
+    paging stops at the first page with nothing new. Processed ids are added to
+    `seen_ids` so concurrent queries don't extract the same job twice; ids whose
+    job couldn't be built are taken out again so a later run retries them.
+
+    Remaining cards go through cheap title/location checks (see prefilter_card)
+    and only the survivors get a detail load. Counts go into `stats`.
+    Result pages and posting fetches go through `throttle` when one is given.
+    """
     jobs = []
+    failed = []
+    seen_ids = set() if seen_ids is None else seen_ids
+    stats = new_pipeline_stats() if stats is None else stats
 
-    # Time filter mapping to LinkedIn's f_TPR parameter
-    # r86400 = past 24 hours, r604800 = past week, r2592000 = past month
-    time_param = ""
-    if time_filter == "Past 24 hours":
-        time_param = "&f_TPR=r86400"
-    elif time_filter == "Past week":
-        time_param = "&f_TPR=r604800"
-    elif time_filter == "Past month":
-        time_param = "&f_TPR=r2592000"
-    # "Any time" = no param
+    time_param = linkedin_time_param(window_seconds)
 
-    # Build search URL
-    search_url = f"https://www.linkedin.com/jobs/search/?keywords={query.replace(' ', '%20')}{time_param}"
+    collector = JobPayloadCollector()
+    if capture == "network":
+        collector.attach(page)
 
     try:
-        page.goto(search_url, timeout=60000)
-        page.wait_for_timeout(5000)  # Let page load
-
-        # Scroll to load jobs
-        for _ in range(2):
-            page.evaluate("window.scrollBy(0, 800)")
-            page.wait_for_timeout(1000)
-
-        # Find job cards
-        job_card_selectors = [
-            ".job-card-container",
-            ".jobs-search-results__list-item",
-            "[data-job-id]",
-        ]
-
-        job_cards = []
-        for selector in job_card_selectors:
-            job_cards = page.query_selector_all(selector)
-            if job_cards:
+        for page_num in range(max_pages):
+            # LinkedIn pages results with start= offsets
+            page_url = build_linkedin_search_url(query, time_param, filter_params, page_num * RESULTS_PER_PAGE)
+            cards, card_selector = await load_result_cards(page, page_url, registry, throttle)
+            if not cards:
                 break
 
-        for card in job_cards[:10]:  # Limit to 10 per query
-            try:
-                card.click()
-                page.wait_for_timeout(1500)
+            new_cards = [card for card in cards if not card["job_id"] or card["job_id"] not in seen_ids]
+            stats["cards"] += len(cards)
+            stats["seen"] += len(cards) - len(new_cards)
+            if not new_cards:
+                print(f"  {query}: page {page_num + 1} has only seen jobs, stopping")
+                break
+            seen_ids.update(card["job_id"] for card in new_cards if card["job_id"])
 
-                job = extract_job(page, card)
-                if job and job.get("title"):
-                    jobs.append(job)
-            except:
-                continue
+            jobs.extend(await extract_result_page(page, new_cards, card_selector, collector, capture,
+                                                  job_filters, stats, seen_ids, throttle, failed))
 
+            if len(cards) < RESULTS_PER_PAGE:
+                break  # Last page of results
+
+        if failed:
+            print(f"  {query}: {len(failed)} jobs failed to load, searching the same window next run")
+        elif finished is not None:
+            finished.add(query)
     except Exception as e:
         print(f"Search error for '{query}': {e}")
+    finally:
+        if capture == "network":
+            collector.detach(page)
 
     return jobs
 
 
-def extract_job(page: Page, card) -> dict | None:
-    """Extract job details from the page."""
-    try:
-        # Title selectors
-        title = ""
-        for sel in [".job-card-list__title", ".artdeco-entity-lockup__title", "strong"]:
-            el = card.query_selector(sel)
-            if el:
-                title = el.inner_text().strip()
-                break
+async def load_result_cards(page: Page, url: str, registry: SelectorRegistry | None = None,
+                            throttle: DomainThrottle | None = None) -> tuple[list[dict], str | None]:
+    """Open a results page, let the list fill in, and read every card's fields in one round trip."""
+    response = await navigate(page, url, throttle)
+    if is_throttled(response.status if response else None, page.url):
+        # Not an empty result: the search has to count as failed so its window isn't skipped next run
+        raise RuntimeError(f"LinkedIn is throttling or challenging this session ({page.url})")
 
-        # Company selectors
-        company = ""
-        for sel in [".job-card-container__primary-description", ".artdeco-entity-lockup__subtitle"]:
-            el = card.query_selector(sel)
-            if el:
-                company = el.inner_text().strip()
-                break
+    any_card = ", ".join(JOB_CARD_SELECTORS)
 
-        # Location
-        location = ""
-        for sel in [".job-card-container__metadata-item", ".artdeco-entity-lockup__caption"]:
-            el = card.query_selector(sel)
-            if el:
-                location = el.inner_text().strip()
-                break
+    # Wait for the results list instead of a fixed page-load sleep
+    count = await wait_for_count(page, any_card, 1, timeout=15000)
+    if not count:
+        return [], None
 
-        # Description from details panel
-        description = ""
-        for sel in [".jobs-description-content__text", ".jobs-description__content", "#job-details"]:
-            el = page.query_selector(sel)
-            if el:
-                description = el.inner_text().strip()[:2000]  # Limit length
-                break
+    # Scroll the results list to load more cards, waiting for them rather than sleeping
+    for _ in range(RESULTS_PER_PAGE // 5):
+        await page.evaluate(SCROLL_RESULTS_JS)
+        new_count = await wait_for_count(page, any_card, count + 1, timeout=1000)
+        if new_count <= count:
+            break
+        count = new_count
 
-        # URL
-        job_url = ""
-        link_el = card.query_selector("a[href*='/jobs/view/']")
-        if link_el:
-            job_url = link_el.get_attribute("href")
-        if not job_url:
-            job_id = card.get_attribute("data-job-id")
-            if job_id:
-                job_url = f"https://www.linkedin.com/jobs/view/{job_id}/"
-        if job_url and not job_url.startswith("http"):
-            job_url = f"https://www.linkedin.com{job_url}"
-        # Clean URL - strip tracking parameters
-        if job_url and "/jobs/view/" in job_url:
-            job_view_id = extract_job_view_id(job_url)
-            job_url = f"https://www.linkedin.com/jobs/view/{job_view_id}/"
-
-        if not title:
-            return None
+    return await extract_cards(page, JOB_CARD_SELECTORS, JOB_CARD_FIELDS, limit=RESULTS_PER_PAGE,
+                               registry=registry, site="linkedin")
 
-        return {
-            "title": title,
-            "company": company,
-            "location": location,
-            "description": description,
-            "url": job_url,
-            "scraped_at": datetime.now().isoformat(),
-        }
-    except Exception as e:
-        return None
 
+def new_pipeline_stats() -> dict:
+    """Per-phase counters for the card -> prefilter -> detail pipeline."""
+    return {"cards": 0, "seen": 0, "title_rejected": 0, "location_rejected": 0, "detail_loads": 0}
 
-def is_location_match(location: str, description: str, location_keywords: list) -> bool:
-    """Check if job matches any location keywords."""
-    location_lower = location.lower()
-    description_lower = description.lower()
 
-    for keyword in location_keywords:
-        keyword_lower = keyword.lower()
-        if keyword_lower in location_lower or keyword_lower in description_lower:
-            return True
+def format_pipeline_stats(stats: dict) -> str:
+    """One-line summary of how much detail work the cheap phases avoided."""
+    avoided = stats["cards"] - stats["detail_loads"]
+    return (f"Cards: {stats['cards']} | already seen: {stats['seen']} | "
+            f"rejected by title: {stats['title_rejected']} | rejected by location: {stats['location_rejected']} | "
+            f"detail loads: {stats['detail_loads']} ({avoided} avoided)")
 
-    return False
 
+def prefilter_card(card: dict, job_filters: JobFilters | None) -> str | None:
+    """Cheap checks on card-level fields. Returns the reject reason, or None to keep the card.
 
-def is_full_time_employee(title: str, description: str, exclude_keywords: list) -> bool:
-    """Check if job is a full-time employee position (not hourly/contractor)."""
-    title_lower = title.lower()
-    description_lower = description.lower()
+    An excluded keyword in the title is rejected exactly as the full filter
+    would. The location check is stricter than the full filter: a card marked
+    on-site or hybrid whose location matches no location keyword is dropped
+    before its description is read, even though the full filter would keep it
+    if the description mentioned a location keyword (e.g. "remote-friendly team").
+    Office jobs elsewhere are the point of that rule, at the cost of those rare cases.
+    """
+    if job_filters is None:
+        return None
 
-    for keyword in exclude_keywords:
-        keyword_lower = keyword.lower()
-        if keyword_lower in title_lower or keyword_lower in description_lower:
-            return False
+    title = card.get("title", "")
+    if title and not job_filters.is_full_time(title):
+        return "title"
 
-    return True
-
-
-def send_email(config: dict, new_jobs: list[dict]):
-    """Send email notification about new jobs."""
-    if not new_jobs:
-        return
-
-    gmail = config.get("gmail_address")
-    app_password = config.get("gmail_app_password")
-
-    if not gmail or not app_password:
-        print("Email not configured. Skipping notification.")
-        return
-
-    # Build email content
-    subject = f"🎯 {len(new_jobs)} New Data Science Leadership Jobs Found"
-
-    # Create local HTML file that opens all jobs in tabs
-    job_urls = [job.get('url', '') for job in new_jobs if job.get('url')]
-    job_items = []
-    for job in new_jobs:
-        url = job.get('url', '')
-        title = job.get('title', 'Unknown')
-        company = job.get('company', 'Unknown')
-        if url:
-            job_items.append(f'<li style="margin: 10px 0;"><a href="{url}" target="_blank" style="font-size: 16px;">{title}</a> - {company}</li>')
-
-    open_all_html = f"""<!DOCTYPE html>
-<html>
-<head>
-    <title>Open All Jobs</title>
-    <style>
-        body {{ font-family: Arial, sans-serif; max-width: 800px; margin: 40px auto; padding: 20px; }}
-        .open-all {{ background: #0066cc; color: white; padding: 15px 30px; font-size: 18px; border: none; border-radius: 5px; cursor: pointer; margin: 20px 0; }}
-        .open-all:hover {{ background: #0052a3; }}
-        ul {{ list-style: none; padding: 0; }}
-    </style>
-</head>
-<body>
-<h1>{len(job_urls)} New Jobs Found</h1>
-<button class="open-all" onclick="openAll()">Click Here to Open All {len(job_urls)} Jobs in New Tabs</button>
-<p style="color: #666;">If pop-ups are blocked, allow pop-ups for this page and click again, or click each link below:</p>
-<ul>
-{"".join(job_items)}
-</ul>
-<script>
-var urls = {json.dumps(job_urls)};
-function openAll() {{
-    urls.forEach(function(u) {{ window.open(u, '_blank'); }});
-}}
-</script>
-</body>
-</html>"""
-
-    open_all_file = DATA_DIR / "open_all_jobs.html"
-    open_all_file.write_text(open_all_html)
-
-    html_content = f"""
-    <html>
-    <body style="font-family: Arial, sans-serif; max-width: 600px;">
-    <h2>New Job Postings Found</h2>
-    <p>The following jobs were posted in the last 24 hours:</p>
-    <p style="margin: 15px 0; padding: 10px; background: #f0f0f0; border-radius: 5px;">
-        <strong>Open all jobs at once:</strong> Run <code>open ~/Code/linkedin_scrape/open_all_jobs.html</code> in Terminal
-    </p>
-    """
+    location = card.get("location", "")
+    if job_filters.location and WORKPLACE_MARKERS.search(location) and not job_filters.location_match(location):
+        return "location"
+
+    return None
+
+
+async def extract_result_page(page: Page, cards: list[dict], card_selector: str, collector: JobPayloadCollector,
+                              capture: str = "network", job_filters: JobFilters | None = None,
+                              stats: dict | None = None, seen_ids: set | None = None,
+                              throttle: DomainThrottle | None = None, failed: list | None = None) -> list[dict]:
+    """Turn one page of batched card fields into job dicts.
 
-    for job in new_jobs:
-        html_content += f"""
-        <div style="border: 1px solid #ddd; padding: 15px; margin: 10px 0; border-radius: 8px;">
-            <h3 style="margin: 0 0 5px 0;">
-                <a href="{job.get('url', '#')}" style="color: #0066cc;">{job.get('title', 'Unknown')}</a>
-            </h3>
-            <p style="margin: 5px 0; color: #666;">
-                <strong>{job.get('company', 'Unknown')}</strong> • {job.get('location', 'Unknown')}
-            </p>
-            <p style="margin: 10px 0; font-size: 14px; color: #444;">
-                {job.get('description', '')[:300]}...
-            </p>
-        </div>
-        """
-
-    html_content += """
-    <p style="color: #888; font-size: 12px; margin-top: 20px;">
-        Sent by LinkedIn Job Scraper
-    </p>
-    </body>
-    </html>
+    Phase 1 settles card-level fields and prefilters them; phase 2 loads the
+    description (captured JSON, a posting fetch, or a card click) for survivors only.
+    Cards whose job couldn't be built are removed from `seen_ids` and added to
+    `failed`. Posting fetches go through `throttle` when one is given.
     """
+    jobs = []
+    stats = new_pipeline_stats() if stats is None else stats
+
+    # Phase 1: card-level fields only
+    if capture == "network":
+        await collector.settle()
+    survivors = []
+    for card in cards:
+        data = collector.jobs.get(card["job_id"], {}) if card["job_id"] else {}
+        for key in ("title", "company", "location"):
+            # Captured JSON wins; the card DOM only fills gaps
+            card[key] = data.get(key) or card[key]
+
+        reason = prefilter_card(card, job_filters)
+        if reason:
+            stats[f"{reason}_rejected"] += 1
+        else:
+            survivors.append(card)
 
-    # Plain text version
-    text_content = f"Found {len(new_jobs)} new jobs:\n\n"
-    for job in new_jobs:
-        text_content += f"• {job.get('title')} at {job.get('company')}\n  {job.get('url')}\n\n"
+    # Phase 2: detail loads for survivors
+    if capture == "network":
+        await collector.fetch_missing(page.context, [card["job_id"] for card in survivors if card["job_id"]],
+                                      throttle=throttle)
 
-    # Create message
-    msg = MIMEMultipart("alternative")
-    msg["Subject"] = subject
-    msg["From"] = gmail
-    msg["To"] = gmail
-    msg.attach(MIMEText(text_content, "plain"))
-    msg.attach(MIMEText(html_content, "html"))
+    for card in survivors:
+        try:
+            stats["detail_loads"] += 1
+            data = collector.jobs.get(card["job_id"], {}) if card["job_id"] else {}
+            if data.get("description"):
+                job = await extract_job(page, card, description=data["description"])
+            else:
+                # Nothing usable in the payloads - open the card in the detail panel
+                await page.locator(card_selector).nth(card["index"]).click()
+                if card["job_id"]:
+                    await wait_for_detail_job(page, card["job_id"], timeout=5000)
+                else:
+                    await wait_for_network_idle(page, timeout=3000)
+                job = await extract_job(page, card)
+
+            if job and job.get("title"):
+                jobs.append(job)
+                continue
+        except:
+            pass
+        if seen_ids is not None:
+            seen_ids.discard(card["job_id"])
+        if failed is not None:
+            failed.append(card)
 
-    # Send email
+    return jobs
+
+
+async def extract_job(page: Page, card: dict, description: str | None = None) -> dict | None:
+    """Build a job dict from batched card fields plus the description.
+
+    The description is read from the detail panel unless one is passed in.
+    """
     try:
-        with smtplib.SMTP_SSL("smtp.gmail.com", 465) as server:
-            server.login(gmail, app_password)
-            server.send_message(msg)
-        print(f"✓ Email sent with {len(new_jobs)} jobs")
+        # Description from details panel
+        if description is None:
+            description = ""
+            for sel in [".jobs-description-content__text", ".jobs-description__content", "#job-details"]:
+                el = await page.query_selector(sel)
+                if el:
+                    description = (await el.inner_text()).strip()[:2000]  # Limit length
+                    break
+
+        return build_job(card, description)
     except Exception as e:
-        print(f"✗ Failed to send email: {e}")
+        return None
+
 
+def build_job(card: dict, description: str) -> dict | None:
+    """Job dict from card fields and a description; None without a title."""
+    title = card.get("title", "")
 
-def run_scraper():
-    """Main function to run the job scraper."""
-    print(f"\n{'='*50}")
-    print(f"LinkedIn Job Scraper - {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print(f"{'='*50}\n")
+    # URL
+    job_url = card.get("url", "")
+    if not job_url and card.get("job_id"):
+        job_url = f"https://www.linkedin.com/jobs/view/{card['job_id']}/"
+    if job_url and not job_url.startswith("http"):
+        job_url = f"https://www.linkedin.com{job_url}"
+    # Clean URL - strip tracking parameters
+    if job_url and "/jobs/view/" in job_url:
+        job_view_id = extract_job_view_id(job_url)
+        job_url = f"https://www.linkedin.com/jobs/view/{job_view_id}/"
 
-    # Load config
-    config = load_config()
-    if not config.get("linkedin_email") or not config.get("linkedin_password"):
-        print("ERROR: LinkedIn credentials not found in config file")
-        return
+    if not title:
+        return None
 
-    # Load previously seen jobs
-    seen_job_ids, seen_jobs_dict = load_seen_jobs()
-    print(f"Loaded {len(seen_job_ids)} previously seen job IDs")
+    return {
+        "title": title,
+        "company": card.get("company", ""),
+        "location": card.get("location", ""),
+        "description": description,
+        "url": job_url,
+        "salary": parse_salary(description),  # LinkedIn only states pay inside the description
+        "scraped_at": datetime.now().isoformat(),
+    }
 
-    # Load filters
-    filters = load_filters()
 
-    all_jobs = []
+async def search_all_queries(context: BrowserContext, queries: list, concurrency: int = 3,
+                             windows: dict | None = None, **search_options) -> list[dict]:
+    """Run search queries concurrently, one worker page per concurrency slot.
 
-    with sync_playwright() as playwright:
-        browser = playwright.chromium.launch(
-            headless=True,  # Run headless for cron
-        )
-        context = browser.new_context(
-            viewport={"width": 1280, "height": 900},
-            user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+    `search_options` are passed to search_jobs, plus each query's
+    `window_seconds` from `windows` if given. All workers share the same
+    `seen_ids` set and `stats` dict, so a job is extracted at most once per run.
+    """
+    search_options.setdefault("seen_ids", set())
+    search_options.setdefault("stats", new_pipeline_stats())
+    queue = asyncio.Queue()
+    for query in queries:
+        queue.put_nowait(query)
+    results = {}
+
+    async def worker():
+        page = await context.new_page()
+        try:
+            while not queue.empty():
+                query = queue.get_nowait()
+                options = {**search_options, "window_seconds": windows.get(query)} if windows else search_options
+                jobs = await search_jobs(page, query, **options)
+                window = f" ({format_window(options['window_seconds'])})" if "window_seconds" in options else ""
+                print(f"  {query}: found {len(jobs)} jobs{window}")
+                results[query] = jobs
+        finally:
+            await page.close()
+
+    workers = max(1, min(concurrency, len(queries)))
+    await asyncio.gather(*(worker() for _ in range(workers)))
+
+    # Keep results in query order regardless of which worker finished first
+    return [job for query in queries for job in results.get(query, [])]
+
+
+async def open_scraper_context(browser, config: dict, filters: dict) -> tuple[BrowserContext | None, RoutingStats | None]:
+    """Log in (or reuse the saved session) and install request blocking on the context."""
+    print("Logging in to LinkedIn...")
+    context = await open_linkedin_context(
+        browser, config["linkedin_email"], config["linkedin_password"], auto_login,
+        viewport={"width": 1280, "height": 900},
+        user_agent="Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36"
+    )
+    if not context:
+        print("Login failed!")
+        return None, None
+    print("✓ Logged in successfully\n")
+
+    routing_stats = await install_resource_blocking(context, *load_routing_policy(filters))
+    return context, routing_stats
+
+
+async def scrape_linkedin(context: BrowserContext, filters: dict, seen_ids: set | None = None,
+                          throttle: DomainThrottle | None = None) -> list[dict]:
+    """Run all search queries in a shared, logged-in browser context.
+
+    `seen_ids` holds LinkedIn view ids to skip without extracting; ids processed
+    during the run (extracted or prefiltered out) are added to it. Pass a
+    `throttle` to keep its learned request rate across runs.
+    """
+    # Get search queries and time filter from filters
+    search_queries = filters.get("search_queries", DEFAULT_FILTERS["search_queries"])
+    time_filter = filters.get("time_filter", "Past week")
+    concurrency = int(filters.get("max_concurrent_searches", DEFAULT_FILTERS["max_concurrent_searches"]))
+    capture = filters.get("linkedin_capture", DEFAULT_FILTERS["linkedin_capture"])
+    max_pages = int(filters.get("max_pages", DEFAULT_FILTERS["max_pages"]))
+    filter_params = linkedin_filter_params(filters)
+    windows = search_windows(filters, "linkedin", search_queries)
+    print(f"Time filter: {time_filter}")
+    if filter_params:
+        print(f"Search filters: {filter_params}")
+    print(f"Searching {len(search_queries)} queries, {concurrency} at a time, up to {max_pages} pages each\n")
+
+    stats = new_pipeline_stats()
+    registry = SelectorRegistry()
+    throttle = throttle or throttle_from_filters(filters, concurrency)
+    finished = set()
+    started = datetime.now()
+    all_jobs = await search_all_queries(
+        context, search_queries, concurrency, windows,
+        capture=capture,
+        seen_ids=set() if seen_ids is None else seen_ids,
+        max_pages=max_pages,
+        job_filters=compile_filters(filters),
+        stats=stats,
+        registry=registry,
+        throttle=throttle,
+        filter_params=filter_params,
+        finished=finished,
+    )
+
+    # Persist refreshed cookies, selector stats and completed searches for the next run
+    await save_session(context)
+    registry.save()
+    record_successes("linkedin", finished, started)
+
+    print(f"\n{format_pipeline_stats(stats)}")
+    return all_jobs
+
+
+async def search_guest_jobs(client: GuestClient, query: str,
+                            window_seconds: int | None = TIME_FILTER_SECONDS["Past week"],
+                            seen_ids: set | None = None, max_pages: int = 1, location: str = "",
+                            job_filters: JobFilters | None = None, stats: dict | None = None,
+                            filter_params: dict | None = None, finished: set | None = None) -> list[dict]:
+    """search_jobs over LinkedIn's guest endpoints: same paging, seen-id skipping and prefilter, no browser.
+
+    As there, the query only counts as finished if no posting failed to load.
+    """
+    jobs = []
+    failed = []
+    seen_ids = set() if seen_ids is None else seen_ids
+    stats = new_pipeline_stats() if stats is None else stats
+    time_param = linkedin_time_param(window_seconds)
+    start = 0
+
+    try:
+        for page_num in range(max_pages):
+            status, html = await client.get(build_guest_search_path(query, time_param, start, location, filter_params))
+            if status != 200:
+                print(f"  {query}: guest search returned HTTP {status}, stopping")
+                return jobs
+            cards = parse_job_cards(html)
+            if not cards:
+                break
+
+            new_cards = [card for card in cards if card["job_id"] not in seen_ids]
+            stats["cards"] += len(cards)
+            stats["seen"] += len(cards) - len(new_cards)
+            if not new_cards:
+                print(f"  {query}: page {page_num + 1} has only seen jobs, stopping")
+                break
+            seen_ids.update(card["job_id"] for card in new_cards)
+
+            survivors = []
+            for card in new_cards:
+                reason = prefilter_card(card, job_filters)
+                if reason:
+                    stats[f"{reason}_rejected"] += 1
+                else:
+                    survivors.append(card)
+
+            # Guest card links carry a slug and tracking params; the view id is enough
+            stats["detail_loads"] += len(survivors)
+            descriptions = await asyncio.gather(*(fetch_job_description(client, card["job_id"]) for card in survivors))
+            for card, description in zip(survivors, descriptions):
+                job = build_job({**card, "url": f"/jobs/view/{card['job_id']}/"}, description[:2000])
+                if job:
+                    jobs.append(job)
+                if not (job and description):
+                    seen_ids.discard(card["job_id"])  # Retry next run rather than judge it without a description
+                    failed.append(card)
+
+            # Guest pages are smaller than logged-in ones; advance by what was actually returned
+            start += len(cards)
+
+        if failed:
+            print(f"  {query}: {len(failed)} postings failed to load, searching the same window next run")
+        elif finished is not None:
+            finished.add(query)
+    except Exception as e:
+        print(f"Guest search error for '{query}': {e}")
+
+    return jobs
+
+
+async def scrape_linkedin_guest(client: GuestClient, filters: dict, seen_ids: set | None = None) -> list[dict]:
+    """scrape_linkedin without a browser: all queries run at once, bounded by the client's pool size."""
+    search_queries = filters.get("search_queries", DEFAULT_FILTERS["search_queries"])
+    time_filter = filters.get("time_filter", "Past week")
+    max_pages = int(filters.get("max_pages", DEFAULT_FILTERS["max_pages"]))
+    filter_params = linkedin_filter_params(filters)
+    windows = search_windows(filters, "linkedin", search_queries)
+    print(f"Time filter: {time_filter}")
+    if filter_params:
+        print(f"Search filters: {filter_params}")
+    print(f"Searching {len(search_queries)} queries via guest endpoints, up to {max_pages} pages each\n")
+
+    stats = new_pipeline_stats()
+    seen_ids = set() if seen_ids is None else seen_ids
+    finished = set()
+    started = datetime.now()
+    job_filters = compile_filters(filters)
+
+    async def run_query(query: str) -> list[dict]:
+        jobs = await search_guest_jobs(
+            client, query, windows[query],
+            seen_ids=seen_ids,
+            max_pages=max_pages,
+            location=filters.get("guest_location", ""),
+            job_filters=job_filters,
+            stats=stats,
+            filter_params=filter_params,
+            finished=finished,
         )
-        page = context.new_page()
-
-        # Login
-        print("Logging in to LinkedIn...")
-        if not auto_login(page, config["linkedin_email"], config["linkedin_password"]):
-            print("Login failed!")
-            browser.close()
-            return
-        print("✓ Logged in successfully\n")
-
-        # Get search queries and time filter from filters
-        search_queries = filters.get("search_queries", DEFAULT_FILTERS["search_queries"])
-        time_filter = filters.get("time_filter", "Past week")
-        print(f"Time filter: {time_filter}\n")
-
-        for query in search_queries:
-            print(f"Searching: {query}")
-            jobs = search_jobs(page, query, time_filter)
-            print(f"  Found {len(jobs)} jobs")
-            all_jobs.extend(jobs)
-
-        browser.close()
-
-    # Deduplicate jobs
-    unique_jobs = {}
-    for job in all_jobs:
-        job_id = generate_job_id(job)
-        if job_id not in unique_jobs:
-            job["id"] = job_id
-            unique_jobs[job_id] = job
-
-    print(f"\nTotal unique jobs found: {len(unique_jobs)}")
-
-    # Get filter keywords
-    location_keywords = filters.get("location_keywords", DEFAULT_FILTERS["location_keywords"])
-    exclude_keywords = filters.get("exclude_keywords", DEFAULT_FILTERS["exclude_keywords"])
-
-    # Filter by location keywords
-    location_filtered = {
-        job_id: job for job_id, job in unique_jobs.items()
-        if is_location_match(job.get("location", ""), job.get("description", ""), location_keywords)
-    }
-    print(f"Jobs matching location filter: {len(location_filtered)}")
+        print(f"  {query}: found {len(jobs)} jobs ({format_window(windows[query])})")
+        return jobs
 
-    # Filter out excluded keywords (contractor/hourly)
-    fte_filtered = {
-        job_id: job for job_id, job in location_filtered.items()
-        if is_full_time_employee(job.get("title", ""), job.get("description", ""), exclude_keywords)
-    }
-    print(f"Jobs after exclusion filter: {len(fte_filtered)}")
-
-    # Filter to new jobs only
-    new_jobs = [job for job_id, job in fte_filtered.items() if job_id not in seen_job_ids]
-    print(f"New jobs (not seen before): {len(new_jobs)}")
-
-    if new_jobs:
-        # Send email notification
-        send_email(config, new_jobs)
-
-        # Update seen jobs with full details (only filtered jobs)
-        for job_id, job in fte_filtered.items():
-            seen_jobs_dict[job_id] = {
-                "title": job.get("title"),
-                "company": job.get("company"),
-                "location": job.get("location"),
-                "url": job.get("url"),
-                "scraped_at": job.get("scraped_at"),
-            }
-        save_seen_jobs(seen_jobs_dict)
-
-        # Print new jobs
-        print("\n📋 New Jobs Found:")
-        for job in new_jobs:
-            print(f"  • {job['title']} at {job['company']}")
-            print(f"    {job['url']}\n")
-
-        # Open all jobs in browser if running interactively (not cron)
-        if sys.stdout.isatty():
-            open_all_file = DATA_DIR / "open_all_jobs.html"
-            if open_all_file.exists():
-                print("Opening all jobs in browser...")
-                subprocess.run(["open", str(open_all_file)])
-    else:
-        print("\nNo new jobs found.")
-
-    print(f"\n{'='*50}")
-    print("Scraper finished")
-    print(f"{'='*50}\n")
+    # gather keeps results in query order
+    results = await asyncio.gather(*(run_query(query) for query in search_queries))
+    record_successes("linkedin", finished, started)
+
+    print(f"\n{format_pipeline_stats(stats)}")
+    return [job for jobs in results for job in jobs]
+
+
+class LinkedInSource(Source):
+    """LinkedIn through a logged-in browser context, or the guest endpoints with "linkedin_source": "guest"."""
+
+    name = "linkedin"
+
+    def __init__(self):
+        self.context = None
+        self.routing_stats = None
+        self.client = None
+        self.throttle = None
+
+    @staticmethod
+    def guest_mode(filters: dict) -> bool:
+        return filters.get("linkedin_source", DEFAULT_FILTERS["linkedin_source"]) == "guest"
+
+    def needs_browser(self, filters: dict) -> bool:
+        return not self.guest_mode(filters)
+
+    async def open(self, browser: Browser | None, config: dict, filters: dict) -> bool:
+        if self.guest_mode(filters):
+            pool_size = int(filters.get("guest_concurrency", DEFAULT_FILTERS["guest_concurrency"]))
+            # Kept for the source's lifetime so a daemon keeps the rate it has learned
+            self.throttle = throttle_from_filters(filters, pool_size)
+            self.client = GuestClient(
+                filters.get("guest_base_url", GUEST_BASE_URL),
+                pool_size=pool_size,
+                throttle=self.throttle,
+            )
+            return True
+
+        if not config.get("linkedin_email") or not config.get("linkedin_password"):
+            print("ERROR: LinkedIn credentials not found in config file")
+            return False
+        self.context, self.routing_stats = await open_scraper_context(browser, config, filters)
+        self.throttle = throttle_from_filters(
+            filters, int(filters.get("max_concurrent_searches", DEFAULT_FILTERS["max_concurrent_searches"])))
+        return self.context is not None
+
+    def known_keys(self, seen_jobs: dict) -> set:
+        return {
+            extract_job_view_id(job.get("url") or "") for job in seen_jobs.values()
+            if "/jobs/view/" in (job.get("url") or "")
+        }
+
+    async def search(self, filters: dict, seen_keys: set) -> list[dict]:
+        if self.client:
+            jobs = await scrape_linkedin_guest(self.client, filters, seen_keys)
+            print(f"Rate limits: {self.throttle.summary()}")
+            return jobs
+        jobs = await scrape_linkedin(self.context, filters, seen_keys, self.throttle)
+        print(f"Rate limits: {self.throttle.summary()}")
+        print(self.routing_stats.summary())
+        self.routing_stats.reset()
+        return jobs
+
+    def job_id(self, job: dict) -> str:
+        return generate_job_id(job)
+
+    async def close(self):
+        if self.client:
+            await self.client.close()
+        if self.context:
+            await self.context.close()
+
+
+def run_scraper(daemon: bool = False):
+    """Run the LinkedIn source on its own, once or as a daemon."""
+    from runner import run  # runner imports this module
+    run(["linkedin"], daemon=daemon)
 
 
 if __name__ == "__main__":
-    run_scraper()
+    run_scraper(daemon="--daemon" in sys.argv[1:])
@@ -0,0 +1,198 @@
+"""Search URL builders - push filters.json settings into each board's own search parameters"""
+
+from datetime import datetime
+from urllib.parse import urlencode
+
+from common import DEFAULT_FILTERS
+from crawl_state import last_successes, load_crawl_state
+
+LINKEDIN_SEARCH_URL = "https://www.linkedin.com/jobs/search/"
+
+# time_filter -> longest search window in seconds ("Any time" has none)
+TIME_FILTER_SECONDS = {
+    "Past 24 hours": 86400,
+    "Past week": 604800,
+    "Past month": 2592000,
+}
+
+# filters.json values -> LinkedIn facet codes
+LINKEDIN_WORK_TYPES = {"onsite": "1", "remote": "2", "hybrid": "3"}
+LINKEDIN_JOB_TYPES = {
+    "full-time": "F",
+    "part-time": "P",
+    "contract": "C",
+    "temporary": "T",
+    "internship": "I",
+    "volunteer": "V",
+    "other": "O",
+}
+LINKEDIN_EXPERIENCE_LEVELS = {
+    "internship": "1",
+    "entry": "2",
+    "associate": "3",
+    "mid-senior": "4",
+    "director": "5",
+    "executive": "6",
+}
+
+
+def search_windows(filters: dict, source: str, search_keys: list) -> dict:
+    """Search window in seconds per search key (None = any time).
+
+    With "incremental_search" on, a search that completed before only looks
+    back to its last successful run plus "incremental_margin_minutes", never
+    further than `time_filter`. New searches get the full `time_filter` window.
+    """
+    full_window = TIME_FILTER_SECONDS.get(filters.get("time_filter", DEFAULT_FILTERS["time_filter"]))
+    windows = dict.fromkeys(search_keys, full_window)
+    if not filters.get("incremental_search", DEFAULT_FILTERS["incremental_search"]):
+        return windows
+
+    margin = float(filters.get("incremental_margin_minutes", DEFAULT_FILTERS["incremental_margin_minutes"])) * 60
+    now = datetime.now()
+    for key, last_run in last_successes(load_crawl_state(), source).items():
+        if key in windows:
+            since = int((now - datetime.fromisoformat(last_run)).total_seconds() + margin)
+            windows[key] = since if full_window is None else min(full_window, since)
+    return windows
+
+
+def format_window(window_seconds: int | None) -> str:
+    if not window_seconds:
+        return "any time"
+    hours = window_seconds / 3600
+    return f"{hours:.1f}h" if hours < 48 else f"{hours / 24:.0f}d"
+
+
+def linkedin_time_param(window_seconds: int | None) -> str:
+    """f_TPR value for jobs posted within the window, e.g. "r604800" for a week; "" for any time."""
+    return f"r{int(window_seconds)}" if window_seconds else ""
+
+
+def indeed_fromage(window_seconds: int | None) -> str:
+    """Smallest fromage bucket covering the window; "" for any time or anything past the largest bucket."""
+    if not window_seconds:
+        return ""
+    for days in INDEED_FROMAGE_DAYS:
+        if window_seconds <= days * 86400:
+            return str(days)
+    return ""
+
+
+def _normalize(value: str) -> str:
+    """"Full time", "full_time" and "On-site" -> "full-time" / "onsite" style keys."""
+    value = str(value).strip().lower().replace("_", "-").replace(" ", "-")
+    return "onsite" if value in ("on-site", "in-office", "office") else value
+
+
+def _facet(values: list, codes: dict) -> str:
+    """Comma-joined codes for the values LinkedIn knows, in code order; unknown values are skipped."""
+    matched = {codes[_normalize(value)] for value in values or [] if _normalize(value) in codes}
+    return ",".join(sorted(matched))
+
+
+def linkedin_filter_params(filters: dict) -> dict:
+    """LinkedIn search parameters for the configured work types, job types, experience levels and geoId.
+
+    Only settings that are present produce a parameter, so an empty config
+    searches everything and the client-side filters do all the work.
+    """
+    facets = {
+        "f_WT": _facet(filters.get("work_types", DEFAULT_FILTERS["work_types"]), LINKEDIN_WORK_TYPES),
+        "f_JT": _facet(filters.get("job_types", DEFAULT_FILTERS["job_types"]), LINKEDIN_JOB_TYPES),
+        "f_E": _facet(filters.get("experience_levels", DEFAULT_FILTERS["experience_levels"]),
+                      LINKEDIN_EXPERIENCE_LEVELS),
+        "geoId": str(filters.get("linkedin_geo_id", DEFAULT_FILTERS["linkedin_geo_id"]) or ""),
+    }
+    return {key: value for key, value in facets.items() if value}
+
+
+def build_linkedin_search_url(query: str, time_param: str = "", filter_params: dict | None = None,
+                              start: int = 0) -> str:
+    """Logged-in search URL. `time_param` is an f_TPR value like "r604800"; `filter_params` from linkedin_filter_params."""
+    params = {"keywords": query}
+    if time_param:
+        params["f_TPR"] = time_param
+    params.update(filter_params or {})
+    if start:
+        params["start"] = start
+    return f"{LINKEDIN_SEARCH_URL}?{urlencode(params)}"
+
+
+INDEED_SEARCH_URL = "https://www.indeed.com/jobs"
+
+# filters.json values -> Indeed's jt parameter (it takes a single job type)
+INDEED_JOB_TYPES = {
+    "full-time": "fulltime",
+    "part-time": "parttime",
+    "contract": "contract",
+    "temporary": "temporary",
+    "internship": "internship",
+}
+
+# Indeed's remote and hybrid job attributes, sent in the sc parameter
+INDEED_WORK_TYPE_ATTRS = {"remote": "DSQF7", "hybrid": "PAXZC"}
+
+# Locations that mean "search remote jobs" rather than a place
+REMOTE_LOCATIONS = ("remote", "work from home", "wfh", "anywhere")
+
+# fromage values (days since posting) Indeed offers
+INDEED_FROMAGE_DAYS = (1, 3, 7, 14, 30)
+
+
+def is_remote_location(location: str) -> bool:
+    return not location or location.strip().lower() in REMOTE_LOCATIONS
+
+
+def indeed_filter_params(filters: dict, location: str = "") -> dict:
+    """Indeed search parameters for the configured work types, job type, radius and minimum salary.
+
+    A remote location always searches remote jobs. Elsewhere, work_types without
+    "onsite" restrict results to remote and/or hybrid jobs. jt only takes one
+    job type, so it is sent only when a single one is configured. Radius only
+    applies to a place.
+    """
+    params = {}
+    remote = is_remote_location(location)
+
+    work_types = {_normalize(value) for value in filters.get("work_types", DEFAULT_FILTERS["work_types"]) or []}
+    if remote:
+        attrs = [INDEED_WORK_TYPE_ATTRS["remote"]]
+    elif work_types and "onsite" not in work_types:
+        attrs = [INDEED_WORK_TYPE_ATTRS[value] for value in sorted(work_types) if value in INDEED_WORK_TYPE_ATTRS]
+    else:
+        attrs = []
+    if len(attrs) == 1:
+        params["sc"] = f"0kf:attr({attrs[0]});"
+    elif attrs:
+        params["sc"] = f"0kf:attr({'|'.join(attrs)},OR);"
+
+    job_types = {
+        INDEED_JOB_TYPES[_normalize(value)] for value in filters.get("job_types", DEFAULT_FILTERS["job_types"]) or []
+        if _normalize(value) in INDEED_JOB_TYPES
+    }
+    if len(job_types) == 1:
+        params["jt"] = job_types.pop()
+
+    radius = int(filters.get("indeed_radius", DEFAULT_FILTERS["indeed_radius"]) or 0)
+    if radius and not remote:
+        params["radius"] = radius
+
+    # Indeed's salary filter also uses its own estimates for postings that state no pay
+    min_salary = int(float(filters.get("min_salary", DEFAULT_FILTERS["min_salary"]) or 0))
+    if min_salary > 0:
+        params["salaryType"] = f"${min_salary:,}"
+
+    return params
+
+
+def build_indeed_search_url(query: str, location: str = "", fromage: str = "", filter_params: dict | None = None,
+                            start: int = 0) -> str:
+    """Search URL for one page of results. `filter_params` from indeed_filter_params for the same location."""
+    params = {"q": query, "l": "" if is_remote_location(location) else location}
+    if fromage:
+        params["fromage"] = fromage
+    params.update(filter_params or {})
+    if start:
+        params["start"] = start
+    return f"{INDEED_SEARCH_URL}?{urlencode(params)}"
@@ -0,0 +1,119 @@
+"""Selector statistics - learn which fallback selector works on each site and try it first"""
+
+import json
+import sys
+from datetime import datetime
+from pathlib import Path
+
+DATA_DIR = Path(__file__).parent
+SELECTOR_STATS_FILE = DATA_DIR / "selector_stats.json"
+
+# A group whose last few lookups all missed has probably been broken by a redesign
+BROKEN_AFTER_FAILURES = 3
+
+
+def load_selector_stats(stats_file: Path = SELECTOR_STATS_FILE) -> dict:
+    """Load {site: {group: stats}} from selector_stats.json."""
+    if stats_file.exists():
+        try:
+            return json.loads(stats_file.read_text())
+        except json.JSONDecodeError:
+            pass
+    return {}
+
+
+class SelectorRegistry:
+    """Hit/miss counts per site and selector group, used to reorder fallback lists.
+
+    A lookup tries selectors in order, so every selector before the one that
+    matched counts as a miss. The last selector that matched goes first next time.
+    """
+
+    def __init__(self, stats_file: Path = SELECTOR_STATS_FILE):
+        self.stats_file = stats_file
+        self.stats = load_selector_stats(stats_file)
+        self._touched = set()
+
+    def _group(self, site: str, group: str) -> dict:
+        return self.stats.setdefault(site, {}).setdefault(group, {
+            "lookups": 0,
+            "failures": 0,
+            "consecutive_failures": 0,
+            "last_hit": None,
+            "last_hit_at": None,
+            "selectors": {},
+        })
+
+    def order(self, site: str, group: str, selectors: list) -> list:
+        """The selectors with the group's last successful one moved to the front."""
+        last_hit = self.stats.get(site, {}).get(group, {}).get("last_hit")
+        if last_hit not in selectors:
+            return list(selectors)
+        return [last_hit] + [s for s in selectors if s != last_hit]
+
+    def record(self, site: str, group: str, tried: list, hit: str | None):
+        """Record one lookup over `tried` (in the order attempted); `hit` is None if nothing matched."""
+        stats = self._group(site, group)
+        stats["lookups"] += 1
+        for selector in tried:
+            counts = stats["selectors"].setdefault(selector, {"hits": 0, "misses": 0})
+            if selector == hit:
+                counts["hits"] += 1
+                break
+            counts["misses"] += 1
+
+        if hit is None:
+            stats["failures"] += 1
+            stats["consecutive_failures"] += 1
+        else:
+            stats["last_hit"] = hit
+            stats["last_hit_at"] = datetime.now().isoformat()
+            stats["consecutive_failures"] = 0
+        self._touched.add((site, group))
+
+    def save(self):
+        """Write the groups recorded in this run, keeping groups other processes wrote meanwhile."""
+        if not self._touched:
+            return
+        stats = load_selector_stats(self.stats_file)
+        for site, group in self._touched:
+            stats.setdefault(site, {})[group] = self.stats[site][group]
+        self.stats_file.write_text(json.dumps(stats, indent=2))
+        self._touched.clear()
+
+
+def format_report(stats: dict) -> list[str]:
+    """Per-group hit rates, the selector currently tried first, and a warning for groups that stopped matching."""
+    lines = []
+    for site in sorted(stats):
+        lines.append(site)
+        for group, group_stats in sorted(stats[site].items()):
+            lookups = group_stats["lookups"]
+            hit_rate = (lookups - group_stats["failures"]) / lookups if lookups else 0
+            failures = group_stats["consecutive_failures"]
+            warning = f"  ⚠ no match in last {failures} lookups" if failures >= BROKEN_AFTER_FAILURES else ""
+            first = "(card itself)" if group_stats["last_hit"] == "" else group_stats["last_hit"] or "-"
+            when = (group_stats["last_hit_at"] or "never")[:16]
+            lines.append(f"  {group}: {hit_rate:.0%} of {lookups} lookups matched, "
+                         f"first: {first} (last hit {when}){warning}")
+            for selector, counts in sorted(group_stats["selectors"].items(), key=lambda x: -x[1]["hits"]):
+                lines.append(f"      {counts['hits']:>5} hits {counts['misses']:>5} misses  {selector or '(card itself)'}")
+    return lines
+
+
+if __name__ == "__main__":
+    # python selector_stats.py [site]   - show stats
+    # python selector_stats.py --reset [site]  - forget stats (all sites, or one)
+    args = sys.argv[1:]
+    stats = load_selector_stats()
+    if args and args[0] == "--reset":
+        if args[1:]:
+            stats.pop(args[1], None)
+        else:
+            stats = {}
+        SELECTOR_STATS_FILE.write_text(json.dumps(stats, indent=2))
+        print("Selector stats reset")
+    else:
+        if args:
+            stats = {site: groups for site, groups in stats.items() if site in args}
+        print("\n".join(format_report(stats)) or "No selector stats recorded yet")
@@ -0,0 +1,83 @@
+"""Persistent LinkedIn session - reuse saved login cookies across runs"""
+
+import json
+import os
+import time
+from pathlib import Path
+from playwright.async_api import Browser, BrowserContext
+
+DATA_DIR = Path(__file__).parent
+SESSION_FILE = DATA_DIR / "linkedin_session.json"
+
+# LinkedIn's auth cookie; without it the session is certainly logged out
+AUTH_COOKIE = "li_at"
+
+# Treat sessions expiring within this window as already expired (seconds)
+EXPIRY_MARGIN = 3600
+
+
+def saved_session_usable(session_file: Path = SESSION_FILE) -> bool:
+    """Check the saved storage state for an unexpired auth cookie, without touching the network."""
+    if not session_file.exists():
+        return False
+    try:
+        state = json.loads(session_file.read_text())
+    except (json.JSONDecodeError, OSError):
+        return False
+    for cookie in state.get("cookies", []):
+        if cookie.get("name") == AUTH_COOKIE and "linkedin.com" in cookie.get("domain", ""):
+            expires = cookie.get("expires", -1)
+            # -1 means a session cookie, which Playwright still restores
+            return expires == -1 or expires > time.time() + EXPIRY_MARGIN
+    return False
+
+
+async def is_logged_in(context: BrowserContext) -> bool:
+    """Cheap server-side check: one API request instead of loading the feed."""
+    cookies = await context.cookies("https://www.linkedin.com")
+    csrf = next((c["value"].strip('"') for c in cookies if c["name"] == "JSESSIONID"), "")
+    if not csrf:
+        return False
+    try:
+        response = await context.request.get(
+            "https://www.linkedin.com/voyager/api/me",
+            headers={"csrf-token": csrf, "x-restli-protocol-version": "2.0.0"},
+            max_redirects=0,
+            timeout=15000,
+        )
+        return response.status == 200
+    except Exception:
+        return False
+
+
+async def save_session(context: BrowserContext, session_file: Path = SESSION_FILE):
+    """Write the context's cookies and local storage so the next run can skip login."""
+    await context.storage_state(path=str(session_file))
+    os.chmod(session_file, 0o600)  # Holds auth cookies
+
+
+async def open_linkedin_context(browser: Browser, email: str, password: str, login,
+                                session_file: Path = SESSION_FILE, **context_options) -> BrowserContext | None:
+    """Return a logged-in context, reusing the saved session when it is still valid.
+
+    `login` is an async (page, email, password) -> bool function; it only runs
+    when there is no saved session or the saved one has expired.
+    """
+    if saved_session_usable(session_file):
+        context = await browser.new_context(storage_state=str(session_file), **context_options)
+        if await is_logged_in(context):
+            print("✓ Reusing saved LinkedIn session")
+            return context
+        print("Saved LinkedIn session expired, logging in again...")
+        await context.close()
+
+    context = await browser.new_context(**context_options)
+    page = await context.new_page()
+    logged_in = await login(page, email, password)
+    await page.close()
+    if not logged_in:
+        await context.close()
+        return None
+
+    await save_session(context, session_file)
+    return context
@@ -0,0 +1,50 @@
+"""Job source interface - one plugin per job board, driven by runner.py"""
+
+from abc import ABC, abstractmethod
+from playwright.async_api import Browser
+
+
+class Source(ABC):
+    """A job board the runner can search.
+
+    The runner opens every enabled source on one shared browser, runs their
+    searches concurrently, then deduplicates, filters, merges and notifies once
+    for all of them. A plugin only has to know its own site; it must implement
+    search() and job_id(), or it can't be instantiated.
+    """
+
+    # Key in filters.json "sources", crawl_state.json and the job records' "source"
+    name = ""
+
+    def needs_browser(self, filters: dict) -> bool:
+        """Whether open() needs a Chromium instance (a browserless source can skip the launch)."""
+        return True
+
+    async def open(self, browser: Browser | None, config: dict, filters: dict) -> bool:
+        """Prepare contexts, sessions or clients. False if the source can't run (e.g. login failed)."""
+        return True
+
+    def known_keys(self, seen_jobs: dict) -> set:
+        """Site keys (view ids, job keys) of jobs already stored in seen_jobs.json."""
+        return set()
+
+    @abstractmethod
+    async def search(self, filters: dict, seen_keys: set) -> list[dict]:
+        """Run every configured search and return job dicts.
+
+        Jobs whose site key is in `seen_keys` should be skipped before any
+        detail work. Keys of jobs built (or rejected on card fields) during the
+        run are added to it; the runner records them in crawl_state.json, so a
+        job whose details failed to load must not be left in it.
+        """
+
+    async def extract(self, jobs: dict, filters: dict) -> dict:
+        """Narrow or enrich this source's deduplicated {job_id: job} before the shared filters run."""
+        return jobs
+
+    @abstractmethod
+    def job_id(self, job: dict) -> str:
+        """Stable id of a job record within this source."""
+
+    async def close(self):
+        """Release whatever open() created."""
@@ -0,0 +1,48 @@
+from fingerprint import build_fingerprint_index, job_fingerprint, merge_job, normalize_location
+
+
+def job(location, title="Director, Data Science", company="Acme Inc."):
+    return {"title": title, "company": company, "location": location, "url": f"https://example.com/{location}"}
+
+
+def test_fully_remote_locations_normalize_to_remote():
+    assert normalize_location("Remote") == "remote"
+    assert normalize_location("United States (Remote)") == "remote"
+    assert normalize_location("Remote, US") == "remote"
+    assert normalize_location("Work from home") == "remote"
+
+
+def test_remote_in_prefixes_keep_the_city():
+    assert normalize_location("Remote in Denver, CO") == "denver"
+    assert normalize_location("Hybrid remote in Atlanta, GA") == "atlanta"
+    assert normalize_location("Hybrid remote in Atlanta, GA 30301") == normalize_location("Atlanta, GA (Hybrid)")
+    assert normalize_location("Atlanta, Georgia, United States") == "atlanta"
+
+
+def test_missing_location_is_unknown():
+    assert normalize_location("") is None
+    assert normalize_location(None) is None
+    assert job_fingerprint(job("")) is None
+
+
+def test_hybrid_jobs_in_different_cities_stay_separate():
+    jobs, index = {}, {}
+    assert merge_job(jobs, index, "a", job("Hybrid remote in Atlanta, GA"), "indeed")
+    assert merge_job(jobs, index, "b", job("Remote in Denver, CO"), "indeed")
+    assert set(jobs) == {"a", "b"}
+
+
+def test_same_hybrid_job_merges_across_boards():
+    jobs, index = {}, {}
+    assert merge_job(jobs, index, "li", job("Atlanta, GA (Hybrid)"), "linkedin")
+    assert not merge_job(jobs, index, "in", job("Hybrid remote in Atlanta, GA"), "indeed")
+    assert set(jobs["li"]["sources"]) == {"linkedin", "indeed"}
+
+
+def test_jobs_without_location_are_not_merged():
+    jobs, index = {}, {}
+    assert merge_job(jobs, index, "a", job(""), "indeed")
+    assert merge_job(jobs, index, "b", job(""), "linkedin")
+    assert merge_job(jobs, index, "c", job("Remote"), "linkedin")
+    assert set(jobs) == {"a", "b", "c"}
+    assert list(build_fingerprint_index(jobs).values()) == ["c"]
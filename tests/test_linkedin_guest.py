@@ -0,0 +1,159 @@
+"""GuestClient and the guest search against recorded fragments served from localhost"""
+
+import asyncio
+import gzip
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import parse_qs, urlsplit
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from linkedin_guest import POSTING_PATH, SEARCH_PATH, GuestClient, fetch_job_description, parse_job_cards
+from matching import JobFilters
+from scraper import new_pipeline_stats, search_guest_jobs
+from throttle import DomainThrottle
+
+FIXTURES = Path(__file__).parent / "fixtures" / "linkedin_guest"
+PAGES = ["search_page1.html", "search_page2.html"]
+PAGE_SIZE = 3  # Cards in search_page1.html
+
+
+class GuestHandler(BaseHTTPRequestHandler):
+    """Serves the fixtures like LinkedIn's guest endpoints, with keep-alive and gzip."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):
+        server = self.server
+        server.requests.append(self.path)
+        parts = urlsplit(self.path)
+        if server.block_after is not None and len(server.requests) > server.block_after:
+            return self.reply(429, b"")
+        if parts.path == SEARCH_PATH:
+            start = int(parse_qs(parts.query).get("start", ["0"])[0])
+            page = start // PAGE_SIZE
+            body = (FIXTURES / PAGES[page]).read_bytes() if page < len(PAGES) else b""
+            return self.reply(200, body)
+        if parts.path.startswith(POSTING_PATH.format(job_id="")):
+            job_id = parts.path.rsplit("/", 1)[1]
+            if job_id in server.missing_postings:
+                return self.reply(404, b"")
+            return self.reply(200, gzip.compress((FIXTURES / "posting.html").read_bytes()), gzipped=True)
+        self.reply(404, b"")
+
+    def reply(self, status, body, gzipped=False):
+        self.send_response(status)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), GuestHandler)
+    httpd.requests = []
+    httpd.block_after = None
+    httpd.missing_postings = set()
+    thread = threading.Thread(target=httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True)
+    thread.start()
+    yield httpd
+    httpd.shutdown()
+    httpd.server_close()
+
+
+def client_for(server, throttle=None):
+    return GuestClient(f"http://127.0.0.1:{server.server_address[1]}", pool_size=2, timeout=5, throttle=throttle)
+
+
+def fast_throttle():
+    return DomainThrottle(max_concurrent=2, min_interval=0.001, max_rate=1000)
+
+
+async def run_search(client, **options):
+    try:
+        return await search_guest_jobs(client, "data science", **options)
+    finally:
+        await client.close()
+
+
+def test_parse_recorded_fragments():
+    cards = parse_job_cards((FIXTURES / "search_page1.html").read_text())
+    assert [card["job_id"] for card in cards] == ["3901234501", "3901234502", "3901234503"]
+    assert cards[0]["title"] == "Director, Data Science"
+    assert cards[0]["company"] == "Acme Analytics"
+    assert cards[2]["location"] == "Atlanta, GA (Hybrid)"
+    assert cards[0]["url"].startswith("https://www.linkedin.com/jobs/view/director-data-science")
+
+
+def test_client_fetches_gzipped_posting(server):
+    async def fetch():
+        client = client_for(server)
+        try:
+            return await fetch_job_description(client, "3901234501")
+        finally:
+            await client.close()
+
+    description = asyncio.run(fetch())
+    assert description.startswith("About the role\nWe are looking for a leader")
+    assert "Hire and mentor data scientists" in description
+    assert "Seniority level" not in description
+
+
+def test_search_pages_through_results(server):
+    finished = set()
+    jobs = asyncio.run(run_search(client_for(server, fast_throttle()), max_pages=5, finished=finished))
+
+    assert [job["url"] for job in jobs] == [
+        f"https://www.linkedin.com/jobs/view/{job_id}/" for job_id in
+        ("3901234501", "3901234502", "3901234503", "3901234504", "3901234505")
+    ]
+    assert all("data science team" in job["description"] for job in jobs)
+    assert jobs[0]["salary"]["max"] == 220000
+    # Paging advances by the cards actually returned and stops at the empty page
+    starts = [parse_qs(urlsplit(path).query).get("start", ["0"])[0]
+              for path in server.requests if path.startswith(SEARCH_PATH)]
+    assert starts == ["0", "3", "5"]
+    assert finished == {"data science"}
+
+
+def test_search_prefilters_cards_before_fetching_postings(server):
+    stats = new_pipeline_stats()
+    job_filters = JobFilters(["remote", "atlanta"], ["contract"])
+    jobs = asyncio.run(run_search(client_for(server), max_pages=5, job_filters=job_filters, stats=stats))
+
+    assert {job["title"] for job in jobs} == {"Director, Data Science", "Head of Machine Learning", "VP, Data Science"}
+    assert stats["title_rejected"] == 1     # "(Contract)"
+    assert stats["location_rejected"] == 1  # On-site in New York
+    assert len([path for path in server.requests if not path.startswith(SEARCH_PATH)]) == 3
+
+
+def test_blocked_search_stops_and_stays_unfinished(server):
+    # First page and its three postings succeed, then every request is throttled
+    server.block_after = 4
+    throttle = fast_throttle()
+    finished, seen_ids = set(), set()
+    jobs = asyncio.run(run_search(client_for(server, throttle), max_pages=5, finished=finished, seen_ids=seen_ids))
+
+    assert len(jobs) == 3
+    assert len(server.requests) == 5
+    assert finished == set()
+    assert seen_ids == {"3901234501", "3901234502", "3901234503"}
+    assert "1 throttled" in throttle.summary()
+
+
+def test_missing_posting_is_retried_next_run(server):
+    server.missing_postings = {"3901234502"}
+    finished, seen_ids = set(), set()
+    asyncio.run(run_search(client_for(server), max_pages=1, finished=finished, seen_ids=seen_ids))
+
+    assert seen_ids == {"3901234501", "3901234503"}
+    assert finished == set()
@@ -0,0 +1,37 @@
+from salary import annual_amount, parse_salary, salary_passes
+
+
+def test_annually_and_annual_are_yearly():
+    salary = parse_salary("$85,000 annually")
+    assert (salary["min"], salary["max"], salary["period"]) == (85000, 85000, "year")
+    salary = parse_salary("$150,000 annual base")
+    assert (salary["min"], salary["period"]) == (150000, "year")
+
+
+def test_period_prefixes():
+    assert parse_salary("$60 an hour")["period"] == "hour"
+    assert parse_salary("$5,000 a month")["period"] == "month"
+    assert parse_salary("$45 per hour")["period"] == "hour"
+    assert parse_salary("$120K/yr")["period"] == "year"
+    assert parse_salary("$120K / year")["period"] == "year"
+
+
+def test_ranges_and_multipliers():
+    salary = parse_salary("Pay: $150-200K")
+    assert (salary["min"], salary["max"], salary["period"]) == (150000, 200000, "year")
+
+
+def test_lone_amounts_need_pay_context():
+    assert parse_salary("Includes a $500 stipend for home office equipment") is None
+    assert parse_salary("Base salary of $180,000 plus equity")["min"] == 180000
+    assert parse_salary("$180,000", pay_field=True)["period"] == "year"
+
+
+def test_largest_yearly_figure_wins():
+    salary = parse_salary("$500 stipend per month. Salary: $140,000 - $160,000 per year")
+    assert annual_amount(salary) == 160000
+
+
+def test_annual_salary_reaches_the_filters():
+    assert not salary_passes(parse_salary("$85,000 annually"), min_salary=100000)
+    assert not salary_passes(parse_salary("$40 hourly"), exclude_hourly=True)
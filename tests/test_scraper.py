@@ -0,0 +1,50 @@
+import asyncio
+
+import pytest
+
+pytest.importorskip("playwright")
+
+from linkedin_guest import POSTING_PATH, SEARCH_PATH
+from scraper import search_guest_jobs
+
+
+def card_html(job_id, title):
+    return (f'<li><div class="base-card" data-entity-urn="urn:li:jobPosting:{job_id}">'
+            f'<a class="base-card__full-link" href="/jobs/view/{job_id}/"></a>'
+            f'<h3 class="base-search-card__title">{title}</h3>'
+            f'<h4 class="base-search-card__subtitle">Acme</h4>'
+            f'<span class="job-search-card__location">Remote</span></div></li>')
+
+
+class FakeClient:
+    """GuestClient stand-in: one page of results and a posting response per job id."""
+
+    def __init__(self, cards, postings):
+        self.cards = cards
+        self.postings = postings
+
+    async def get(self, path):
+        if path.startswith(SEARCH_PATH):
+            return 200, "".join(card_html(job_id, title) for job_id, title in self.cards)
+        for job_id, status in self.postings.items():
+            if path == POSTING_PATH.format(job_id=job_id):
+                return status, '<div class="description__text">Lead the data science team.</div>'
+        return 404, ""
+
+
+def test_query_finishes_when_every_posting_loads():
+    client = FakeClient([("1", "Director, Data Science"), ("2", "Head of Analytics")], {"1": 200, "2": 200})
+    seen_ids, finished = set(), set()
+    jobs = asyncio.run(search_guest_jobs(client, "data science", seen_ids=seen_ids, finished=finished))
+    assert len(jobs) == 2
+    assert seen_ids == {"1", "2"}
+    assert finished == {"data science"}
+
+
+def test_failed_posting_keeps_the_query_unfinished():
+    client = FakeClient([("1", "Director, Data Science"), ("2", "Head of Analytics")], {"1": 200, "2": 500})
+    seen_ids, finished = set(), set()
+    asyncio.run(search_guest_jobs(client, "data science", seen_ids=seen_ids, finished=finished))
+    # The failed job is retried next run, over the same time window
+    assert seen_ids == {"1"}
+    assert finished == set()
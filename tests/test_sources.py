@@ -0,0 +1,24 @@
+import pytest
+
+pytest.importorskip("playwright")
+
+from sources import Source
+
+
+def test_incomplete_plugin_fails_at_creation():
+    class NoJobId(Source):
+        name = "board"
+
+        async def search(self, filters, seen_keys):
+            return []
+
+    with pytest.raises(TypeError):
+        NoJobId()
+
+
+def test_builtin_sources_implement_the_interface():
+    from indeed_scraper import IndeedSource
+    from scraper import LinkedInSource
+
+    assert LinkedInSource().name == "linkedin"
+    assert IndeedSource().name == "indeed"
@@ -0,0 +1,44 @@
+import pytest
+
+pytest.importorskip("playwright")
+
+from throttle import DomainThrottle, RequestOutcome
+
+
+def healthy():
+    outcome = RequestOutcome()
+    outcome.record(200)
+    return outcome
+
+
+def test_fast_api_calls_do_not_make_page_loads_look_slow():
+    throttle = DomainThrottle(max_rate=4.0, min_interval=1.0)
+    state = throttle._state("linkedin.com")
+    rates = [state.rate]
+    for _ in range(5):
+        for _ in range(4):
+            throttle._adapt(state, healthy(), 0.05, "api")
+        throttle._adapt(state, healthy(), 2.0, "page")
+        rates.append(state.rate)
+    assert rates == sorted(rates)
+    assert rates[-1] > rates[0]
+
+
+def test_slow_response_of_the_same_kind_lowers_the_rate():
+    throttle = DomainThrottle(max_rate=4.0, min_interval=1.0)
+    state = throttle._state("linkedin.com")
+    for _ in range(4):
+        throttle._adapt(state, healthy(), 0.05, "api")
+    before = state.rate
+    throttle._adapt(state, healthy(), 2.0, "api")
+    assert state.rate < before
+
+
+def test_throttled_response_backs_off():
+    throttle = DomainThrottle(max_rate=4.0, min_interval=1.0)
+    state = throttle._state("linkedin.com")
+    outcome = RequestOutcome()
+    outcome.record(429)
+    throttle._adapt(state, outcome, 0.05, "api")
+    assert state.rate == 0.5
+    assert state.throttled == 1
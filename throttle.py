@@ -0,0 +1,192 @@
+"""Per-domain politeness limits - adaptive token buckets with backoff and jitter"""
+
+import asyncio
+import random
+import time
+from contextlib import asynccontextmanager
+from urllib.parse import urlsplit
+from playwright.async_api import Page, Response
+
+from common import DEFAULT_FILTERS
+
+# Defaults per domain: requests in flight at once, and the starting gap between requests
+DEFAULT_MAX_CONCURRENT = 2
+DEFAULT_MIN_INTERVAL = 1.0
+
+# Request rate bounds (requests/second). The rate climbs toward the ceiling while
+# the site stays fast and error-free, and drops on slow responses or throttling.
+DEFAULT_MAX_RATE = 4.0
+MIN_RATE = 0.05
+RATE_STEP = 0.1        # Additive increase per healthy response
+SLOWDOWN_FACTOR = 0.8  # Multiplicative decrease when responses get slow
+THROTTLED_FACTOR = 0.5 # Multiplicative decrease on a throttling signal
+BURST = 2              # Tokens a quiet domain can bank
+
+# A response this many times slower than the running average for its kind of request
+# counts as the site straining
+SLOW_RESPONSE_RATIO = 2.0
+LATENCY_SMOOTHING = 0.2
+
+# Backoff after throttling: base * 2^strikes seconds, +/- jitter, capped
+BACKOFF_BASE = 5.0
+BACKOFF_MAX = 300.0
+JITTER = 0.5
+
+# Status codes and URL fragments that mean "slow down" (999 is LinkedIn's)
+THROTTLE_STATUSES = {403, 429, 503, 999}
+CHALLENGE_MARKERS = ("checkpoint/challenge", "/authwall", "captcha", "/cdn-cgi/challenge")
+
+
+def is_throttled(status: int | None, url: str = "") -> bool:
+    """Whether a response status or landing URL says the site wants us to slow down."""
+    return status in THROTTLE_STATUSES or any(marker in (url or "") for marker in CHALLENGE_MARKERS)
+
+
+class _DomainState:
+    def __init__(self, rate: float, max_concurrent: int):
+        self.rate = rate
+        self.tokens = 1.0
+        self.refilled_at = time.monotonic()
+        self.blocked_until = 0.0
+        self.strikes = 0
+        self.latency = {}  # Request kind -> running average; an API call is no baseline for a page load
+        self.requests = 0
+        self.throttled = 0
+        self.slots = asyncio.Semaphore(max_concurrent)
+        self.lock = asyncio.Lock()
+
+
+class RequestOutcome:
+    """Handed out by DomainThrottle.slot; report the response so the limiter can adapt."""
+
+    def __init__(self):
+        self.status = None
+        self.url = ""
+        self.failed = False
+
+    def record(self, status: int | None = None, url: str = ""):
+        self.status = status
+        self.url = url or ""
+
+
+class DomainThrottle:
+    """Adaptive token bucket per domain.
+
+    Starts at one request per `min_interval` seconds, never exceeds
+    `max_concurrent` requests in flight or `max_rate` requests/second, and
+    adjusts in between: additive increase while responses are fast and clean,
+    multiplicative decrease when they slow down, and a jittered exponential
+    pause on 429/999/403/503 responses or challenge pages.
+    """
+
+    def __init__(self, max_concurrent: int = DEFAULT_MAX_CONCURRENT, min_interval: float = DEFAULT_MIN_INTERVAL,
+                 max_rate: float = DEFAULT_MAX_RATE):
+        self.max_concurrent = max_concurrent
+        self.max_rate = max(max_rate, MIN_RATE)
+        self.start_rate = min(1 / min_interval if min_interval > 0 else self.max_rate, self.max_rate)
+        self._domains = {}
+
+    @staticmethod
+    def domain(url: str) -> str:
+        host = urlsplit(url).hostname or ""
+        # www.indeed.com and indeed.com share one budget
+        return host[4:] if host.startswith("www.") else host
+
+    def _state(self, domain: str) -> _DomainState:
+        if domain not in self._domains:
+            self._domains[domain] = _DomainState(self.start_rate, self.max_concurrent)
+        return self._domains[domain]
+
+    async def _take_token(self, state: _DomainState):
+        async with state.lock:
+            while True:
+                now = time.monotonic()
+                if now < state.blocked_until:
+                    await asyncio.sleep(state.blocked_until - now)
+                    continue
+                state.tokens = min(BURST, state.tokens + (now - state.refilled_at) * state.rate)
+                state.refilled_at = now
+                if state.tokens >= 1:
+                    state.tokens -= 1
+                    return
+                # Small jitter keeps concurrent workers from hitting the site in lockstep
+                wait = (1 - state.tokens) / state.rate
+                await asyncio.sleep(wait * random.uniform(1, 1 + JITTER / 2))
+
+    def _adapt(self, state: _DomainState, outcome: RequestOutcome, latency: float, kind: str = "page"):
+        state.requests += 1
+        if is_throttled(outcome.status, outcome.url):
+            state.throttled += 1
+            state.strikes += 1
+            state.rate = max(MIN_RATE, state.rate * THROTTLED_FACTOR)
+            backoff = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** (state.strikes - 1))
+            backoff *= random.uniform(1 - JITTER, 1 + JITTER)
+            state.blocked_until = max(state.blocked_until, time.monotonic() + backoff)
+            state.tokens = 0
+            return
+
+        if outcome.failed:
+            state.rate = max(MIN_RATE, state.rate * SLOWDOWN_FACTOR)
+            return
+
+        average = state.latency.get(kind)
+        slow = average is not None and latency > average * SLOW_RESPONSE_RATIO
+        state.latency[kind] = latency if average is None else (
+            (1 - LATENCY_SMOOTHING) * average + LATENCY_SMOOTHING * latency)
+        if slow:
+            state.rate = max(MIN_RATE, state.rate * SLOWDOWN_FACTOR)
+        else:
+            state.rate = min(self.max_rate, state.rate + RATE_STEP)
+            state.strikes = max(0, state.strikes - 1)
+
+    @asynccontextmanager
+    async def slot(self, url: str, kind: str = "page"):
+        """Wait for a request slot and token for the URL's domain.
+
+        Yields a RequestOutcome; call its record() with the response status
+        (and final URL) so the rate can adapt. An exception inside the block
+        counts as a failed request; a cancelled one says nothing about the site.
+
+        `kind` names the sort of request ("page" for navigations, "api" for
+        JSON calls, "fetch" for unrendered HTML): all kinds share the domain's
+        rate, but each is only compared with the latency of its own kind.
+        """
+        state = self._state(self.domain(url))
+        outcome = RequestOutcome()
+        async with state.slots:
+            await self._take_token(state)
+            started = time.monotonic()
+            try:
+                yield outcome
+            except Exception:
+                outcome.failed = True
+                self._adapt(state, outcome, time.monotonic() - started, kind)
+                raise
+            self._adapt(state, outcome, time.monotonic() - started, kind)
+
+    def summary(self) -> str:
+        """Current rate and throttling count per domain, for the run log."""
+        return " | ".join(
+            f"{domain}: {state.rate:.2f} req/s, {state.requests} requests, {state.throttled} throttled"
+            for domain, state in sorted(self._domains.items())
+        ) or "no requests"
+
+
+def throttle_from_filters(filters: dict, max_concurrent: int) -> DomainThrottle:
+    """A DomainThrottle using the filters.json pacing keys."""
+    return DomainThrottle(
+        max_concurrent=max_concurrent,
+        min_interval=float(filters.get("min_request_interval_seconds", DEFAULT_FILTERS["min_request_interval_seconds"])),
+        max_rate=float(filters.get("max_requests_per_second", DEFAULT_FILTERS["max_requests_per_second"])),
+    )
+
+
+async def navigate(page: Page, url: str, throttle: "DomainThrottle | None" = None,
+                   timeout: float = 60000) -> Response | None:
+    """page.goto through the throttle, reporting the status and landing URL back to it."""
+    if throttle is None:
+        return await page.goto(url, timeout=timeout)
+    async with throttle.slot(url) as outcome:
+        response = await page.goto(url, timeout=timeout)
+        outcome.record(response.status if response else None, page.url)
+    return response